@@ -66,6 +66,7 @@ from manimlib.mobject.vector_field import *
 
 from manimlib.scene.interactive_scene import *
 from manimlib.scene.scene import *
+from manimlib.scene.scene_checkpoint import *
 
 from manimlib.utils.bezier import *
 from manimlib.utils.cache import *
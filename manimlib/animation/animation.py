@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from copy import deepcopy
 
+import numpy as np
+
 from manimlib.mobject.mobject import _AnimationBuilder
 from manimlib.mobject.mobject import Mobject
 from manimlib.utils.iterables import remove_list_redundancies
@@ -181,6 +183,25 @@ class Animation(object):
         raw_sub_alpha = clip((value - lower), 0, 1)
         return self.rate_func(raw_sub_alpha)
 
+    def get_sub_alphas(self, alpha: float, num_submobjects: int) -> np.ndarray:
+        """
+        The values of get_sub_alpha for all indices, calling the rate
+        function only once per distinct value
+        """
+        if type(self).get_sub_alpha is not Animation.get_sub_alpha:
+            return np.array([
+                self.get_sub_alpha(alpha, i, num_submobjects)
+                for i in range(num_submobjects)
+            ], dtype=float)
+        lag_ratio = self.lag_ratio
+        full_length = (num_submobjects - 1) * lag_ratio + 1
+        value = alpha * full_length
+        lower = np.arange(num_submobjects) * lag_ratio
+        raw_sub_alphas = np.clip(value - lower, 0, 1)
+        uniques, inverse = np.unique(raw_sub_alphas, return_inverse=True)
+        values = np.array([self.rate_func(x) for x in uniques.tolist()], dtype=float)
+        return values[inverse]
+
     # Getters and setters
     def set_run_time(self, run_time: float):
         self.run_time = run_time
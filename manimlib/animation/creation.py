@@ -5,9 +5,14 @@ from abc import ABC, abstractmethod
 import numpy as np
 
 from manimlib.animation.animation import Animation
+from manimlib.animation.transform import InterpolationBatch
+from manimlib.animation.transform import get_scalar_dtype
+from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.svg.string_mobject import StringMobject
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.bezier import integer_interpolate
+from manimlib.utils.bezier import integer_interpolate_array
+from manimlib.utils.bezier import partial_quadratic_bezier_curves
 from manimlib.utils.rate_functions import linear
 from manimlib.utils.rate_functions import double_smooth
 from manimlib.utils.rate_functions import smooth
@@ -17,7 +22,6 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Callable
-    from manimlib.mobject.mobject import Mobject
     from manimlib.scene.scene import Scene
     from manimlib.typing import ManimColor
 
@@ -28,8 +32,64 @@ class ShowPartial(Animation, ABC):
     """
     def __init__(self, mobject: Mobject, should_match_start: bool = False, **kwargs):
         self.should_match_start = should_match_start
+        self.partial_batches: list[PartialBatch] = []
         super().__init__(mobject, **kwargs)
 
+    def begin(self) -> None:
+        super().begin()
+        self.init_partial_batches()
+
+    def finish(self) -> None:
+        super().finish()
+        for batch in self.partial_batches:
+            batch.release()
+        self.partial_batches = []
+
+    def init_partial_batches(self) -> None:
+        """
+        Submobjects which are VMobjects are grouped by their type of data,
+        so that each frame takes a few array operations per group, rather
+        than a call to pointwise_become_partial per submobject
+        """
+        self.partial_batches = []
+        if type(self).interpolate_submobject is not ShowPartial.interpolate_submobject:
+            return
+        if type(self).interpolate_mobject is not ShowPartial.interpolate_mobject:
+            return
+        if self.mobject.has_updaters() or self.starting_mobject.has_updaters():
+            return
+        self.partial_batches = get_partial_batches([
+            (submob, start, start)
+            for submob, start in self.families
+        ])
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        if not self.partial_batches:
+            super().interpolate_mobject(alpha)
+            return
+
+        n_families = len(self.families)
+        alpha = self.time_spanned_alpha(alpha)
+        sub_alphas = self.get_sub_alphas(alpha, n_families)
+        uniques, inverse = np.unique(sub_alphas, return_inverse=True)
+        bounds = np.array([self.get_bounds(a) for a in uniques.tolist()], dtype=float)[inverse]
+        dtype = get_scalar_dtype(*self.get_bounds(get_partway_sub_alpha(self, alpha, sub_alphas)))
+        is_batched = np.zeros(n_families, dtype=bool)
+        for batch in list(self.partial_batches):
+            if not batch.is_intact():
+                # Something replaced the data of a submobject
+                batch.release()
+                self.partial_batches.remove(batch)
+                continue
+            indices = batch.index_array
+            batch.become_partial(bounds[indices, 0], bounds[indices, 1], dtype=dtype)
+            is_batched[indices] = True
+
+        for i in np.flatnonzero(~is_batched):
+            self.interpolate_submobject(*self.families[i], self.get_sub_alpha(alpha, int(i), n_families))
+        if is_batched.any():
+            self.mobject.note_changed_data()
+
     def interpolate_submobject(
         self,
         submob: Mobject,
@@ -85,6 +145,7 @@ class DrawBorderThenFill(Animation):
     ):
         assert isinstance(vmobject, VMobject)
         self.sm_to_index = {hash(sm): 0 for sm in vmobject.get_family()}
+        self.partial_batches: list[PartialBatch] = []
         self.stroke_width = stroke_width
         self.stroke_color = stroke_color
         self.draw_border_animation_config = draw_border_animation_config
@@ -102,11 +163,74 @@ class DrawBorderThenFill(Animation):
         self.outline = self.get_outline()
         super().begin()
         self.mobject.match_style(self.outline)
+        self.init_partial_batches()
 
     def finish(self) -> None:
         super().finish()
+        for batch in self.partial_batches:
+            batch.release()
+        self.partial_batches = []
         self.mobject.refresh_joint_angles()
 
+    def init_partial_batches(self) -> None:
+        """
+        Submobjects are grouped by their type of data, so that each frame
+        takes a few array operations per group to draw the borders of some
+        and fill others, rather than a call per submobject
+        """
+        self.partial_batches = []
+        if type(self).interpolate_submobject is not DrawBorderThenFill.interpolate_submobject:
+            return
+        if type(self).interpolate_mobject is not DrawBorderThenFill.interpolate_mobject:
+            return
+        if any(mob.has_updaters() for mob in self.get_all_mobjects()):
+            return
+        self.partial_batches = get_partial_batches([
+            (submob, outline, start)
+            for submob, start, outline in self.families
+        ])
+        self.is_filling = np.array([
+            self.sm_to_index[hash(submob)] == 1
+            for submob, start, outline in self.families
+        ])
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        if not self.partial_batches:
+            super().interpolate_mobject(alpha)
+            return
+
+        n_families = len(self.families)
+        alpha = self.time_spanned_alpha(alpha)
+        sub_alphas = self.get_sub_alphas(alpha, n_families)
+        phases, subalphas = integer_interpolate_array(0, 2, sub_alphas)
+        dtype = get_scalar_dtype(get_partway_sub_alpha(self, alpha, sub_alphas))
+        is_batched = np.zeros(n_families, dtype=bool)
+        for batch in list(self.partial_batches):
+            if not batch.is_intact():
+                # Something replaced the data of a submobject
+                batch.release()
+                self.partial_batches.remove(batch)
+                continue
+            drawing = phases[batch.index_array] == 0
+            crossing = batch.index_array[~drawing & ~self.is_filling[batch.index_array]]
+            for i in crossing:
+                # First time crossing over, where interpolate_submobject would
+                # copy in the outline's data, all of which is then interpolated
+                submob = self.families[i][0]
+                submob.refresh_bounding_box()
+                self.sm_to_index[hash(submob)] = 1
+            self.is_filling[crossing] = True
+
+            batch_subalphas = subalphas[batch.index_array]
+            batch.become_partial(np.zeros_like(batch_subalphas), batch_subalphas, drawing, dtype)
+            batch.interpolate_where(batch_subalphas, ~drawing, dtype)
+            is_batched[batch.index_array] = True
+
+        for i in np.flatnonzero(~is_batched):
+            self.interpolate_submobject(*self.families[i], self.get_sub_alpha(alpha, int(i), n_families))
+        if is_batched.any():
+            self.mobject.note_changed_data()
+
     def get_outline(self) -> VMobject:
         outline = self.mobject.copy()
         outline.set_fill(opacity=0)
@@ -242,3 +366,249 @@ class AddTextWordByWord(ShowIncreasingSubsets):
         scene.remove(self.mobject)
         if not self.is_remover():
             scene.add(self.string_mobject)
+
+
+class PartialBatch(InterpolationBatch):
+    """
+    An InterpolationBatch of VMobjects, whose submobjects can also all at
+    once become the parts of their start which pointwise_become_partial
+    would make of them.  Submobjects whose bounds or alpha are unchanged
+    since they were last written here, and whose data has not changed
+    elsewhere since, are left as they are.
+    """
+    def __init__(self, indices: list[int], families: list[tuple[VMobject, VMobject, VMobject]]):
+        super().__init__(indices, families)
+        n_mobs = len(self.mobjects)
+        self.index_array = np.array(indices)
+        self.sources = [(sm1, sm2) for sm, sm1, sm2 in families]
+        ends = np.cumsum(self.lengths)
+        self.offsets = ends - self.lengths
+        self.num_curves = self.lengths // 2
+        # Which submobject each packed point belongs to, and its index there
+        self.owners = np.repeat(np.arange(n_mobs), self.lengths)
+        self.local_indices = np.arange(ends[-1]) - self.offsets[self.owners]
+        # What each submobject was last written with, and its data version
+        # just afterwards
+        self.partial_bounds = np.full((n_mobs, 2), np.nan)
+        self.interpolated_alphas = np.full(n_mobs, np.nan)
+        self.data_versions = np.full(n_mobs, -1)
+        # All submobjects here interpolate the same uniforms
+        self.uniform_keys = get_interpolated_uniform_keys(*families[0])
+        self.start_uniforms = {
+            key: np.array([sm1.uniforms[key] for sm1, sm2 in self.sources], dtype=float)
+            for key in self.uniform_keys
+        }
+        self.target_uniforms = {
+            key: np.array([sm2.uniforms[key] for sm1, sm2 in self.sources], dtype=float)
+            for key in self.uniform_keys
+        }
+
+        # Each mobject above the submobjects, with the indices of those
+        # below it, so its bounding box can be refreshed when they change
+        ancestors = dict()
+        for index, sm in enumerate(self.mobjects):
+            seen = set()
+            to_visit = list(sm.parents)
+            while to_visit:
+                mob = to_visit.pop()
+                if id(mob) in seen:
+                    continue
+                seen.add(id(mob))
+                ancestors.setdefault(id(mob), (mob, []))[1].append(index)
+                to_visit.extend(mob.parents)
+        self.ancestors = [
+            (mob, np.array(indices))
+            for mob, indices in ancestors.values()
+        ]
+
+    def get_data_versions(self) -> np.ndarray:
+        return np.fromiter(
+            (sm._data_version for sm in self.mobjects),
+            dtype=int,
+            count=len(self.mobjects),
+        )
+
+    def get_stale(self, mask: np.ndarray, new_inputs: np.ndarray) -> np.ndarray:
+        """
+        Of the submobjects flagged by mask, those with new inputs, or whose
+        data has changed since it was last written here
+        """
+        return mask & (new_inputs | (self.get_data_versions() != self.data_versions))
+
+    def note_written(self, written: np.ndarray, refresh_bounding_boxes: bool = True) -> None:
+        members = [self.mobjects[i] for i in np.flatnonzero(written)]
+        for sm in members:
+            if refresh_bounding_boxes:
+                sm.refresh_bounding_box(recurse_up=False)
+            sm.note_changed_data(recurse_up=False)
+        for mob, indices in self.ancestors:
+            if written[indices].any():
+                mob.refresh_bounding_box(recurse_up=False)
+        self.data_versions[written] = [sm._data_version for sm in members]
+
+    def become_partial(
+        self,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        mask: np.ndarray | None = None,
+        dtype: np.dtype = np.dtype(float)
+    ) -> None:
+        """
+        Has each submobject flagged by mask, or all of them if mask is None,
+        become the portion of its start between its own lower and upper
+        proportions, as pointwise_become_partial would for scalar bounds
+        computed at the precision of dtype
+        """
+        if mask is None:
+            mask = np.ones(len(self.mobjects), dtype=bool)
+        bounds = np.transpose([lower, upper])
+        written = self.get_stale(mask, (bounds != self.partial_bounds).any(1))
+        if not written.any():
+            return
+        members = np.flatnonzero(written)
+        rows = np.flatnonzero(written[self.owners])
+        owners = self.owners[rows]
+        # Position of each written submobject among those being written
+        positions = np.zeros(len(self.mobjects), dtype=int)
+        positions[members] = np.arange(len(members))
+
+        lower_index, lower_residue = integer_interpolate_array(0, self.num_curves, lower)
+        upper_index, upper_residue = integer_interpolate_array(0, self.num_curves, upper)
+        same = lower_index == upper_index
+        curve_offsets = np.arange(3)
+        start_points = self.start["point"]
+        low_tups = partial_quadratic_bezier_curves(
+            start_points[(self.offsets + 2 * lower_index)[members, np.newaxis] + curve_offsets].astype(dtype),
+            lower_residue[members],
+            np.where(same, upper_residue, 1)[members],
+        )
+        high_tups = partial_quadratic_bezier_curves(
+            start_points[(self.offsets + 2 * upper_index)[members, np.newaxis] + curve_offsets].astype(dtype),
+            np.where(same, lower_residue, 0)[members],
+            upper_residue[members],
+        )
+
+        # Points before the first partial curve collapse onto its start,
+        # and those after the last onto its end
+        k = self.local_indices[rows]
+        i1 = 2 * lower_index[owners]
+        i3 = 2 * upper_index[owners]
+        before = k < i1
+        after = k >= i3 + 3
+        low = ~before & (k < i1 + 3)
+        high = (k >= i3) & ~after
+        tup_indices = positions[owners]
+        new_points = start_points[rows]
+        new_points[before] = low_tups[tup_indices[before], 0]
+        new_points[low] = low_tups[tup_indices[low], (k - i1)[low]]
+        new_points[high] = high_tups[tup_indices[high], (k - i3)[high]]
+        new_points[after] = high_tups[tup_indices[after], 2]
+        joint_angles = self.start["joint_angle"][rows]
+        joint_angles[before | after] = 0
+        self.current["point"][rows] = new_points
+        self.current["joint_angle"][rows] = joint_angles
+
+        self.partial_bounds[written] = bounds[written]
+        self.interpolated_alphas[written] = np.nan
+        self.note_written(written)
+
+    def interpolate_where(
+        self,
+        alphas: np.ndarray,
+        mask: np.ndarray,
+        dtype: np.dtype = np.dtype(float)
+    ) -> None:
+        """
+        Interpolates each submobject flagged by mask from its start to its
+        target along a straight path, with its own alpha, as
+        Mobject.interpolate would for a scalar alpha computed at the
+        precision of dtype
+        """
+        # Bounding boxes are cheap enough to always interpolate
+        box_alphas = alphas[mask, np.newaxis, np.newaxis]
+        self.current_boxes[mask] = (1 - box_alphas) * self.start_boxes[mask] + box_alphas * self.target_boxes[mask]
+
+        written = self.get_stale(mask, alphas != self.interpolated_alphas)
+        if not written.any():
+            return
+        rows = np.flatnonzero(written[self.owners])
+        alpha = alphas[self.owners[rows], np.newaxis]
+        beta = (1 - alpha).astype(dtype)
+        alpha = alpha.astype(dtype)
+        for key in self.keys:
+            self.current[key][rows] = beta * self.start[key][rows] + alpha * self.target[key][rows]
+
+        written_indices = np.flatnonzero(written)
+        for key in self.uniform_keys:
+            u1 = self.start_uniforms[key][written_indices]
+            u2 = self.target_uniforms[key][written_indices]
+            uniform_alphas = alphas[written_indices].reshape(-1, *(u1.ndim - 1) * [1])
+            values = (1 - uniform_alphas) * u1 + uniform_alphas * u2
+            for index, value in zip(written_indices, values):
+                self.mobjects[index].uniforms[key] = value
+
+        self.interpolated_alphas[written] = alphas[written]
+        self.partial_bounds[written] = np.nan
+        self.note_written(written, refresh_bounding_boxes=False)
+
+
+def get_partway_sub_alpha(animation: Animation, alpha: float, sub_alphas: np.ndarray) -> float:
+    """
+    The sub alpha of some submobject partway through, as get_sub_alpha gives
+    it, whose type tells batches what precision to work at.  If none are
+    partway, 0.5 stands in, since bounds at the ends come out exact anyway
+    """
+    partway = np.flatnonzero((sub_alphas > 0) & (sub_alphas < 1))
+    if len(partway) == 0:
+        return 0.5
+    return animation.get_sub_alpha(alpha, int(partway[0]), len(sub_alphas))
+
+
+def get_interpolated_uniform_keys(
+    mobject: Mobject,
+    mobject1: Mobject,
+    mobject2: Mobject
+) -> tuple[str, ...]:
+    """
+    The uniforms Mobject.interpolate would give mobject new values for
+    """
+    return tuple(
+        key for key in mobject.uniforms
+        if key not in mobject.locked_uniform_keys
+        and key in mobject1.uniforms
+        and key in mobject2.uniforms
+    )
+
+
+def get_partial_batches(
+    families: list[tuple[Mobject, Mobject, Mobject]]
+) -> list[PartialBatch]:
+    """
+    Groups those (submobject, start, target) triples of VMobjects which a
+    PartialBatch can handle by their type of data, returning a batch for
+    each group with more than one member
+    """
+    index_groups = dict()
+    for index, (sm, sm1, sm2) in enumerate(families):
+        if not all(isinstance(mob, VMobject) for mob in (sm, sm1, sm2)):
+            continue
+        if type(sm).pointwise_become_partial is not VMobject.pointwise_become_partial:
+            continue
+        if type(sm).interpolate is not Mobject.interpolate:
+            continue
+        if not (len(sm.data) == len(sm1.data) == len(sm2.data)):
+            continue
+        if len(sm.data) < 3 or len(sm.data) % 2 == 0:
+            continue
+        if not (sm.data.dtype == sm1.data.dtype == sm2.data.dtype):
+            continue
+        if sm.locked_data_keys or sm.const_data_keys:
+            continue
+        group_key = (sm.data.dtype, get_interpolated_uniform_keys(sm, sm1, sm2))
+        index_groups.setdefault(group_key, []).append(index)
+
+    return [
+        PartialBatch(indices, [families[i] for i in indices])
+        for indices in index_groups.values()
+        if len(indices) > 1
+    ]
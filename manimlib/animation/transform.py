@@ -18,7 +18,7 @@ if TYPE_CHECKING:
     from typing import Callable
     import numpy.typing as npt
     from manimlib.scene.scene import Scene
-    from manimlib.typing import ManimColor
+    from manimlib.typing import ManimColor, Vect3Array
 
 
 class Transform(Animation):
@@ -37,6 +37,7 @@ class Transform(Animation):
         self.path_arc = path_arc
         self.path_arc_axis = path_arc_axis
         self.path_func = path_func
+        self.interpolation_batches: list[InterpolationBatch] = []
         super().__init__(mobject, **kwargs)
         self.init_path_func()
 
@@ -70,10 +71,84 @@ class Transform(Animation):
                 self.starting_mobject,
                 self.target_copy,
             )
+        self.init_interpolation_batches()
 
     def finish(self) -> None:
         super().finish()
         self.mobject.unlock_data()
+        for batch in self.interpolation_batches:
+            batch.release()
+        self.interpolation_batches = []
+
+    def init_interpolation_batches(self) -> None:
+        """
+        Submobjects which are interpolated the default way are grouped by
+        their type of data, so that each frame takes a few array operations
+        per group, rather than a call to Mobject.interpolate per submobject
+        """
+        self.interpolation_batches = []
+        if type(self).interpolate_submobject is not Transform.interpolate_submobject:
+            return
+        if type(self).interpolate_mobject is not Transform.interpolate_mobject:
+            return
+        mobjects = [self.mobject, self.starting_mobject, self.target_copy]
+        if any(mob.has_updaters() for mob in mobjects):
+            return
+
+        index_groups = dict()
+        for index, (sm, sm1, sm2) in enumerate(self.families):
+            if type(sm).interpolate is not Mobject.interpolate:
+                continue
+            if len(sm.data) == 0 or not (len(sm.data) == len(sm1.data) == len(sm2.data)):
+                continue
+            if not (sm.data.dtype == sm1.data.dtype == sm2.data.dtype):
+                continue
+            if any(
+                key not in sm.locked_uniform_keys and key in sm1.uniforms and key in sm2.uniforms
+                for key in sm.uniforms
+            ):
+                continue
+            group_key = (
+                sm.data.dtype,
+                tuple(sm.pointlike_data_keys),
+                frozenset(sm.locked_data_keys),
+            )
+            index_groups.setdefault(group_key, []).append(index)
+
+        self.interpolation_batches = [
+            InterpolationBatch(indices, [self.families[i] for i in indices])
+            for indices in index_groups.values()
+            if len(indices) > 1
+        ]
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        if not self.interpolation_batches:
+            super().interpolate_mobject(alpha)
+            return
+
+        n_families = len(self.families)
+        time_alpha = self.time_spanned_alpha(alpha)
+        if self.lag_ratio == 0:
+            sub_alphas = n_families * [self.get_sub_alpha(time_alpha, 0, n_families)]
+        else:
+            sub_alphas = [
+                self.get_sub_alpha(time_alpha, i, n_families)
+                for i in range(n_families)
+            ]
+        batched_indices = set()
+        for batch in list(self.interpolation_batches):
+            if not batch.is_intact():
+                # Something replaced the data of a submobject
+                batch.release()
+                self.interpolation_batches.remove(batch)
+            elif batch.interpolate(sub_alphas, self.path_func):
+                batched_indices.update(batch.indices)
+
+        for i, mobs in enumerate(self.families):
+            if i not in batched_indices:
+                self.interpolate_submobject(*mobs, sub_alphas[i])
+        if batched_indices:
+            self.mobject.note_changed_data()
 
     def create_target(self) -> Mobject:
         # Has no meaningful effect here, but may be useful
@@ -329,3 +404,105 @@ class CyclicReplace(Transform):
 class Swap(CyclicReplace):
     """Alternate name for CyclicReplace"""
     pass
+
+
+class InterpolationBatch(object):
+    """
+    The data of several (submobject, start, target) triples with the same
+    data type, packed into contiguous arrays. The data and bounding box of
+    each submobject are replaced by views into the packed current state,
+    so interpolating the packed arrays updates all of them at once.
+    """
+    def __init__(self, indices: list[int], families: list[tuple[Mobject, Mobject, Mobject]]):
+        self.indices = indices
+        self.mobjects = [sm for sm, sm1, sm2 in families]
+        mob = self.mobjects[0]
+        self.lengths = np.array([len(sm.data) for sm in self.mobjects])
+        self.current = np.concatenate([sm.data for sm in self.mobjects])
+        self.start_boxes = np.array([sm1.bounding_box for sm, sm1, sm2 in families])
+        self.target_boxes = np.array([sm2.bounding_box for sm, sm1, sm2 in families])
+        self.current_boxes = np.array([sm.bounding_box for sm in self.mobjects])
+        self.pointlike_keys = set(mob.pointlike_data_keys)
+        # All submobjects here have the same locked keys, and the start
+        # and target values of the others are kept in contiguous arrays
+        self.keys = [key for key in mob.data.dtype.names if key not in mob.locked_data_keys]
+        self.start = {
+            key: np.concatenate([sm1.data[key] for sm, sm1, sm2 in families])
+            for key in self.keys
+        }
+        self.target = {
+            key: np.concatenate([sm2.data[key] for sm, sm1, sm2 in families])
+            for key in self.keys
+        }
+
+        ends = np.cumsum(self.lengths)
+        self.data_views = [
+            self.current[end - length:end]
+            for end, length in zip(ends, self.lengths)
+        ]
+        for sm, data, box in zip(self.mobjects, self.data_views, self.current_boxes):
+            sm.data = data
+            sm.bounding_box = box
+
+    def is_intact(self) -> bool:
+        return all(
+            sm.data is data and data.flags.writeable
+            for sm, data in zip(self.mobjects, self.data_views)
+        )
+
+    def interpolate(
+        self,
+        sub_alphas: list[float],
+        path_func: Callable[[Vect3Array, Vect3Array, float], Vect3Array],
+    ) -> bool:
+        """
+        Returns False, leaving the submobjects to be interpolated one at a
+        time, if their alphas differ in a way path_func can't take at once
+        """
+        alphas = [sub_alphas[i] for i in self.indices]
+        if all(alpha == alphas[0] for alpha in alphas):
+            alpha = box_alpha = alphas[0]
+            beta = 1 - alpha
+        elif path_func is straight_path:
+            dtype = get_scalar_dtype(*alphas)
+            box_alpha = np.repeat(alphas, 3)[:, np.newaxis]
+            alpha = np.repeat(np.array(alphas, dtype=dtype), self.lengths)[:, np.newaxis]
+            beta = np.repeat(np.array([1 - a for a in alphas], dtype=dtype), self.lengths)[:, np.newaxis]
+        else:
+            return False
+
+        for key in self.keys:
+            md1 = self.start[key]
+            md2 = self.target[key]
+            if key in self.pointlike_keys and path_func is not straight_path:
+                self.current[key] = path_func(md1, md2, alpha)
+            else:
+                self.current[key] = beta * md1 + alpha * md2
+
+        self.current_boxes[:] = path_func(
+            self.start_boxes.reshape(-1, 3),
+            self.target_boxes.reshape(-1, 3),
+            box_alpha,
+        ).reshape(self.current_boxes.shape)
+
+        if self.keys:
+            for sm in self.mobjects:
+                sm.note_changed_data(recurse_up=False)
+        return True
+
+    def release(self) -> None:
+        # Give each submobject arrays of its own again
+        for sm, data in zip(self.mobjects, self.data_views):
+            if sm.data is data:
+                sm.data = data.copy()
+            sm.bounding_box = sm.bounding_box.copy()
+
+
+def get_scalar_dtype(*values: float) -> np.dtype:
+    """
+    The precision at which arithmetic with these scalars and the float32
+    data of mobjects is carried out, so that batches can round as scalar
+    alphas would: that of the data for python numbers, but not for numpy
+    float64s
+    """
+    return np.result_type(np.float32, *{type(value): value for value in values}.values())
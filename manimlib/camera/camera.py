@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import deque
+
 import moderngl
 import numpy as np
 import OpenGL.GL as gl
@@ -13,6 +15,7 @@ from manimlib.constants import FRAME_WIDTH
 from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.mobject import Point
 from manimlib.utils.color import color_to_rgba
+from manimlib.utils.shaders import prewarm_shader_programs
 
 from typing import TYPE_CHECKING
 
@@ -44,6 +47,9 @@ class Camera(object):
         # without multisampling, for 3d scenes one might want
         # to set samples to be greater than 0.
         samples: int = 0,
+        # Whether to link the shader programs used in previous runs
+        # as soon as the context is created
+        prewarm_shaders: bool = False,
     ):
         self.window = window
         self.background_image = background_image
@@ -55,12 +61,15 @@ class Camera(object):
         self.pixel_array_dtype = pixel_array_dtype
         self.light_source_position = light_source_position
         self.samples = samples
+        self.prewarm_shaders = prewarm_shaders
 
         self.rgb_max_val: float = np.iinfo(self.pixel_array_dtype).max
         self.background_rgba: list[float] = list(color_to_rgba(
             background_color, background_opacity
         ))
         self.uniforms = dict()
+        self.readback_buffers: list[moderngl.Buffer] = []
+        self.pending_readbacks: deque[moderngl.Buffer] = deque()
         self.init_frame(**frame_config)
         self.init_context()
         self.init_fbo()
@@ -77,6 +86,8 @@ class Camera(object):
 
         self.ctx.enable(moderngl.PROGRAM_POINT_SIZE)
         self.ctx.enable(moderngl.BLEND)
+        if self.prewarm_shaders:
+            prewarm_shader_programs(self.ctx)
 
     def init_fbo(self) -> None:
         # This is the buffer used when writing to a video/image file
@@ -146,6 +157,53 @@ class Camera(object):
             dtype=dtype,
         )
 
+    def init_readback_buffers(self, n_buffers: int = 2) -> None:
+        self.flush_queued_fbo_data()
+        for buff in self.readback_buffers:
+            buff.release()
+        width, height = self.draw_fbo.size
+        self.readback_buffers = [
+            self.ctx.buffer(reserve=width * height * self.n_channels)
+            for _ in range(n_buffers)
+        ]
+
+    def queue_raw_fbo_data(self) -> bytes | None:
+        """
+        Begins reading the current frame into the next of a ring of
+        pixel pack buffers, without waiting on the gpu to finish the
+        transfer. Once all buffers in the ring are in use, this returns
+        the data for the oldest frame among them, whose transfer will
+        typically have completed while later frames were rendered.
+        Otherwise, it returns None.
+        """
+        if not self.readback_buffers:
+            self.init_readback_buffers()
+        result = None
+        if len(self.pending_readbacks) == len(self.readback_buffers):
+            buff = self.pending_readbacks.popleft()
+            result = buff.read()
+        else:
+            buff = self.readback_buffers[len(self.pending_readbacks)]
+
+        self.blit(self.fbo, self.draw_fbo)
+        self.draw_fbo.read_into(
+            buff,
+            viewport=self.draw_fbo.viewport,
+            components=self.n_channels,
+            dtype='f1',
+        )
+        self.pending_readbacks.append(buff)
+        return result
+
+    def flush_queued_fbo_data(self) -> list[bytes]:
+        """
+        Returns data for all frames still sitting in the readback
+        ring, oldest first, and empties the ring.
+        """
+        result = [buff.read() for buff in self.pending_readbacks]
+        self.pending_readbacks.clear()
+        return result
+
     def get_image(self) -> Image.Image:
         return Image.frombytes(
             'RGBA',
@@ -196,6 +196,30 @@ def parse_cli():
             help="Calculate total framecount, to display in a progress bar, by doing " + \
                  "an initial run of the scene which skips animations."
         )
+        parser.add_argument(
+            "--checkpoints",
+            action="store_true",
+            help="Save the state of the scene at the end of each of its " + \
+                 "sections, and restore it on later runs which start past " + \
+                 "that section, rather than running it again"
+        )
+        parser.add_argument(
+            "--parallel",
+            type=int,
+            metavar="N",
+            help="When writing to a movie file, split the scene's animations " + \
+                 "into N contiguous ranges, render each in its own process, " + \
+                 "and then concatenate the results"
+        )
+        parser.add_argument(
+            "--parallel_scenes",
+            type=int,
+            metavar="M",
+            help="When writing several scenes, as with -a, render each scene " + \
+                 "in its own process, M at a time. Along with --parallel N, " + \
+                 "each of these splits its scene into N ranges in turn, for " + \
+                 "up to M*N processes in all"
+        )
         parser.add_argument(
             "--video_dir",
             help="Directory to write video",
@@ -310,6 +334,8 @@ def update_scene_config(config: Dict, args: Namespace):
         scene_config.leave_progress_bars = True
     if args.show_animation_progress:
         scene_config.show_animation_progress = True
+    if args.checkpoints:
+        scene_config.use_checkpoints = True
 
 
 def update_run_config(config: Dict, args: Namespace):
@@ -318,6 +344,8 @@ def update_run_config(config: Dict, args: Namespace):
         embed_line=(int(args.embed) if args.embed is not None else None),
         is_reload=False,
         prerun=args.prerun,
+        parallel=args.parallel or 1,
+        parallel_scenes=args.parallel_scenes or 1,
         scene_names=args.scene_names,
         quiet=args.quiet or args.write_all,
         write_all=args.write_all,
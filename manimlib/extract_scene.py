@@ -1,8 +1,19 @@
 from __future__ import annotations
 
 import copy
+import hashlib
 import inspect
+import json
+import multiprocessing
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from pathlib import Path
+
+import numpy as np
+from addict import Dict
+from tqdm.auto import tqdm as ProgressDisplay
 
 from manimlib.module_loader import ModuleLoader
 
@@ -10,13 +21,16 @@ from manimlib.config import manim_config
 from manimlib.logger import log
 from manimlib.scene.interactive_scene import InteractiveScene
 from manimlib.scene.scene import Scene
+from manimlib.scene.scene_hashing import update_hash_with_source_files
+from manimlib.scene.scene_file_writer import get_frame_count
+from manimlib.scene.scene_file_writer import get_output_file_name
+from manimlib.utils.dict_ops import merge_dicts_recursively
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     Module = importlib.util.types.ModuleType
     from typing import Optional
-    from addict import Dict
 
 
 class BlankScene(InteractiveScene):
@@ -60,28 +74,358 @@ def prompt_user_for_choice(scene_classes):
         sys.exit(1)
 
 
-def compute_total_frames(scene_class, scene_config):
+def prerun_scene(scene_class, scene_config):
     """
-    When a scene is being written to file, a copy of the scene is run with
-    skip_animations set to true so as to count how many frames it will require.
-    This allows for a total progress bar on rendering, and also allows runtime
-    errors to be exposed preemptively for long running scenes.
+    Runs a copy of the scene with skip_animations set to true, which
+    is a quick way to learn how long it and each of its animations are
     """
+    pre_scene = scene_class(**get_prerun_config(scene_config))
+    pre_scene.run()
+    return pre_scene
+
+
+def get_prerun_config(scene_config):
     pre_config = copy.deepcopy(scene_config)
     pre_config["file_writer_config"]["write_to_movie"] = False
     pre_config["file_writer_config"]["save_last_frame"] = False
     pre_config["file_writer_config"]["quiet"] = True
     pre_config["skip_animations"] = True
-    pre_scene = scene_class(**pre_config)
-    pre_scene.run()
-    total_time = pre_scene.time - pre_scene.skip_time
-    return int(total_time * manim_config.camera.fps)
+    return pre_config
+
+
+def get_timeline(scene_class, scene_config) -> dict:
+    """
+    When a scene is being written to file, a copy of the scene is run with
+    skip_animations set to true, finding the scene time at which skipping
+    stops, at which each play or wait call ends, and at which the scene
+    ends. This allows for a total progress bar on rendering, and also allows
+    runtime errors to be exposed preemptively for long running scenes.
+
+    The resulting timeline is saved next to the movie, and used in place of
+    this prerun for as long as the source of the scene is unchanged.
+    """
+    timeline_path = get_timeline_path(scene_class, scene_config)
+    timeline_key = get_timeline_key(scene_class, scene_config)
+    timeline = load_timeline(timeline_path, timeline_key)
+    if timeline is None:
+        pre_scene = prerun_scene(scene_class, scene_config)
+        timeline = dict(
+            key=timeline_key,
+            skip_time=float(pre_scene.skip_time),
+            time=float(pre_scene.time),
+            animation_end_times=list(map(float, pre_scene.animation_end_times)),
+        )
+        if not pre_scene.file_writer.ended_with_interrupt:
+            save_timeline(timeline_path, timeline)
+    return timeline
+
+
+def get_timeline_path(scene_class, scene_config) -> Path:
+    fw_config = merge_dicts_recursively(
+        manim_config.file_writer,
+        scene_class.default_file_writer_config,
+        scene_config.get("file_writer_config", dict()),
+    )
+    file_name = get_output_file_name(
+        scene_class.__name__,
+        fw_config.get("file_name"),
+        scene_config.get("start_at_animation_number"),
+        scene_config.get("end_at_animation_number"),
+    )
+    return Path(fw_config.get("output_directory", "."), file_name + ".timeline.json")
+
+
+def get_timeline_key(scene_class, scene_config) -> str:
+    """
+    Hash of the files defining scene_class and any other code it could
+    use from outside of manimlib, see get_user_source_files, together
+    with the parts of scene_config which could change the timing of its
+    animations, including the frame rate, which wait_until steps by
+    """
+    camera_config = merge_dicts_recursively(
+        manim_config.camera,
+        scene_class.default_camera_config,
+        scene_config.get("camera_config", dict()),
+    )
+    hasher = hashlib.sha256()
+    hasher.update(scene_class.__name__.encode())
+    hasher.update(repr(camera_config.get("fps")).encode())
+    update_hash_with_source_files(hasher, scene_class)
+    hasher.update(repr(sorted(
+        (key, value)
+        for key, value in scene_config.items()
+        if key not in ("window", "camera_config", "file_writer_config")
+    )).encode())
+    return hasher.hexdigest()[:32]
+
+
+def load_timeline(path: Path, key: str) -> dict | None:
+    try:
+        timeline = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(timeline, dict) or timeline.get("key") != key:
+        return None
+    if "animation_end_times" not in timeline:
+        return None
+    return timeline
+
+
+def save_timeline(path: Path, timeline: dict) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(timeline))
+    except OSError as err:
+        log.debug(f"Could not save timeline: {err}")
+
+
+def partition_animations(frame_counts: list[int], n_ranges: int) -> list[tuple[int, int]]:
+    """
+    Splits animation indices into at most n_ranges contiguous (start, end)
+    ranges, each covering roughly the same number of frames
+    """
+    cumulative = np.cumsum(frame_counts)
+    targets = cumulative[-1] * np.arange(1, n_ranges) / n_ranges
+    cuts = np.searchsorted(cumulative, targets) + 1
+    bounds = sorted({0, *cuts, len(frame_counts)})
+    return [
+        (start, end)
+        for start, end in zip(bounds[:-1], bounds[1:])
+        if end > start
+    ]
+
+
+def render_scene_range(
+    file_name: str,
+    scene_name: str,
+    scene_config: Dict,
+    start: int,
+    end: int,
+    output_directory: str,
+) -> str:
+    """
+    Run in a worker process, with its own headless context, to
+    render the animations with indices in [start, end) of a scene
+    """
+    module = ModuleLoader.get_module(file_name)
+    scene_class = getattr(module, scene_name)
+    config = copy.deepcopy(scene_config)
+    config.pop("window", None)
+    config.update(
+        start_at_animation_number=start,
+        end_at_animation_number=end,
+    )
+    config["file_writer_config"].update(
+        write_to_movie=True,
+        save_last_frame=False,
+        subdivide_output=False,
+        output_directory=output_directory,
+        file_name=f"{start:05}_{end:05}",
+        open_file_upon_completion=False,
+        show_file_location_upon_completion=False,
+        quiet=True,
+    )
+    scene = scene_class(**config)
+    scene.run()
+    if scene.file_writer.includes_sound:
+        log.warning(f"Sounds added in {scene_name} are dropped when rendering in parallel")
+    return str(scene.file_writer.get_movie_file_path())
+
+
+class ParallelSceneRender(object):
+    """
+    Stands in for a scene when rendering with --parallel N. The timeline
+    from a quick skipping pass, or that saved by an earlier one, gives how
+    many frames each animation needs, contiguous ranges of animations are
+    rendered in N processes, and the resulting movies are concatenated
+    without re-encoding.
+    """
+    def __init__(self, scene_class, scene_config: Dict, run_config: Dict):
+        self.scene_class = scene_class
+        self.scene_config = scene_config
+        self.run_config = run_config
+        self.n_frames: int = 0
+
+    def __str__(self) -> str:
+        return self.scene_class.__name__
+
+    def run(self) -> None:
+        timeline = get_timeline(self.scene_class, self.scene_config)
+        # The scene is not run, but gives the file writer and frame rate
+        scene = self.scene_class(**get_prerun_config(self.scene_config))
+        file_writer = scene.file_writer
+
+        start = scene.start_at_animation_number or 0
+        end_times = [timeline["skip_time"], *timeline["animation_end_times"][start:]]
+        fps = scene.camera.fps
+        frame_counts = [
+            get_frame_count(t2 - t1, fps)
+            for t1, t2 in zip(end_times[:-1], end_times[1:])
+        ]
+        if len(frame_counts) == 0:
+            log.warning(f"{self} has no animations to render")
+            return
+        self.n_frames = sum(frame_counts)
+        ranges = [
+            (start + r_start, start + r_end)
+            for r_start, r_end in partition_animations(frame_counts, self.run_config.parallel)
+        ]
+
+        file_writer.write_to_movie = True
+        file_writer.quiet = self.scene_config["file_writer_config"].get(
+            "quiet", manim_config.file_writer.quiet
+        )
+        file_writer.movie_file_path = file_writer.init_movie_file_path()
+        output_directory = str(file_writer.init_partial_movie_directory())
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(len(ranges), mp_context=context) as executor:
+            future_to_range = {
+                executor.submit(
+                    render_scene_range,
+                    self.run_config.file_name,
+                    self.scene_class.__name__,
+                    self.scene_config,
+                    r_start, r_end,
+                    output_directory,
+                ): (r_start, r_end)
+                for r_start, r_end in ranges
+            }
+            progress_display = ProgressDisplay(
+                total=self.n_frames,
+                desc=f"{self} ({len(ranges)} processes)",
+                leave=False,
+                disable=file_writer.quiet,
+            )
+            for future in as_completed(future_to_range):
+                r_start, r_end = future_to_range[future]
+                future.result()
+                progress_display.update(sum(frame_counts[r_start - start:r_end - start]))
+            progress_display.close()
+
+        file_writer.concatenate_movie_files([
+            future.result() for future in future_to_range
+        ])
+        file_writer.print_file_ready_message(file_writer.get_movie_file_path())
+        if file_writer.should_open_file():
+            file_writer.open_file()
+
+
+def render_scene(
+    file_name: str,
+    scene_name: str,
+    scene_config: Dict,
+    parallel: int = 1,
+) -> tuple[float, int]:
+    """
+    Run in a worker process, with its own headless context, to render
+    a whole scene, returning the wall time taken and the number of
+    frames covered. If parallel is above 1, the scene is split across
+    that many further processes, just as with ParallelSceneRender
+    """
+    start_time = time.time()
+    module = ModuleLoader.get_module(file_name)
+    scene_class = getattr(module, scene_name)
+    config = copy.deepcopy(scene_config)
+    config.pop("window", None)
+    config["file_writer_config"].update(
+        open_file_upon_completion=False,
+        show_file_location_upon_completion=False,
+        quiet=True,
+    )
+    if parallel > 1 and manim_config.file_writer.write_to_movie:
+        render = ParallelSceneRender(scene_class, config, Dict(file_name=file_name, parallel=parallel))
+        render.run()
+        return time.time() - start_time, render.n_frames
+    scene = scene_class(**config)
+    scene.run()
+    n_frames = round((scene.time - scene.skip_time) * scene.camera.fps)
+    return time.time() - start_time, n_frames
+
+
+class ParallelMultiSceneRender(object):
+    """
+    Stands in for the list of scenes when writing several of them, as with
+    -a, alongside --parallel_scenes M. Each scene is rendered in its own
+    process, at most M at a time, and a summary of how long each took is
+    printed. If --parallel N is also given, each of those processes splits
+    its scene across N more, as ParallelSceneRender does.
+    """
+    def __init__(self, scene_classes: list, scene_config: Dict, run_config: Dict):
+        self.scene_classes = scene_classes
+        self.scene_config = scene_config
+        self.run_config = run_config
+
+    def __str__(self) -> str:
+        return f"{len(self.scene_classes)} scenes"
+
+    def run(self) -> None:
+        n_processes = min(self.run_config.parallel_scenes, len(self.scene_classes))
+        names = [scene_class.__name__ for scene_class in self.scene_classes]
+        results = dict()
+        start_time = time.time()
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(n_processes, mp_context=context) as executor:
+            future_to_name = {
+                executor.submit(
+                    render_scene,
+                    self.run_config.file_name,
+                    name,
+                    self.scene_config,
+                    self.run_config.parallel,
+                ): name
+                for name in names
+            }
+            progress_display = ProgressDisplay(
+                total=len(names),
+                desc=f"{self} ({n_processes} processes)",
+                leave=False,
+            )
+            for future in as_completed(future_to_name):
+                name = future_to_name[future]
+                try:
+                    results[name] = future.result()
+                except Exception as err:
+                    log.error(f"{name} failed: {err!r}")
+                    results[name] = None
+                progress_display.set_postfix_str(name)
+                progress_display.update()
+            progress_display.close()
+
+        self.print_summary(names, results, time.time() - start_time)
+
+    def print_summary(
+        self,
+        names: list[str],
+        results: dict[str, tuple[float, int] | None],
+        total_time: float
+    ) -> None:
+        name_len = max(len(name) for name in [*names, "Scene"])
+        lines = [f"{'Scene':<{name_len}}  {'Time (s)':>9}  {'Frames':>7}  {'FPS':>7}"]
+        for name in names:
+            if results[name] is None:
+                lines.append(f"{name:<{name_len}}  {'failed':>9}")
+                continue
+            wall_time, n_frames = results[name]
+            lines.append(
+                f"{name:<{name_len}}  {wall_time:>9.2f}  {n_frames:>7}  {n_frames / wall_time:>7.1f}"
+            )
+        total_frames = sum(result[1] for result in results.values() if result is not None)
+        lines.append(
+            f"{'Total':<{name_len}}  {total_time:>9.2f}  {total_frames:>7}  {total_frames / total_time:>7.1f}"
+        )
+        print("\n".join(lines))
 
 
 def scene_from_class(scene_class, scene_config: Dict, run_config: Dict):
     fw_config = manim_config.file_writer
+    if fw_config.write_to_movie and run_config.parallel > 1:
+        return ParallelSceneRender(scene_class, scene_config, run_config)
     if fw_config.write_to_movie and run_config.prerun:
-        scene_config.file_writer_config.total_frames = compute_total_frames(scene_class, scene_config)
+        timeline = get_timeline(scene_class, scene_config)
+        scene_config.file_writer_config.update(
+            total_frames=int((timeline["time"] - timeline["skip_time"]) * manim_config.camera.fps),
+            animation_end_times=timeline["animation_end_times"],
+        )
     return scene_class(**scene_config)
 
 
@@ -103,6 +447,9 @@ def get_scenes_to_render(all_scene_classes: list, scene_config: Dict, run_config
     if len(classes_to_run) == 0:
         classes_to_run = prompt_user_for_choice(all_scene_classes)
 
+    if not run_config.show_in_window and run_config.parallel_scenes > 1 and len(classes_to_run) > 1:
+        return [ParallelMultiSceneRender(classes_to_run, scene_config, run_config)]
+
     return [
         scene_from_class(scene_class, scene_config, run_config)
         for scene_class in classes_to_run
@@ -3,6 +3,7 @@ from __future__ import annotations
 import numpy as np
 
 from manimlib.constants import BLUE_B, BLUE_D, BLUE_E, GREY_BROWN, DEFAULT_MOBJECT_COLOR
+from manimlib.constants import DEG, PI
 from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
@@ -12,7 +13,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Callable, List, Iterable
-    from manimlib.typing import ManimColor, Vect3, Self
+    from manimlib.typing import ManimColor, Vect3, Vect3Array, Self
 
 
 class AnimatedBoundary(VGroup):
@@ -117,36 +118,205 @@ class TracedPath(VMobject):
         self.time_traced = time_traced
         self.time_per_anchor = time_per_anchor
         self.time: float = 0
-        self.traced_points: list[np.ndarray] = []
+        # Ring buffer of traced points, the most recent of which sits at
+        # index (n_traced_points - 1) % len(traced_points)
+        self.traced_points: np.ndarray = np.zeros((0, 3))
+        self.n_traced_points: int = 0
+        # Points treated as traced before all others, while there is room
+        self.leading_point: Vect3 | None = None
+        self.n_leading_points: int = 0
+        # Indices of the last two traced points at which the path clearly
+        # has a corner, of the last two where that's unclear, and of the
+        # last one not level with the point before it
+        self.corner_indices: list[int] = [-1, -1]
+        self.unclear_corner_indices: list[int] = [-1, -1]
+        self.last_z_change_index: int = 0
         self.add_updater(lambda m, dt: m.update_path(dt))
 
+    def add_traced_points(
+        self,
+        points: Iterable[Vect3],
+        n_to_keep: int | None = None
+    ) -> Self:
+        """
+        Adds points to the ring buffer, growing it if needed so that it
+        holds at least the last n_to_keep points, or all of them if
+        n_to_keep is None
+        """
+        for point in points:
+            capacity = len(self.traced_points)
+            if self.n_traced_points >= capacity and (n_to_keep is None or n_to_keep > capacity):
+                held = self.get_traced_points()
+                new_buffer = np.zeros((max(2 * capacity, 16), 3))
+                indices = np.arange(self.n_traced_points - len(held), self.n_traced_points)
+                new_buffer[indices % len(new_buffer)] = held
+                self.traced_points = new_buffer
+                capacity = len(new_buffer)
+            self.traced_points[self.n_traced_points % capacity] = point
+            self.n_traced_points += 1
+            self.update_corner_indices()
+        return self
+
+    def get_traced_points(self, n: int | None = None) -> Vect3Array:
+        """
+        Returns the last n points held by the ring buffer (or all of
+        them if n is None), oldest first
+        """
+        n_held = min(self.n_traced_points, len(self.traced_points))
+        if n is not None:
+            n_held = min(n, n_held)
+        if n_held == 0:
+            return np.zeros((0, 3))
+        indices = np.arange(self.n_traced_points - n_held, self.n_traced_points)
+        return self.traced_points[indices % len(self.traced_points)]
+
+    def update_corner_indices(self) -> None:
+        """
+        Called after each point is traced, to note whether the path through
+        the traced points has a corner at the one before it
+        """
+        p0, p1, p2 = np.vstack([np.zeros((3, 3)), self.get_traced_points(3)])[-3:]
+        index = self.n_traced_points - 1
+        if index > 0 and p2[2] != p1[2]:
+            self.last_z_change_index = index
+        if index < 2 or (p0 == p1).all() and (p1 == p2).all():
+            return
+        v_in = (p1 - p0)[:2]
+        v_out = (p2 - p1)[:2]
+        angle = abs(np.arctan2(v_in[0] * v_out[1] - v_in[1] * v_out[0], np.dot(v_in, v_out)))
+        # Besides short steps, angles close to a degree can't be judged here,
+        # nor can turning back, as a path along a line isn't always rotated
+        # to lie flat before measuring its joint angles
+        if self.is_short_step(p0, p1) or self.is_short_step(p1, p2) \
+                or abs(angle - DEG) < 0.1 * DEG or angle > PI - DEG:
+            self.unclear_corner_indices = [self.unclear_corner_indices[1], index - 1]
+        elif angle > DEG:
+            self.corner_indices = [self.corner_indices[1], index - 1]
+
+    @staticmethod
+    def is_short_step(p0: Vect3, p1: Vect3) -> bool:
+        """
+        Whether the step from p0 to p1 within the xy-plane is too short for
+        its direction to be judged, as joint angles are found from points
+        rounded to float32
+        """
+        return np.abs(p1 - p0)[:2].max() < 1e-3 * max(1.0, np.abs(p0).max())
+
+    def get_smoothing(self, start: int, end: int) -> bool | None:
+        """
+        Whether set_points_smoothly, given the traced points with indices
+        from start to end, would make the path smooth rather than leave it
+        with corners, as it does for a path without any corner of at least
+        a degree, or None if that's not known. Only meant for end at least
+        the index of the second last point.
+        """
+        if self.last_z_change_index > start:
+            return None
+        if any(start < index < end for index in self.corner_indices):
+            return True
+        if any(start < index < end for index in self.unclear_corner_indices):
+            return None
+        return False
+
+    @staticmethod
+    def get_smooth_handles(anchors: Vect3Array) -> Vect3Array:
+        """
+        Handles of a smooth open path through anchors, as set_points_smoothly
+        would choose them. This is approx_smooth_quadratic_bezier_handles,
+        but without checking whether the anchors form a closed loop, as they
+        might be just part of the path.
+        """
+        smooth_to_right, smooth_to_left = [
+            0.25 * ps[0:-2] + ps[1:-1] - 0.25 * ps[2:]
+            for ps in (anchors, anchors[::-1])
+        ]
+        handles = 0.5 * np.vstack([smooth_to_right, [smooth_to_left[0]]])
+        handles += 0.5 * np.vstack([[smooth_to_right[0]], smooth_to_left[::-1]])
+        a0 = anchors[:-1]
+        a1 = anchors[1:]
+        degenerate = (handles == a0).all(1) | (handles == a1).all(1)
+        handles[degenerate] = 0.5 * (a0[degenerate] + a1[degenerate])
+        return handles
+
     def update_path(self, dt: float) -> Self:
         if dt == 0:
             return self
         point = self.traced_point_func().copy()
-        self.traced_points.append(point)
 
         if self.time_traced < np.inf:
             n_relevant_points = int(self.time_traced / dt + 0.5)
-            n_tps = len(self.traced_points)
-            if n_tps < n_relevant_points:
-                points = self.traced_points + [point] * (n_relevant_points - n_tps)
-            else:
-                points = self.traced_points[n_tps - n_relevant_points:]
-            # Every now and then refresh the list
-            if n_tps > 10 * n_relevant_points:
-                self.traced_points = self.traced_points[-n_relevant_points:]
         else:
-            points = self.traced_points
-
-        if points:
-            self.set_points_smoothly(points)
+            n_relevant_points = None
+        self.add_traced_points([point], n_relevant_points)
 
-        self.set_stroke(**self.stroke_config)
+        if not self.update_path_ends(point, n_relevant_points):
+            points = self.get_traced_points(n_relevant_points)
+            if n_relevant_points is not None and len(points) < n_relevant_points:
+                # Fill up with any leading points first, then the current one
+                n_missing = n_relevant_points - len(points)
+                leading = min(self.n_leading_points, n_missing) * [self.leading_point]
+                trailing = (n_missing - len(leading)) * [point]
+                points = np.array([*leading, *points, *trailing])
+            if len(points) > 0:
+                self.set_points_smoothly(points)
+            self.set_stroke(**self.stroke_config)
 
         self.time += dt
         return self
 
+    def update_path_ends(self, point: Vect3, n_relevant_points: int | None) -> bool:
+        """
+        If the path runs through the previous traced points, appends a curve
+        ending at point, dropping the first curve when only n_relevant_points
+        are traced. Since the handles of the path depend only on neighboring
+        anchors, only those at its ends are recomputed. Returns False, without
+        changing anything, unless that's known to give the same points as
+        set_points_smoothly, which leaves a path with no corners as it is,
+        and treats closed paths differently.
+        """
+        n_curr = self.n_traced_points
+        if n_relevant_points is None:
+            n_prev, start, prev_start = n_curr - 1, 0, 0
+        else:
+            n_prev = n_relevant_points
+            start = n_curr - n_relevant_points
+            prev_start = start - 1
+        if prev_start < 0 or n_prev < 4 or self.get_num_points() != 2 * n_prev - 1:
+            return False
+        smooth = self.get_smoothing(start, n_curr - 1)
+        if smooth is None or self.get_smoothing(prev_start, n_curr - 2) != smooth:
+            return False
+        points = self.get_points()
+        first_anchor = points[2 * (start - prev_start)]
+        if np.isclose(points[0], points[-1]).all() or np.isclose(first_anchor, point.astype(points.dtype)).all():
+            return False
+        # Joint angles are measured after rotating the path by its unit normal,
+        # which is only known to be vertical if its first curve isn't too short
+        if self.is_short_step(points[0], points[2]) or self.is_short_step(first_anchor, points[2 * (start - prev_start) + 2]):
+            return False
+
+        # As in set_points_as_corners
+        handle = 0.5 * (self.get_traced_points(2)[0] + point)
+        if n_relevant_points is None:
+            self.append_points([handle, point])
+            new_points = self.get_points()
+        else:
+            new_points = np.empty_like(points)
+            new_points[:-2] = points[2:]
+            new_points[-2] = handle
+            new_points[-1] = point
+        if smooth:
+            new_points[[-4, -2]] = self.get_smooth_handles(new_points[-7::2])[1:]
+            new_points[1] = self.get_smooth_handles(new_points[0:5:2])[0]
+
+        if n_relevant_points is None:
+            # Spread out any stroke gradient along the longer path
+            self.set_stroke(**self.stroke_config)
+        else:
+            # The stroke data, which is the same length, is left alone
+            self.set_points(new_points)
+        return True
+
 
 class TracingTail(TracedPath):
     def __init__(
@@ -171,6 +341,8 @@ class TracingTail(TracedPath):
             stroke_opacity=stroke_opacity,
             **kwargs
         )
-        curr_point = self.traced_point_func()
-        n_points = int(self.time_traced / self.time_per_anchor)
-        self.traced_points: list[np.ndarray] = n_points * [curr_point]
+        # The tail starts out collapsed onto the initial point. This isn't
+        # copied, so when it's a view of a mobject's center, which is updated
+        # in place, the start of the tail follows the mobject until it fills.
+        self.leading_point = self.traced_point_func()
+        self.n_leading_points = int(self.time_traced / self.time_per_anchor)
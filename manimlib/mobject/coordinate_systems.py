@@ -12,6 +12,7 @@ from manimlib.constants import DL, UL, DOWN, DR, LEFT, ORIGIN, OUT, RIGHT, UP
 from manimlib.constants import FRAME_X_RADIUS, FRAME_Y_RADIUS
 from manimlib.constants import MED_SMALL_BUFF, SMALL_BUFF
 from manimlib.mobject.functions import ParametricCurve
+from manimlib.mobject.functions import RiemannRectangles
 from manimlib.mobject.geometry import Arrow
 from manimlib.mobject.geometry import DashedLine
 from manimlib.mobject.geometry import Line
@@ -252,6 +253,25 @@ class CoordinateSystem(ABC):
         """
         return self.input_to_graph_point(x, graph)
 
+    def inputs_to_graph_points(
+        self,
+        xs: Sequence[float],
+        graph: ParametricCurve
+    ) -> Vect3Array:
+        """
+        Version of input_to_graph_point for many inputs, which calls the
+        function underlying graph on all of them at once if it accepts arrays
+        """
+        xs = np.array(xs, dtype=float)
+        if not hasattr(graph, "underlying_function"):
+            return np.array([self.input_to_graph_point(x, graph) for x in xs]).reshape((len(xs), 3))
+        function = graph.underlying_function
+        try:
+            ys = np.broadcast_to(np.array(function(xs), dtype=float), xs.shape)
+        except Exception:
+            ys = np.array([function(x) for x in xs], dtype=float)
+        return self.coords_to_point(xs, ys).reshape((len(xs), 3))
+
     def bind_graph_to_func(
         self,
         graph: VMobject,
@@ -360,6 +380,51 @@ class CoordinateSystem(ABC):
         line.move_to(self.input_to_graph_point(x, graph))
         return line
 
+    def get_riemann_rectangle_bounds(
+        self,
+        graph: ParametricCurve,
+        x_range: Sequence[float] = None,
+        dx: float | None = None,
+        input_sample_type: str = "left",
+    ) -> tuple[Vect3Array, Vect3Array, np.ndarray]:
+        """
+        Lower left and upper right corners of each rectangle of a Riemann sum
+        for graph, together with whether each lies above the x-axis, with
+        the graph evaluated at all sample inputs at once
+        """
+        if x_range is None:
+            x_range = self.x_range[:2]
+        if dx is None:
+            dx = self.x_range[2]
+        x_range = list(x_range)
+        if len(x_range) < 3:
+            x_range = [*x_range, dx]
+
+        x_range[1] = x_range[1] + dx
+        xs = np.arange(*x_range)
+        x0s, x1s = xs[:-1], xs[1:]
+        if input_sample_type == "left":
+            samples = x0s
+        elif input_sample_type == "right":
+            samples = x1s
+        elif input_sample_type == "center":
+            samples = 0.5 * x0s + 0.5 * x1s
+        else:
+            raise Exception("Invalid input sample type")
+
+        zeros = np.zeros_like(samples)
+        height_vects = self.inputs_to_graph_points(samples, graph) - self.c2p(samples, zeros).reshape((-1, 3))
+        heights = np.linalg.norm(height_vects, axis=1)
+        positive = height_vects[:, 1] > 0
+        widths = np.abs(self.x_axis.n2p(x1s)[:, 0] - self.x_axis.n2p(x0s)[:, 0])
+
+        lower_lefts = self.c2p(x0s, zeros).reshape((-1, 3)).copy()
+        lower_lefts[~positive, 1] -= heights[~positive]
+        upper_rights = lower_lefts.copy()
+        upper_rights[:, 0] += widths
+        upper_rights[:, 1] += heights
+        return lower_lefts, upper_rights, positive
+
     def get_riemann_rectangles(
         self,
         graph: ParametricCurve,
@@ -374,32 +439,22 @@ class CoordinateSystem(ABC):
         stroke_background: bool = True,
         show_signed_area: bool = True
     ) -> VGroup:
-        if x_range is None:
-            x_range = self.x_range[:2]
-        if dx is None:
-            dx = self.x_range[2]
-        if len(x_range) < 3:
-            x_range = [*x_range, dx]
-
+        """
+        Returns a VGroup of Rectangles. For many rectangles, or to have them
+        follow a changing graph, see RiemannRectangles, which draws them
+        all as a single mobject
+        """
+        lower_lefts, upper_rights, positive = self.get_riemann_rectangle_bounds(
+            graph, x_range, dx, input_sample_type
+        )
+        # Each rectangle starts as a copy of one, rather than being built
+        # up and positioned on its own
+        template = Rectangle()
         rects = []
-        x_range[1] = x_range[1] + dx
-        xs = np.arange(*x_range)
-        for x0, x1 in zip(xs, xs[1:]):
-            if input_sample_type == "left":
-                sample = x0
-            elif input_sample_type == "right":
-                sample = x1
-            elif input_sample_type == "center":
-                sample = 0.5 * x0 + 0.5 * x1
-            else:
-                raise Exception("Invalid input sample type")
-            height_vect = self.i2gp(sample, graph) - self.c2p(sample, 0)
-            rect = Rectangle(
-                width=self.x_axis.n2p(x1)[0] - self.x_axis.n2p(x0)[0],
-                height=get_norm(height_vect),
-            )
-            rect.positive = height_vect[1] > 0
-            rect.move_to(self.c2p(x0, 0), DL if rect.positive else UL)
+        for points, is_positive in zip(RiemannRectangles.get_rectangle_points(lower_lefts, upper_rights), positive):
+            rect = template.copy()
+            rect.set_points(points)
+            rect.positive = is_positive
             rects.append(rect)
         result = VGroup(*rects)
         result.set_submobject_colors_by_gradient(*colors)
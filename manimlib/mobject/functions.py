@@ -3,15 +3,21 @@ from __future__ import annotations
 from isosurfaces import plot_isoline
 import numpy as np
 
+from manimlib.constants import DEFAULT_PIXEL_WIDTH, FRAME_WIDTH
 from manimlib.constants import FRAME_X_RADIUS, FRAME_Y_RADIUS
-from manimlib.constants import YELLOW
+from manimlib.constants import BLACK, BLUE, GREEN, RED, YELLOW
+from manimlib.mobject.mobject import Mobject
 from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.utils.bezier import approx_smooth_quadratic_bezier_handles_for_times
+from manimlib.utils.color import color_to_rgb
+from manimlib.utils.color import rgb_gradient
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Callable, Sequence, Tuple
-    from manimlib.typing import ManimColor, Vect3
+    from typing import Callable, Iterable, Sequence, Tuple
+    from manimlib.mobject.coordinate_systems import CoordinateSystem
+    from manimlib.typing import ManimColor, Vect3, Vect3Array, Self
 
 
 class ParametricCurve(VMobject):
@@ -20,9 +26,20 @@ class ParametricCurve(VMobject):
         t_func: Callable[[float], Sequence[float] | Vect3],
         t_range: Tuple[float, float, float] = (0, 1, 0.1),
         epsilon: float = 1e-8,
-        # TODO, automatically figure out discontinuities
+        # Known jumps, which adaptive sampling would otherwise find
         discontinuities: Sequence[float] = [],
         use_smoothing: bool = True,
+        # If True, t_func is called on whole arrays of t values,
+        # and should return an array with one point per value
+        vectorized: bool = False,
+        # If True, the step of t_range only sets the initial sampling,
+        # which is then refined and coarsened so as to stay within
+        # tolerance of the curve, and jumps are found automatically
+        adaptive: bool = False,
+        # Maximum distance between chords and the curve, here about two
+        # pixels, with the smoothed path ending up considerably closer
+        tolerance: float = 2 * FRAME_WIDTH / DEFAULT_PIXEL_WIDTH,
+        max_refinements: int = 10,
         **kwargs
     ):
         self.t_func = t_func
@@ -30,11 +47,20 @@ class ParametricCurve(VMobject):
         self.epsilon = epsilon
         self.discontinuities = discontinuities
         self.use_smoothing = use_smoothing
+        self.vectorized = vectorized
+        self.adaptive = adaptive
+        self.tolerance = tolerance
+        self.max_refinements = max_refinements
         super().__init__(**kwargs)
 
     def get_point_from_function(self, t: float) -> Vect3:
         return np.array(self.t_func(t))
 
+    def get_points_from_function(self, ts: np.ndarray) -> Vect3Array:
+        if self.vectorized:
+            return np.array(self.t_func(ts), dtype=float).reshape((len(ts), -1))
+        return np.array([self.t_func(t) for t in ts])
+
     def init_points(self):
         t_min, t_max, step = self.t_range
 
@@ -43,14 +69,142 @@ class ParametricCurve(VMobject):
         boundary_times = [t_min, t_max, *(jumps - self.epsilon), *(jumps + self.epsilon)]
         boundary_times.sort()
         for t1, t2 in zip(boundary_times[0::2], boundary_times[1::2]):
-            t_range = [*np.arange(t1, t2, step), t2]
-            points = np.array([self.t_func(t) for t in t_range])
+            if self.adaptive:
+                for ts, points in self.get_adaptive_samples(t1, t2, step):
+                    self.add_sampled_subpath(ts, points)
+                continue
+            t_range = np.array([*np.arange(t1, t2, step), t2])
+            points = self.get_points_from_function(t_range)
             self.start_new_path(points[0])
             self.add_points_as_corners(points[1:])
-        if self.use_smoothing:
+        if self.use_smoothing and not self.adaptive:
             self.make_smooth(approx=True)
         if not self.has_points():
-            self.set_points(np.array([self.t_func(t_min)]))
+            self.set_points(self.get_points_from_function(np.array([t_min])))
+        return self
+
+    def get_adaptive_samples(
+        self,
+        t1: float,
+        t2: float,
+        step: float
+    ) -> list[tuple[np.ndarray, Vect3Array]]:
+        """
+        Samples t_func between t1 and t2, starting from intervals of at most
+        step and halving those whose chord strays from the curve by more than
+        tolerance, then merging neighboring intervals wherever the merged chord
+        still stays within tolerance.  An interval whose chord fails to shrink
+        as it is halved is taken to be a jump, and the curve is also broken
+        around any non-finite values.  Returns the sample times and points
+        for each unbroken stretch of the curve.
+        """
+        tol = self.tolerance
+        ts = np.linspace(t1, t2, max(int(np.ceil((t2 - t1) / step)), 1) + 1)
+        points = self.get_points_from_function(ts)
+        # For each interval, a bound on how far the curve strays from its
+        # chord, whether it still needs refining, and whether the curve
+        # is broken there
+        errors = np.zeros(len(ts) - 1)
+        active = np.ones(len(ts) - 1, dtype=bool)
+        breaks = np.zeros(len(ts) - 1, dtype=bool)
+
+        with np.errstate(invalid="ignore"):
+            for depth in range(self.max_refinements + 1):
+                # Intervals with one non-finite end keep being refined,
+                # so as to close in on where the curve is defined
+                finite = np.isfinite(points).all(1)
+                breaks |= ~(finite[:-1] | finite[1:])
+                active &= ~breaks
+                indices = np.flatnonzero(active)
+                if len(indices) == 0:
+                    break
+                mid_ts = 0.5 * (ts[indices] + ts[indices + 1])
+                mid_points = self.get_points_from_function(mid_ts)
+                p0 = points[indices]
+                p1 = points[indices + 1]
+                mid_errors = np.linalg.norm(mid_points - 0.5 * (p0 + p1), axis=1)
+                within = mid_errors <= tol
+                errors[indices[within]] = mid_errors[within]
+                active[indices[within]] = False
+                if depth == self.max_refinements:
+                    # For a continuous curve, halving an interval halves its chord
+                    chord_lengths = np.linalg.norm(p1 - p0, axis=1)
+                    half_lengths = np.maximum(
+                        np.linalg.norm(mid_points - p0, axis=1),
+                        np.linalg.norm(p1 - mid_points, axis=1),
+                    )
+                    is_jump = ~(half_lengths <= 0.75 * chord_lengths)
+                    breaks[indices[~within]] = is_jump[~within]
+                    errors[indices[~within]] = np.inf
+                    break
+                split = indices[~within]
+                ts = np.insert(ts, split + 1, mid_ts[~within])
+                points = np.insert(points, split + 1, mid_points[~within], axis=0)
+                errors = np.insert(errors, split + 1, 0)
+                active = np.insert(active, split + 1, True)
+                breaks = np.insert(breaks, split + 1, False)
+
+            # Alternate between odd and even samples as candidates for
+            # removal, so that no two merges involve the same interval
+            parity = 1
+            n_idle_passes = 0
+            while n_idle_passes < 2 and len(ts) > 2:
+                ks = np.arange(parity, len(ts) - 1, 2)
+                parity = 3 - parity
+                p0, p1, p2 = points[ks - 1], points[ks], points[ks + 1]
+                chords = p2 - p0
+                alphas = np.divide(
+                    ((p1 - p0) * chords).sum(1),
+                    (chords * chords).sum(1),
+                    out=np.zeros(len(ks)),
+                    where=(chords != 0).any(1),
+                ).clip(0, 1)
+                dists = np.linalg.norm(p1 - p0 - alphas[:, np.newaxis] * chords, axis=1)
+                bounds = np.maximum(errors[ks - 1], errors[ks]) + dists
+                # Keep neighboring intervals within a factor of 2 of each
+                # other, for the sake of the parabolas fit while smoothing
+                dts = np.diff(ts)
+                padded_dts = np.hstack([np.inf, np.where(breaks, np.inf, dts), np.inf])
+                merged_dts = dts[ks - 1] + dts[ks]
+                graded = (merged_dts <= 2 * padded_dts[ks - 1]) & (merged_dts <= 2 * padded_dts[ks + 2])
+                mergeable = graded & (bounds <= tol) & ~breaks[ks - 1] & ~breaks[ks]
+                if not mergeable.any():
+                    n_idle_passes += 1
+                    continue
+                n_idle_passes = 0
+                ks = ks[mergeable]
+                errors[ks - 1] = bounds[mergeable]
+                ts = np.delete(ts, ks)
+                points = np.delete(points, ks, axis=0)
+                errors = np.delete(errors, ks)
+                breaks = np.delete(breaks, ks)
+
+        cuts = np.flatnonzero(breaks) + 1
+        return [
+            (sub_ts, sub_points)
+            for sub_ts, sub_points in zip(np.split(ts, cuts), np.split(points, cuts))
+            if len(sub_ts) > 1 and np.isfinite(sub_points).all()
+        ]
+
+    def add_sampled_subpath(self, ts: np.ndarray, points: Vect3Array) -> Self:
+        """
+        Adds a path through points sampled at times ts, smoothed with
+        handles that account for the spacing of those times
+        """
+        anchors = points
+        if self.use_smoothing:
+            handles = approx_smooth_quadratic_bezier_handles_for_times(anchors, ts)
+        else:
+            handles = 0.5 * (anchors[:-1] + anchors[1:])
+        handles = np.array(handles).reshape((-1, anchors.shape[1]))
+        # As in change_anchor_mode, avoid handles on top of anchors
+        a0, a1 = anchors[:-1], anchors[1:]
+        degenerate = (handles == a0).all(1) | (handles == a1).all(1)
+        handles[degenerate] = 0.5 * (a0[degenerate] + a1[degenerate])
+        subpath = np.empty((2 * len(anchors) - 1, anchors.shape[1]))
+        subpath[0::2] = anchors
+        subpath[1::2] = handles
+        self.add_subpath(subpath)
         return self
 
     def get_t_func(self):
@@ -79,7 +233,13 @@ class FunctionGraph(ParametricCurve):
         self.x_range = x_range
 
         def parametric_function(t):
-            return [t, function(t), 0]
+            # Works for single values of t, and for arrays of them
+            # when the function is vectorized
+            return np.stack([
+                t,
+                np.broadcast_to(function(t), np.shape(t)),
+                np.zeros_like(t),
+            ], axis=-1)
 
         super().__init__(parametric_function, self.x_range, **kwargs)
 
@@ -119,3 +279,139 @@ class ImplicitFunction(VMobject):
             self.add_points_as_corners(curve[1:])
         if use_smoothing:
             self.make_smooth()
+
+
+class RiemannRectangles(VMobject):
+    """
+    The rectangles of a Riemann sum for graph, as drawn by
+    CoordinateSystem.get_riemann_rectangles, but held as the subpaths
+    of a single VMobject, each with its own fill color.
+
+    Call update_heights, e.g. from an updater, to have the rectangles
+    follow changes to the function underlying graph.
+    """
+    # Each rectangle takes up four curves, and one more point marks its end
+    n_points_per_rectangle: int = 10
+
+    def __init__(
+        self,
+        axes: CoordinateSystem,
+        graph: ParametricCurve,
+        x_range: Sequence[float] | None = None,
+        dx: float | None = None,
+        input_sample_type: str = "left",
+        stroke_width: float = 1,
+        stroke_color: ManimColor = BLACK,
+        fill_opacity: float = 1,
+        colors: Iterable[ManimColor] = (BLUE, GREEN),
+        negative_color: ManimColor = RED,
+        stroke_background: bool = True,
+        **kwargs
+    ):
+        self.axes = axes
+        self.graph = graph
+        self.x_range = x_range
+        self.dx = dx
+        self.input_sample_type = input_sample_type
+        self.colors = list(colors)
+        self.negative_color = negative_color
+        self.positive = np.zeros(0, dtype=bool)
+        super().__init__(
+            stroke_width=stroke_width,
+            stroke_color=stroke_color,
+            fill_opacity=fill_opacity,
+            stroke_behind=stroke_background,
+            **kwargs
+        )
+
+    def init_points(self) -> None:
+        self.update_heights()
+
+    def init_colors(self) -> Self:
+        super().init_colors()
+        self.set_rectangle_colors()
+        return self
+
+    @staticmethod
+    def get_rectangle_points(lower_lefts: Vect3Array, upper_rights: Vect3Array) -> np.ndarray:
+        """
+        Points of each closed rectangle with the given corners, starting
+        from the upper right and going counterclockwise, as for Rectangle
+        """
+        corners = np.repeat(lower_lefts[:, np.newaxis, :], 5, axis=1)
+        corners[:, [0, 3, 4], 0] = upper_rights[:, np.newaxis, 0]
+        corners[:, [0, 1, 4], 1] = upper_rights[:, np.newaxis, 1]
+        points = np.empty((len(corners), 9, 3))
+        points[:, 0::2] = corners
+        points[:, 1::2] = 0.5 * (corners[:, :-1] + corners[:, 1:])
+        return points
+
+    def get_num_rectangles(self) -> int:
+        return len(self.positive)
+
+    def update_heights(self) -> Self:
+        lower_lefts, upper_rights, positive = self.axes.get_riemann_rectangle_bounds(
+            self.graph, self.x_range, self.dx, self.input_sample_type
+        )
+        n = len(positive)
+        points = np.empty((n, self.n_points_per_rectangle, 3))
+        points[:, :9] = self.get_rectangle_points(lower_lefts, upper_rights)
+        # A handle on top of the last anchor ends each rectangle's path
+        points[:, 9] = points[:, 8]
+        self.set_points(points.reshape((-1, 3))[:-1])
+
+        recolor = n != len(self.positive) or (positive != self.positive).any()
+        self.positive = positive
+        if recolor:
+            self.set_rectangle_colors()
+        return self
+
+    def repeat_rectangles(self, n: int) -> Self:
+        """
+        Repeats rectangles, as evenly as possible, so that there are n of
+        them, much as VGroup.add_n_more_submobjects repeats submobjects
+        """
+        n_rects = self.get_num_rectangles()
+        if n == n_rects or n_rects == 0:
+            return self
+        rect_indices = (np.arange(n) * n_rects) // n
+        n_ppr = self.n_points_per_rectangle
+        point_indices = (n_ppr * rect_indices[:, np.newaxis] + np.arange(n_ppr)).flatten()[:-1]
+        # The last rectangle has no point marking its end, but that
+        # point would have been the same as its last anchor
+        point_indices = np.minimum(point_indices, self.get_num_points() - 1)
+        self.set_data(self.data[point_indices])
+        self.positive = self.positive[rect_indices]
+        return self
+
+    def align_points(self, vmobject: VMobject) -> Self:
+        # Matching up subpaths by length, as VMobject does, would pair up
+        # rectangles, and colors, from all over, so rectangles are instead
+        # repeated in order
+        if isinstance(vmobject, RiemannRectangles):
+            n = max(self.get_num_rectangles(), vmobject.get_num_rectangles())
+            self.repeat_rectangles(n)
+            vmobject.repeat_rectangles(n)
+        return super().align_points(vmobject)
+
+    def get_fill_base_points(self) -> Vect3Array:
+        # Each rectangle is filled from its own first point, keeping the
+        # triangles drawn for it from stretching across all the others
+        n_ppr = self.n_points_per_rectangle
+        curve_starts = np.arange(0, self.get_num_points(), 2)
+        return self.data["point"][n_ppr * (curve_starts // n_ppr)]
+
+    @Mobject.affects_data
+    def set_rectangle_colors(self) -> Self:
+        """
+        Colors rectangles by a gradient through colors, except for those
+        below the x-axis, which get negative_color
+        """
+        n = self.get_num_rectangles()
+        if n == 0:
+            return self
+        rgbs = rgb_gradient(self.colors, n)
+        rgbs[~self.positive] = color_to_rgb(self.negative_color)
+        rgbs = np.repeat(rgbs, self.n_points_per_rectangle, axis=0)[:self.get_num_points()]
+        self.data["fill_rgba"][:, :3] = rgbs
+        return self
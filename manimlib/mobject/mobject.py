@@ -3,6 +3,7 @@ from __future__ import annotations
 import copy
 from functools import wraps
 import itertools as it
+import operator as op
 import os
 import pickle
 import random
@@ -12,6 +13,7 @@ import moderngl
 import numbers
 import numpy as np
 
+from manimlib.config import manim_config
 from manimlib.constants import DEFAULT_MOBJECT_TO_EDGE_BUFF
 from manimlib.constants import DEFAULT_MOBJECT_TO_MOBJECT_BUFF
 from manimlib.constants import DOWN, IN, LEFT, ORIGIN, OUT, RIGHT, UP
@@ -75,6 +77,9 @@ class Mobject(object):
     ])
     aligned_data_keys = ['point']
     pointlike_data_keys = ['point']
+    # Whether copies share their data array until either one changes it
+    copy_on_write_data: bool = bool(manim_config.mobject.copy_on_write_data)
+    instance_replicas: bool = bool(manim_config.mobject.instance_replicas)
 
     def __init__(
         self,
@@ -109,7 +114,12 @@ class Mobject(object):
         self._is_animating: bool = False
         self._needs_new_bounding_box: bool = True
         self._data_has_changed: bool = True
+        # Incremented whenever data changes, so that shader wrappers
+        # can tell which parts of their vertex buffers are stale
+        self._data_version: int = 0
         self.shader_code_replacements: dict[str, str] = dict()
+        # Identifies the group declared with use_instanced_rendering, if any
+        self.instance_group: Optional[int] = None
 
         self.init_data()
         self.init_uniforms()
@@ -202,8 +212,18 @@ class Mobject(object):
         """
         return _FunctionalUpdaterBuilder(self)
 
+    def ensure_data_is_writable(self) -> Self:
+        """
+        Data shared between copies is marked as read-only, so the first
+        of them about to change it needs its own array
+        """
+        if not self.data.flags.writeable:
+            self.data = self.data.copy()
+        return self
+
     def note_changed_data(self, recurse_up: bool = True) -> Self:
         self._data_has_changed = True
+        self._data_version += 1
         if recurse_up:
             for mob in self.parents:
                 mob.note_changed_data()
@@ -213,6 +233,7 @@ class Mobject(object):
     def affects_data(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
+            self.ensure_data_is_writable()
             result = func(self, *args, **kwargs)
             self.note_changed_data()
             return result
@@ -222,6 +243,8 @@ class Mobject(object):
     def affects_family_data(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(self, *args, **kwargs):
+            for mob in self.get_family():
+                mob.ensure_data_is_writable()
             result = func(self, *args, **kwargs)
             for mob in self.family_members_with_points():
                 mob.note_changed_data()
@@ -646,6 +669,14 @@ class Mobject(object):
             return result
         return wrapper
 
+    def __getstate__(self):
+        # Shader wrappers hold gpu resources, which can be neither
+        # copied nor pickled, and are rebuilt when next rendered
+        state = self.__dict__
+        if state.get("shader_wrapper") is not None or state.get("shader_wrappers"):
+            state = dict(state, shader_wrapper=None, shader_wrappers=[], _data_has_changed=True)
+        return state
+
     @stash_mobject_pointers
     def serialize(self) -> bytes:
         return pickle.dumps(self)
@@ -690,13 +721,17 @@ class Mobject(object):
         result._data_has_changed = True
         result.shader_wrapper = None
 
-        family = self.get_family()
+        family_indices = {id(mob): index for index, mob in enumerate(self.get_family())}
         for attr, value in self.__dict__.items():
             if isinstance(value, Mobject) and value is not self:
-                if value in family:
-                    setattr(result, attr, result.family[family.index(value)])
+                if id(value) in family_indices:
+                    setattr(result, attr, result.family[family_indices[id(value)]])
             elif isinstance(value, np.ndarray):
-                setattr(result, attr, value.copy())
+                if attr == "data" and self.copy_on_write_data:
+                    # Both now hold the same read-only array, see ensure_data_is_writable
+                    value.flags.writeable = False
+                else:
+                    setattr(result, attr, value.copy())
         return result
 
     def generate_target(self, use_deepcopy: bool = False) -> Self:
@@ -778,7 +813,10 @@ class Mobject(object):
 
     def replicate(self, n: int) -> Self:
         group_class = self.get_group_class()
-        return group_class(*(self.copy() for _ in range(n)))
+        group = group_class(*(self.copy() for _ in range(n)))
+        if self.instance_replicas:
+            group.use_instanced_rendering()
+        return group
 
     def get_grid(
         self,
@@ -1813,6 +1851,7 @@ class Mobject(object):
     ) -> Self:
         keys = [k for k in self.data.dtype.names if k not in self.locked_data_keys]
         if keys:
+            self.ensure_data_is_writable()
             self.note_changed_data()
         for key in keys:
             md1 = mobject1.data[key]
@@ -1942,6 +1981,18 @@ class Mobject(object):
             mob.depth_test = False
         return self
 
+    @affects_shader_info_id
+    def use_instanced_rendering(self, value: bool = True, recurse: bool = True) -> Self:
+        """
+        Declares that the submobjects are meant to be copies of one another,
+        differing only by a shift. When a batch of them drawn with the same
+        shader is found to be so, it's drawn from one copy of their data,
+        and otherwise as usual.
+        """
+        for mob in self.get_family(recurse):
+            mob.instance_group = id(self) if value else None
+        return self
+
     def set_clip_plane(
         self,
         vect: Vect3 | None = None,
@@ -2042,11 +2093,45 @@ class Mobject(object):
         result = []
         for submobs, sid in batches:
             shader_wrapper = submobs[0].shader_wrapper
-            data_list = [sm.get_shader_data() for sm in submobs]
-            shader_wrapper.read_in(data_list)
+            self.read_in_shader_data(shader_wrapper, submobs)
             result.append(shader_wrapper)
         return result
 
+    @staticmethod
+    def read_in_shader_data(shader_wrapper: ShaderWrapper, submobs: list[Mobject]) -> None:
+        """
+        If the same submobjects were the last ones read into this shader
+        wrapper, only the data of those which have changed since is rewritten.
+        Otherwise, or if the lengths of their data have changed, all data
+        is concatenated and uploaded again, unless the submobjects all belong
+        to one group marked for instanced rendering, and the shader wrapper
+        can draw them that way.
+        """
+        versions = [sm._data_version for sm in submobs]
+        prev_mobs = shader_wrapper.read_in_mobjects
+        if len(prev_mobs) == len(submobs) and all(map(op.is_, prev_mobs, submobs)):
+            changed = [
+                index
+                for index, (v1, v2) in enumerate(zip(versions, shader_wrapper.read_in_versions))
+                if v1 != v2
+            ]
+            if not changed and shader_wrapper.vbo is not None:
+                return
+            # When most of the data is changing, a single upload is quicker
+            if 2 * len(changed) <= len(submobs):
+                index_to_data = {i: submobs[i].get_shader_data() for i in changed}
+                if shader_wrapper.read_in_changes(index_to_data):
+                    shader_wrapper.read_in_versions = versions
+                    return
+
+        data_list = [sm.get_shader_data() for sm in submobs]
+        instance_group = submobs[0].instance_group
+        instanced = instance_group is not None and all(sm.instance_group == instance_group for sm in submobs)
+        if not (instanced and shader_wrapper.read_in_instances(data_list)):
+            shader_wrapper.read_in(data_list)
+        shader_wrapper.read_in_mobjects = list(submobs)
+        shader_wrapper.read_in_versions = versions
+
     def get_shader_data(self) -> np.ndarray:
         indices = self.get_shader_vert_indices()
         if indices is not None:
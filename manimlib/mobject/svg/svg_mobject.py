@@ -5,6 +5,8 @@ from xml.etree import ElementTree as ET
 import numpy as np
 import svgelements as se
 import io
+import os
+import zipfile
 from pathlib import Path
 
 from manimlib.constants import RIGHT
@@ -18,8 +20,12 @@ from manimlib.mobject.geometry import Rectangle
 from manimlib.mobject.geometry import RoundedRectangle
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.utils.bezier import quadratic_bezier_points_for_arc
+from manimlib.utils.cache import SVG_CACHE_SUBDIR
+from manimlib.utils.directories import get_cache_dir
 from manimlib.utils.images import get_full_vector_image_path
 from manimlib.utils.iterables import hash_obj
+from manimlib.utils.iterables import resize_preserving_order
+from manimlib.utils.simple_functions import hash_string
 from manimlib.utils.space_ops import rotation_about_z
 
 from typing import TYPE_CHECKING
@@ -29,6 +35,9 @@ if TYPE_CHECKING:
 
 SVG_HASH_TO_MOB_MAP: dict[int, list[VMobject]] = {}
 PATH_TO_POINTS: dict[str, Vect3Array] = {}
+# Change this whenever parsing would give different results, so that
+# geometry saved to the cache by earlier versions is no longer used
+SVG_CACHE_VERSION = 2
 
 
 def get_svg_content_height(svg_string: str) -> float:
@@ -50,6 +59,89 @@ def _convert_point_to_3d(x: float, y: float) -> np.ndarray:
     return np.array([x, y, 0.0])
 
 
+def get_svg_cache_path(key: str) -> Path:
+    return Path(get_cache_dir(), SVG_CACHE_SUBDIR, key + ".npz")
+
+
+def save_to_svg_cache(key: str, submobs: list[VMobject]) -> None:
+    """
+    Saves the data of each submobject, along with its subpath structure,
+    uniforms, path string and any label, into one .npz file.
+
+    Only svgs made up entirely of paths are saved, since other shapes,
+    such as Circle or Line, carry more state than their data
+    """
+    path = get_svg_cache_path(key)
+    if path.exists() or len(submobs) == 0:
+        return
+    if any(type(sm) is not VMobjectFromSVGPath for sm in submobs):
+        return
+    if any(sm.data.dtype != VMobject.data_dtype for sm in submobs):
+        return
+    arrays = dict(
+        data=np.concatenate([sm.data for sm in submobs]),
+        lengths=np.array([len(sm.data) for sm in submobs]),
+        subpath_ends=np.concatenate([sm.get_subpath_end_indices() for sm in submobs]),
+        n_subpaths=np.array([len(sm.get_subpath_end_indices()) for sm in submobs]),
+        path_strings=np.array([sm.path_obj.d() for sm in submobs]),
+    )
+    for name in submobs[0].uniforms:
+        arrays["uniform_" + name] = np.array([sm.uniforms[name] for sm in submobs])
+    if all(hasattr(sm, "label") for sm in submobs):
+        arrays["labels"] = np.array([sm.label for sm in submobs])
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written to a temporary file first, since other processes,
+        # such as those of a parallel render, may read it at any time
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "wb") as fp:
+            np.savez(fp, **arrays)
+        os.replace(temp_path, path)
+    except OSError as err:
+        log.debug(f"Could not write to svg cache: {err}")
+
+
+def load_from_svg_cache(key: str, path_string_config: dict) -> list[VMobjectFromSVGPath] | None:
+    try:
+        with np.load(get_svg_cache_path(key), allow_pickle=False) as arrays:
+            data = arrays["data"]
+            lengths = arrays["lengths"]
+            subpath_ends = np.split(arrays["subpath_ends"], np.cumsum(arrays["n_subpaths"])[:-1])
+            path_strings = arrays["path_strings"]
+            uniforms = {
+                name[len("uniform_"):]: arrays[name]
+                for name in arrays.files
+                if name.startswith("uniform_")
+            }
+            labels = arrays["labels"] if "labels" in arrays else None
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+        return None
+    if data.dtype != VMobject.data_dtype:
+        return None
+
+    ends = np.cumsum(lengths)
+    # Copying this is much faster than building each path anew
+    template = VMobjectFromSVGPath(se.Path(), **path_string_config)
+    if set(uniforms) != set(template.uniforms):
+        return None
+    submobs = []
+    for index, (end, length) in enumerate(zip(ends, lengths)):
+        submob = template.copy()
+        submob.path_obj = se.Path(str(path_strings[index]))
+        # Resizing this way first is much faster than set_data resizing
+        submob.resize_points(length, resize_func=resize_preserving_order)
+        submob.set_data(data[end - length:end])
+        submob.subpath_end_indices = subpath_ends[index]
+        submob.set_uniforms({
+            name: values[index] if values.ndim > 1 else values[index].item()
+            for name, values in uniforms.items()
+        })
+        if labels is not None:
+            submob.label = int(labels[index])
+        submobs.append(submob)
+    return submobs
+
+
 class SVGMobject(VMobject):
     file_name: str = ""
     height: float | None = 2.0
@@ -125,7 +217,12 @@ class SVGMobject(VMobject):
         if hash_val in SVG_HASH_TO_MOB_MAP:
             submobs = [sm.copy() for sm in SVG_HASH_TO_MOB_MAP[hash_val]]
         else:
-            submobs = self.mobjects_from_svg_string(self.svg_string)
+            # Unlike hash_val, this is the same from one run to the next
+            cache_key = hash_string(f"{SVG_CACHE_VERSION}{VMobject.data_dtype}{self.hash_seed}")
+            submobs = load_from_svg_cache(cache_key, self.path_string_config)
+            if submobs is None:
+                submobs = self.mobjects_from_svg_string(self.svg_string)
+                save_to_svg_cache(cache_key, submobs)
             SVG_HASH_TO_MOB_MAP[hash_val] = [sm.copy() for sm in submobs]
 
         self.add(*submobs)
@@ -26,6 +26,7 @@ from manimlib.utils.bezier import find_intersection
 from manimlib.utils.bezier import outer_interpolate
 from manimlib.utils.bezier import partial_quadratic_bezier_points
 from manimlib.utils.bezier import quadratic_bezier_points_for_arc
+from manimlib.utils.bezier import subdivide_quadratic_bezier_path
 from manimlib.utils.color import color_gradient
 from manimlib.utils.color import rgb_to_hex
 from manimlib.utils.iterables import make_even
@@ -53,6 +54,7 @@ if TYPE_CHECKING:
     from typing import Callable, Tuple, Any, Optional
     from manimlib.typing import ManimColor, Vect3, Vect4, Vect3Array, Self
     from moderngl.context import Context
+    from manimlib.shader_wrapper import ShaderWrapper
 
 
 class VMobject(Mobject):
@@ -75,6 +77,9 @@ class VMobject(Mobject):
         "bevel": 2,
         "miter": 3,
     }
+    # Shared counts of how often get_triangulation could reuse a cached result
+    triangulation_cache_hits: int = 0
+    triangulation_cache_misses: int = 0
 
     def __init__(
         self,
@@ -116,6 +121,8 @@ class VMobject(Mobject):
         self.needs_new_unit_normal = True
         self.subpath_end_indices = None
         self.outer_vert_indices = np.zeros(0, dtype=int)
+        self.triangulation_key = None
+        self.triangulation = np.zeros(0, dtype='i4')
 
         super().__init__(**kwargs)
 
@@ -165,6 +172,7 @@ class VMobject(Mobject):
         if border_width is not None:
             self.border_width = border_width
             for mob in self.get_family(recurse):
+                mob.ensure_data_is_writable()
                 data = mob.data if mob.has_points() > 0 else mob._data_defaults
                 data["fill_border_width"] = border_width
         return self
@@ -182,6 +190,7 @@ class VMobject(Mobject):
 
         if width is not None:
             for mob in self.get_family(recurse):
+                mob.ensure_data_is_writable()
                 data = mob.data if mob.get_num_points() > 0 else mob._data_defaults
                 if isinstance(width, (float, int, np.floating)):
                     data['stroke_width'][:, 0] = width
@@ -606,18 +615,14 @@ class VMobject(Mobject):
         for vmob in self.get_family(recurse):
             if not vmob.has_points():
                 continue
-            new_points = [vmob.get_points()[0]]
-            for tup in vmob.get_bezier_tuples():
-                n_divisions = tuple_to_subdivisions(*tup)
-                if n_divisions > 0:
-                    alphas = np.linspace(0, 1, n_divisions + 2)
-                    new_points.extend([
-                        partial_quadratic_bezier_points(tup, a1, a2)[1:]
-                        for a1, a2 in zip(alphas, alphas[1:])
-                    ])
-                else:
-                    new_points.append(tup[1:])
-            vmob.set_points(np.vstack(new_points))
+            n_divisions = [
+                tuple_to_subdivisions(*tup)
+                for tup in vmob.get_bezier_tuples()
+            ]
+            new_points = subdivide_quadratic_bezier_path(
+                vmob.get_points(), np.maximum(n_divisions, 0) + 1
+            )
+            vmob.set_points(new_points)
         return self
 
     def subdivide_sharp_curves(
@@ -755,8 +760,7 @@ class VMobject(Mobject):
         # curves in a row, we also check that the following
         # anchor is genuinely distinct
         is_end = (a0 == h).all(1) & (abs(h - a1) > atol).any(1)
-        end_indices = (2 * n for n, end in enumerate(is_end) if end)
-        return np.array([*end_indices, len(points) - 1])
+        return np.append(2 * np.flatnonzero(is_end), len(points) - 1)
 
     def get_subpath_end_indices(self) -> np.ndarray:
         if self.subpath_end_indices is None:
@@ -773,6 +777,20 @@ class VMobject(Mobject):
     def get_subpaths(self) -> list[Vect3Array]:
         return self.get_subpaths_from_points(self.get_points())
 
+    def get_subpaths_sorted_by_length(self) -> list[Vect3Array]:
+        """
+        Subpaths in order of decreasing length of the polygon
+        through all their points, handles included
+        """
+        points = self.get_points()
+        end_indices = self.get_subpath_end_indices()
+        start_indices = np.array([0, *(end_indices[:-1] + 2)])
+        steps = np.linalg.norm(np.diff(points, axis=0), axis=1)
+        distances = np.append(0, steps.cumsum(dtype=float))
+        lengths = distances[end_indices] - distances[start_indices]
+        subpaths = self.get_subpaths()
+        return [subpaths[i] for i in np.argsort(-lengths, kind="stable")]
+
     def get_nth_curve_points(self, n: int) -> Vect3Array:
         assert n < self.get_num_curves()
         return self.get_points()[2 * n:2 * n + 3]
@@ -909,6 +927,7 @@ class VMobject(Mobject):
         else:
             p = self.get_points()
             normal = get_unit_normal(p[1] - p[0], p[2] - p[1])
+        self.ensure_data_is_writable()
         self.data["base_normal"][1::2] = normal
         self.needs_new_unit_normal = False
         return normal
@@ -949,13 +968,11 @@ class VMobject(Mobject):
                 mob.start_new_path(mob.get_center())
 
         # Figure out what the subpaths are, and align
-        subpaths1 = self.get_subpaths()
-        subpaths2 = vmobject.get_subpaths()
-        for subpaths in [subpaths1, subpaths2]:
-            subpaths.sort(key=lambda sp: -sum(
-                get_norm(p2 - p1)
-                for p1, p2 in zip(sp, sp[1:])
-            ))
+        # with the longest first
+        subpaths1, subpaths2 = [
+            mob.get_subpaths_sorted_by_length()
+            for mob in (self, vmobject)
+        ]
         n_subpaths = max(len(subpaths1), len(subpaths2))
 
         # Start building new ones
@@ -999,31 +1016,30 @@ class VMobject(Mobject):
         if len(points) == 1:
             return np.repeat(points, 2 * n + 1, 0)
 
-        bezier_tuples = list(self.get_bezier_tuples_from_points(points))
+        # Curves are weighted by the distance between their anchors,
+        # or by 0 when they are null
         atol = self.tolerance_for_point_equality
-        norms = [
-            0 if get_norm(tup[1] - tup[0]) < atol else get_norm(tup[2] - tup[0])
-            for tup in bezier_tuples
-        ]
-        # Calculate insertions per curve (ipc)
-        ipc = np.zeros(len(bezier_tuples), dtype=int)
-        for _ in range(n):
-            index = np.argmax(norms)
-            ipc[index] += 1
-            norms[index] *= ipc[index] / (ipc[index] + 1)
-
-        new_points = [points[0]]
-        for tup, n_inserts in zip(bezier_tuples, ipc):
-            # What was once a single quadratic curve defined
-            # by "tup" will now be broken into n_inserts + 1
-            # smaller quadratic curves
-            alphas = np.linspace(0, 1, n_inserts + 2)
-            for a1, a2 in zip(alphas, alphas[1:]):
-                new_points.extend(partial_quadratic_bezier_points(tup, a1, a2)[1:])
-        return np.vstack(new_points)
+        a0, h, a1 = points[0:-1:2], points[1::2], points[2::2]
+        norms = np.linalg.norm(a1 - a0, axis=1)
+        norms[np.linalg.norm(h - a0, axis=1) < atol] = 0
+        if norms.sum() == 0:
+            norms[:] = 1
+        # Calculate insertions per curve (ipc) in proportion to those weights,
+        # handing out what rounding down leaves by largest remainder. Remainders
+        # are compared before dividing by the total, which could round nearly
+        # equal curves out of order, and ties go to the larger curve, so evenly
+        # sized curves get what handing out one insertion at a time would give
+        total = norms.sum()
+        ipc = np.floor(n * norms / total).astype(int)
+        n_left = max(n - ipc.sum(), 0)
+        ipc[np.lexsort((-norms, ipc * total - n * norms))[:n_left]] += 1
+        # What was once a single quadratic curve will now be
+        # broken into n_inserts + 1 smaller quadratic curves
+        return subdivide_quadratic_bezier_path(points, ipc + 1)
 
     def pointwise_become_partial(self, vmobject: VMobject, a: float, b: float) -> Self:
         assert isinstance(vmobject, VMobject)
+        self.ensure_data_is_writable()
         vm_points = vmobject.get_points()
         self.data["joint_angle"] = vmobject.data["joint_angle"]
         if a <= 0 and b >= 1:
@@ -1099,7 +1115,26 @@ class VMobject(Mobject):
 
         v01s = points[1::2] - points[0:-1:2]
         v12s = points[2::2] - points[1::2]
-        curve_orientations = np.sign(cross2d(v01s, v12s))
+        crosses = cross2d(v01s, v12s)
+        curve_orientations = np.sign(crosses)
+        end_indices = self.get_subpath_end_indices()
+
+        # Which anchors end subpaths and which curves are concave determine
+        # the polygon to triangulate. With those unchanged, the last result
+        # is reused so long as it still tiles the polygon, as it will after
+        # any affine map, but need not after moving individual points. The
+        # sign for a straight curve is only rounding error, so is left out.
+        straight = np.abs(crosses) <= 1e-5 * np.sqrt((v01s**2).sum(1) * (v12s**2).sum(1))
+        key = (end_indices, np.where(straight, 0, curve_orientations).astype(np.int8))
+        if self.triangulation_key is not None and all(
+            np.array_equal(arr1, arr2)
+            for arr1, arr2 in zip(key, self.triangulation_key)
+        ) and self.triangles_share_orientation(
+            points, self.triangulation[len(self.get_outer_vert_indices()):]
+        ):
+            VMobject.triangulation_cache_hits += 1
+            return self.triangulation
+        VMobject.triangulation_cache_misses += 1
 
         concave_parts = curve_orientations < 0
 
@@ -1112,7 +1147,6 @@ class VMobject(Mobject):
         inner_vert_indices.sort()
         # Even indices correspond to anchors, and `end_indices // 2`
         # shows which anchors are considered end points
-        end_indices = self.get_subpath_end_indices()
         counts = np.arange(1, len(inner_vert_indices) + 1)
         rings = counts[inner_vert_indices % 2 == 0][end_indices // 2]
 
@@ -1129,8 +1163,36 @@ class VMobject(Mobject):
 
         ovi = self.get_outer_vert_indices()
         tri_indices = np.hstack([ovi, inner_tri_indices])
+        self.triangulation_key = (end_indices.copy(), key[1])
+        self.triangulation = tri_indices
         return tri_indices
 
+    @staticmethod
+    def triangles_share_orientation(points: Vect3Array, tri_indices: np.ndarray) -> bool:
+        """
+        The signed areas of the triangles in a triangulation always sum to that
+        of the polygon, so its triangles overlap, rather than tiling the polygon,
+        exactly when some have flipped relative to the others
+        """
+        if len(tri_indices) == 0:
+            return True
+        tris = points[tri_indices].reshape((-1, 3, 3))
+        areas = cross2d(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+        tol = 1e-8 * np.abs(areas).sum()
+        return not ((areas > tol).any() and (areas < -tol).any())
+
+    @staticmethod
+    def get_triangulation_cache_stats() -> dict[str, int]:
+        return dict(
+            hits=VMobject.triangulation_cache_hits,
+            misses=VMobject.triangulation_cache_misses,
+        )
+
+    @staticmethod
+    def reset_triangulation_cache_stats() -> None:
+        VMobject.triangulation_cache_hits = 0
+        VMobject.triangulation_cache_misses = 0
+
     def refresh_joint_angles(self) -> Self:
         for mob in self.get_family():
             mob.needs_new_joint_angles = True
@@ -1141,21 +1203,58 @@ class VMobject(Mobject):
         The 'joint product' is a 4-vector holding the cross and dot
         product between tangent vectors at a joint
         """
-        if not self.needs_new_joint_angles and not refresh:
-            return self.data["joint_angle"][:, 0]
-
-        if "joint_angle" in self.locked_data_keys:
-            return self.data["joint_angle"][:, 0]
-
-        self.needs_new_joint_angles = False
-        self._data_has_changed = True
-
-        # Rotate points such that positive z direction is the normal
-        points = self.get_points() @ rotation_between_vectors(OUT, self.get_unit_normal())
-
-        if len(points) < 3:
-            return self.data["joint_angle"][:, 0]
+        self.update_joint_angles([self], refresh)
+        return self.data["joint_angle"][:, 0]
 
+    @staticmethod
+    def update_joint_angles(vmobjects: Iterable[VMobject], refresh: bool = False) -> None:
+        """
+        Recomputes the joint angles of all given vmobjects which need it
+        together, treating their points as one long list of subpaths
+        """
+        mobs = []
+        for vmob in vmobjects:
+            if not vmob.needs_new_joint_angles and not refresh:
+                continue
+            if "joint_angle" in vmob.locked_data_keys:
+                continue
+            vmob.needs_new_joint_angles = False
+            vmob._data_has_changed = True
+            vmob.ensure_data_is_writable()
+            if vmob.get_num_points() >= 3:
+                mobs.append(vmob)
+
+        if not mobs:
+            return
+
+        # Rotate points such that positive z direction is the normal.
+        # Each list of points is separated from the next by a copy of its
+        # last point, so that the next one begins on an anchor
+        point_lists = []
+        end_index_lists = []
+        offsets = []
+        offset = 0
+        for mob in mobs:
+            points = mob.get_points() @ rotation_between_vectors(OUT, mob.get_unit_normal())
+            point_lists.extend([points, points[-1:]])
+            end_index_lists.append(mob.get_subpath_end_indices() + offset)
+            offsets.append(offset)
+            offset += len(points) + 1
+
+        angles = VMobject.get_joint_angles_from_points(
+            np.vstack(point_lists[:-1]),
+            np.hstack(end_index_lists),
+            np.array(offsets),
+        )
+        for mob, offset in zip(mobs, offsets):
+            mob.data["joint_angle"][:, 0] = angles[offset:offset + mob.get_num_points()]
+
+    @staticmethod
+    def get_joint_angles_from_points(
+        points: Vect3Array,
+        end_indices: np.ndarray,
+        path_list_starts: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
         # Find all the unit tangent vectors at each joint
         a0, h, a1 = points[0:-1:2], points[1::2], points[2::2]
         a0_to_h = h - a0
@@ -1170,19 +1269,23 @@ class VMobject(Mobject):
         v_in[2::2] = h_to_a1
         v_out[0:-1:2] = a0_to_h
         v_out[1::2] = h_to_a1
+        # Nothing comes into the start of a separate list of points
+        if path_list_starts is not None:
+            v_in[path_list_starts] = 0
 
         # Joint up closed loops, or mark unclosed paths as such
-        ends = self.get_subpath_end_indices()
-        starts = [0, *(e + 2 for e in ends[:-1])]
-        for start, end in zip(starts, ends):
-            if start == end:
-                continue
-            if (points[start] == points[end]).all():
-                v_in[start] = v_out[end - 1]
-                v_out[end] = v_in[start + 1]
-            else:
-                v_in[start] = v_out[start]
-                v_out[end] = v_in[end]
+        starts = np.append(0, end_indices[:-1] + 2)
+        non_empty = starts != end_indices
+        starts = starts[non_empty]
+        ends = end_indices[non_empty]
+        closed = (points[starts] == points[ends]).all(1)
+        closed_starts, closed_ends = starts[closed], ends[closed]
+        open_starts, open_ends = starts[~closed], ends[~closed]
+
+        v_in[closed_starts] = v_out[closed_ends - 1]
+        v_out[closed_ends] = v_in[closed_starts + 1]
+        v_in[open_starts] = v_out[open_starts]
+        v_out[open_ends] = v_in[open_ends]
 
         # Find the angles between vectors into each vertex, and out of it
         angles_in = np.arctan2(v_in[:, 1], v_in[:, 0])
@@ -1190,8 +1293,7 @@ class VMobject(Mobject):
         angle_diffs = angles_out - angles_in
         angle_diffs[angle_diffs < -PI] += TAU
         angle_diffs[angle_diffs > PI] -= TAU
-        self.data["joint_angle"][:, 0] = angle_diffs
-        return self.data["joint_angle"][:, 0]
+        return angle_diffs
 
     def lock_matching_data(self, vmobject1: VMobject, vmobject2: VMobject) -> Self:
         for mob in [self, vmobject1, vmobject2]:
@@ -1226,6 +1328,7 @@ class VMobject(Mobject):
         for mob in self.get_family(recurse):
             if not mob.has_points():
                 continue
+            mob.ensure_data_is_writable()
             inner_ends = mob.get_subpath_end_indices()[:-1]
             mob.data["point"][inner_ends + 1] = mob.data["point"][inner_ends + 2]
             mob.data["base_normal"][1::2] *= -1  # Invert normal vector
@@ -1276,11 +1379,18 @@ class VMobject(Mobject):
 
     def set_animating_status(self, is_animating: bool, recurse: bool = True):
         super().set_animating_status(is_animating, recurse)
-        for submob in self.get_family(recurse):
-            submob.get_joint_angles(refresh=True)
+        self.update_joint_angles(self.get_family(recurse), refresh=True)
         return self
 
     # For shaders
+    def get_shader_wrapper_list(self, ctx: Context) -> list[ShaderWrapper]:
+        # Bring the joint angles of the whole family up to date in one pass
+        self.update_joint_angles(
+            sm for sm in self.family_members_with_points()
+            if isinstance(sm, VMobject)
+        )
+        return super().get_shader_wrapper_list(ctx)
+
 
     def init_shader_wrapper(self, ctx: Context):
         self.shader_wrapper = VShaderWrapper(
@@ -1302,9 +1412,18 @@ class VMobject(Mobject):
     def get_shader_data(self) -> np.ndarray:
         # Do we want this elsewhere? Say whenever points are refreshed or something?
         self.get_joint_angles()
-        self.data["base_normal"][0::2] = self.data["point"][0]
+        self.ensure_data_is_writable()
+        self.data["base_normal"][0::2] = self.get_fill_base_points()
         return super().get_shader_data()
 
+    def get_fill_base_points(self) -> Vect3 | Vect3Array:
+        """
+        Fill is drawn as triangles from a base point to each curve, whose
+        overlaps cancel out, and this gives that point, either one for all
+        curves or one for each of them
+        """
+        return self.data["point"][0]
+
     def get_shader_vert_indices(self) -> Optional[np.ndarray]:
         return self.get_outer_vert_indices()
 
@@ -10,6 +10,7 @@ from manimlib.constants import DEFAULT_MOBJECT_COLOR
 from manimlib.animation.indication import VShowPassingFlash
 from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
+from manimlib.utils.bezier import approx_smooth_quadratic_bezier_handles
 from manimlib.utils.bezier import interpolate
 from manimlib.utils.bezier import inverse_interpolate
 from manimlib.utils.color import get_colormap_list
@@ -74,6 +75,23 @@ def ode_solution_points(function, state0, time, dt=0.01):
     return solution.y.T
 
 
+def runge_kutta_step(
+    function: Callable[[VectArray], VectArray],
+    states: VectArray,
+    dt: float
+) -> VectArray:
+    """
+    Advances all rows of states by one step of the classic fourth order
+    Runge-Kutta method, with function taking in and returning arrays of
+    the same shape as states
+    """
+    k1 = function(states)
+    k2 = function(states + 0.5 * dt * k1)
+    k3 = function(states + 0.5 * dt * k2)
+    k4 = function(states + dt * k3)
+    return states + (dt / 6) * (k1 + 2 * k2 + 2 * k3 + k4)
+
+
 def move_along_vector_field(
     mobject: Mobject,
     func: Callable[[Vect3], Vect3]
@@ -281,6 +299,7 @@ class VectorField(VMobject):
         dist_to_head_base = np.clip(drawn_norms - tip_len, 0, np.inf)  # Mixing units!
 
         # Set all points
+        self.ensure_data_is_writable()
         points = self.get_points()
         points[0::8] = self.sample_points
         points[2::8] = self.sample_points + dist_to_head_base * unit_outputs
@@ -296,18 +315,16 @@ class VectorField(VMobject):
         width_scalars = np.repeat(width_scalars, 8)[:-1]
         self.get_stroke_widths()[:] = width_scalars * width_arr
 
-        # Potentially adjust opacity and color
+        # Potentially adjust opacity and color, evaluating each once per
+        # vector, and then repeating it for the points of that vector
         if self.color_map is not None:
-            self.get_stroke_colors()  # Ensures the array is updated to appropriate length
             low, high = self.magnitude_range
-            self.data['stroke_rgba'][:, :3] = self.color_map(
-                inverse_interpolate(low, high, np.repeat(output_norms, 8)[:-1])
-            )[:, :3]
+            rgbas = self.color_map(inverse_interpolate(low, high, output_norms[:, 0]))
+            self.data['stroke_rgba'][:, :3] = np.repeat(rgbas[:, :3], 8, axis=0)[:-1]
 
         if self.norm_to_opacity_func is not None:
-            self.get_stroke_opacities()[:] = self.norm_to_opacity_func(
-                np.repeat(output_norms, 8)[:-1]
-            )
+            opacities = self.norm_to_opacity_func(output_norms[:, 0])
+            self.get_stroke_opacities()[:] = np.repeat(opacities, 8)[:-1]
 
         self.note_changed_data()
         return self
@@ -389,17 +406,81 @@ class StreamLines(VGroup):
         return self.coordinate_system.c2p(*out_coords.T) - origin
 
     def draw_lines(self) -> None:
-        lines = []
-
         # Todo, it feels like coordinate system should just have
         # the ODE solver built into it, no?
+        cs = self.coordinate_system
+        start_coords = self.get_sample_coords()
+        n_lines = len(start_coords)
+        n_steps = min(len(np.arange(0, self.solution_time, self.dt)) - 1, self.max_time_steps)
+
+        # All lines are advanced together, each until it leaves the region
+        # given by cutoff_norm, exceeds arc_len, or the solution breaks down
+        solution_coords = np.zeros((n_steps + 1, *start_coords.shape))
+        solution_coords[0] = start_coords
+        solution_points = np.zeros((n_steps + 1, n_lines, 3))
+        solution_points[0] = cs.c2p(*start_coords.T)
+        n_points = np.ones(n_lines, dtype=int)
+        arc_lens = np.zeros(n_lines)
+        active = np.arange(n_lines)
+        with np.errstate(all="ignore"):
+            for step in range(1, n_steps + 1):
+                if len(active) == 0:
+                    break
+                new_coords = runge_kutta_step(self.func, solution_coords[step - 1, active], self.dt)
+                new_points = cs.c2p(*new_coords.T)
+                is_finite = np.isfinite(new_points).all(1)
+                active = active[is_finite]
+                new_coords = new_coords[is_finite]
+                new_points = new_points[is_finite]
+
+                solution_coords[step, active] = new_coords
+                solution_points[step, active] = new_points
+                n_points[active] += 1
+                arc_lens[active] += np.linalg.norm(new_points - solution_points[step - 1, active], axis=1)
+                keep_going = np.logical_and(
+                    np.linalg.norm(new_points, axis=1) <= self.cutoff_norm,
+                    arc_lens[active] <= self.arc_len,
+                )
+                active = active[keep_going]
+
+        # Lines with the same number of points have their smooth handles
+        # computed together, except for those which close up on themselves
+        # or have repeated points, which set_points_smoothly treats specially
+        paths = [None] * n_lines
+        for n in np.unique(n_points):
+            if n < 3:
+                continue
+            indices = np.flatnonzero(n_points == n)
+            anchors = solution_points[:n, indices]
+            is_regular = np.logical_and(
+                (np.diff(anchors, axis=0) != 0).any(2).all(0),
+                ~np.isclose(anchors[0], anchors[-1]).all(1),
+            )
+            indices = indices[is_regular]
+            anchors = anchors[:, is_regular]
+            if len(indices) == 0:
+                continue
+            # Flattening the lines side by side treats them as one path in a
+            # higher dimensional space, whose handles are those of each line
+            handles = approx_smooth_quadratic_bezier_handles(
+                anchors.reshape(n, -1)
+            ).reshape(n - 1, -1, 3)
+            for i, index in enumerate(indices):
+                path = np.zeros((2 * n - 1, 3))
+                path[0::2] = anchors[:, i]
+                path[1::2] = handles[:, i]
+                paths[index] = path
+
         lines = []
-        for coords in self.get_sample_coords():
-            solution_coords = ode_solution_points(self.func, coords, self.solution_time, self.dt)
+        for index in range(n_lines):
+            if n_points[index] < 2:
+                continue
             line = VMobject()
-            line.set_points_smoothly(self.coordinate_system.c2p(*solution_coords.T))
-            # TODO, account for arc length somehow?
-            line.virtual_time = self.solution_time
+            if paths[index] is not None:
+                line.set_points(paths[index])
+            else:
+                line.set_points_smoothly(solution_points[:n_points[index], index])
+            line.virtual_time = (n_points[index] - 1) * self.dt
             lines.append(line)
         self.set_submobjects(lines)
 
@@ -418,21 +499,21 @@ class StreamLines(VGroup):
         ])
 
     def init_style(self) -> None:
-        if self.color_by_magnitude:
+        if self.color_by_magnitude and len(self.submobjects) > 0:
             values_to_rgbs = get_vectorized_rgb_gradient_function(
                 *self.magnitude_range, self.color_map,
             )
-            cs = self.coordinate_system
-            for line in self.submobjects:
-                norms = [
-                    get_norm(self.func(cs.p2c(point)))
-                    for point in line.get_points()
-                ]
-                rgbs = values_to_rgbs(norms)
-                rgbas = np.zeros((len(rgbs), 4))
-                rgbas[:, :3] = rgbs
-                rgbas[:, 3] = self.stroke_opacity
-                line.set_rgba_array(rgbas, "stroke_rgba")
+            # Evaluate the field once over the points of all lines together
+            lines = self.submobjects
+            all_points = np.vstack([line.get_points() for line in lines])
+            coords = np.array(self.coordinate_system.p2c(all_points)).T
+            norms = np.linalg.norm(self.func(coords), axis=1)
+            rgbas = np.zeros((len(norms), 4))
+            rgbas[:, :3] = values_to_rgbs(norms)
+            rgbas[:, 3] = self.stroke_opacity
+            ends = np.cumsum([line.get_num_points() for line in lines])
+            for line, line_rgbas in zip(lines, np.split(rgbas, ends[:-1])):
+                line.set_rgba_array(line_rgbas, "stroke_rgba")
         else:
             self.set_stroke(self.stroke_color, opacity=self.stroke_opacity)
 
@@ -29,6 +29,7 @@ from manimlib.scene.scene import Scene
 from manimlib.scene.scene import SceneState
 from manimlib.utils.family_ops import extract_mobject_family_members
 from manimlib.utils.space_ops import get_norm
+from manimlib.utils.spatial_index import MobjectSpatialIndex
 from manimlib.utils.tex_file_writing import LatexError
 
 from typing import TYPE_CHECKING
@@ -125,6 +126,7 @@ class InteractiveScene(Scene):
             self.camera.frame
         ]
         self.select_top_level_mobs = True
+        self.selection_index = MobjectSpatialIndex()
         self.regenerate_selection_search_set()
 
         self.is_selecting = False
@@ -258,21 +260,17 @@ class InteractiveScene(Scene):
         self.regenerate_selection_search_set()
 
     def get_selection_search_set(self) -> list[Mobject]:
-        return self.selection_search_set
+        return self.selection_index.get_mobjects()
 
     def regenerate_selection_search_set(self):
         selectable = list(filter(
             lambda m: m not in self.unselectables,
             self.mobjects
         ))
-        if self.select_top_level_mobs:
-            self.selection_search_set = selectable
-        else:
-            self.selection_search_set = [
-                submob
-                for mob in selectable
-                for submob in mob.family_members_with_points()
-            ]
+        self.selection_index.set_mobjects(
+            selectable,
+            use_family_members=not self.select_top_level_mobs
+        )
 
     def refresh_selection_scope(self):
         curr = list(self.selection)
@@ -413,12 +411,9 @@ class InteractiveScene(Scene):
         self.is_selecting = False
         if self.selection_rectangle in self.mobjects:
             self.remove(self.selection_rectangle)
-            additions = []
-            for mob in reversed(self.get_selection_search_set()):
-                if self.selection_rectangle.is_touching(mob):
-                    additions.append(mob)
-                    if self.selection_rectangle.get_arc_length() < 1e-2:
-                        break
+            additions = self.selection_index.get_mobjects_touching(self.selection_rectangle)
+            if self.selection_rectangle.get_arc_length() < 1e-2:
+                additions = additions[:1]
             self.toggle_from_selection(*additions)
 
     def prepare_grab(self):
@@ -579,11 +574,7 @@ class InteractiveScene(Scene):
             )
 
     def handle_sweeping_selection(self, point: Vect3):
-        mob = self.point_to_mobject(
-            point,
-            search_set=self.get_selection_search_set(),
-            buff=SMALL_BUFF
-        )
+        mob = self.selection_index.point_to_mobject(point, buff=SMALL_BUFF)
         if mob is not None:
             self.add_to_selection(mob)
 
@@ -27,7 +27,10 @@ from manimlib.mobject.types.vectorized_mobject import VGroup
 from manimlib.mobject.types.vectorized_mobject import VMobject
 from manimlib.scene.scene_embed import InteractiveSceneEmbed
 from manimlib.scene.scene_embed import CheckpointManager
+from manimlib.scene.scene_checkpoint import SectionCheckpoints
 from manimlib.scene.scene_file_writer import SceneFileWriter
+from manimlib.scene.scene_hashing import get_play_hash
+from manimlib.scene.scene_prefetch import prefetch_scene_tex
 from manimlib.utils.dict_ops import merge_dicts_recursively
 from manimlib.utils.family_ops import extract_mobject_family_members
 from manimlib.utils.family_ops import recursive_mobject_remove
@@ -75,6 +78,9 @@ class Scene(object):
         preview_while_skipping: bool = True,
         presenter_mode: bool = False,
         default_wait_time: float = 1.0,
+        # If true, the state at the end of each method marked as a section
+        # is saved, and reused by later runs which would skip through it
+        use_checkpoints: bool = False,
     ):
         self.skip_animations = skip_animations
         self.always_update_mobjects = always_update_mobjects
@@ -120,6 +126,8 @@ class Scene(object):
         self.num_plays: int = 0
         self.time: float = 0
         self.skip_time: float = 0
+        # Scene time at the end of each play or wait call
+        self.animation_end_times: list[float] = []
         self.original_skipping_status: bool = self.skip_animations
         self.undo_stack = []
         self.redo_stack = []
@@ -140,6 +148,11 @@ class Scene(object):
             random.seed(self.random_seed)
             np.random.seed(self.random_seed)
 
+        # This goes last, as it notes which attributes belong to the scene itself
+        self.section_checkpoints: SectionCheckpoints | None = None
+        if use_checkpoints:
+            self.section_checkpoints = SectionCheckpoints(self)
+
     def __str__(self) -> str:
         return self.__class__.__name__
 
@@ -151,6 +164,12 @@ class Scene(object):
         self.real_animation_start_time: float = time.time()
         self.file_writer.begin()
 
+        if manim_config.tex.prefetch:
+            try:
+                prefetch_scene_tex(self)
+            except Exception as err:
+                # Anything missed is compiled when the scene gets to it
+                log.warning(f"Could not prefetch LaTeX for {self}: {err}")
         self.setup()
         try:
             self.construct()
@@ -238,6 +257,8 @@ class Scene(object):
         self.update_mobjects(dt)
         if self.skip_animations and not force_draw:
             return
+        if self.file_writer.reusing_cached_partial_movie and not force_draw:
+            return
 
         if self.is_window_closing():
             raise EndScene()
@@ -529,14 +550,30 @@ class Scene(object):
             self.virtual_animation_start_time = self.time
             self.real_animation_start_time = time.time()
 
+    def begin_cached_animation(self, animations: Iterable[Animation], run_time: float) -> None:
+        """
+        When partial movies are cached, this finds whether one already exists
+        for the upcoming animations. If so, time still progresses frame by frame,
+        so that mobjects end up exactly as they would otherwise, but nothing
+        is drawn or written.
+        """
+        if self.skip_animations or not self.file_writer.cache_partial_movies:
+            return
+        if not self.file_writer.write_to_movie:
+            return
+        play_hash = get_play_hash(self, animations, run_time)
+        self.file_writer.begin_cached_animation(play_hash)
+
     def post_play(self):
         if not self.skip_animations:
             self.file_writer.end_animation()
+            self.file_writer.end_cached_animation()
 
         if self.preview_while_skipping and self.skip_animations and self.window is not None:
             # Show some quick frames along the way
             self.update_frame(dt=0, force_draw=True)
 
+        self.animation_end_times.append(self.time)
         self.num_plays += 1
 
     def begin_animations(self, animations: Iterable[Animation]) -> None:
@@ -589,6 +626,7 @@ class Scene(object):
             anim.update_rate_info(run_time, rate_func, lag_ratio)
         self.pre_play()
         self.begin_animations(animations)
+        self.begin_cached_animation(animations, self.get_run_time(animations))
         self.progress_through_animations(animations)
         self.finish_animations(animations)
         self.post_play()
@@ -609,6 +647,8 @@ class Scene(object):
                 log.info(note)
             self.hold_loop()
         else:
+            if stop_condition is None:
+                self.begin_cached_animation([], duration)
             time_progression = self.get_wait_time_progression(duration, stop_condition)
             last_t = 0
             for t in time_progression:
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import ast
+import hashlib
+import inspect
+import io
+import os
+import pickle
+import random
+from functools import wraps
+from pathlib import Path
+
+import numpy as np
+
+from manimlib.config import manim_config
+from manimlib.logger import log
+from manimlib.scene.scene_hashing import get_user_source_files
+from manimlib.scene.scene_hashing import update_hash
+from manimlib.scene.scene_hashing import update_hash_with_code
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import FrameType
+    from typing import Any, Callable, TypeVar
+
+    from manimlib.scene.scene import Scene
+
+    T = TypeVar("T")
+
+
+def section(method: Callable[..., T]) -> Callable[..., T]:
+    """
+    Marks a method of a scene as one section of it. When the scene is run
+    with checkpoints, its state at the end of each section is saved, and a
+    later run which would only skip through that section, as when starting
+    at a later animation with -n, restores that state instead of running it.
+
+    Anything which code after a section relies on should be kept as attributes
+    of the scene, since return values and local variables are not saved.
+    """
+    @wraps(method)
+    def wrapper(scene: Scene, *args, **kwargs):
+        if scene.section_checkpoints is None:
+            return method(scene, *args, **kwargs)
+        caller = inspect.currentframe().f_back
+        return scene.section_checkpoints.run_section(method, args, kwargs, caller)
+    wrapper.is_section = True
+    return wrapper
+
+
+class SectionCheckpoints(object):
+    """
+    Saves and restores the state of a scene at the end of each of
+    its sections, see section
+    """
+    def __init__(self, scene: Scene):
+        self.scene = scene
+        self.directory = Path(scene.file_writer.output_directory, "checkpoints", str(scene))
+        self.num_sections = 0
+        # Attributes of the scene itself, rather than of what it
+        # constructs, are neither saved nor restored
+        self.scene_attributes = set(vars(scene)) | {"section_checkpoints"}
+        self.key = self.get_base_key()
+
+    def get_base_key(self) -> str:
+        """
+        Hash of the configuration of the scene, of the code it could use
+        from outside of its own class, see update_hash_with_source_files,
+        and of each method of the scene, other than sections and construct,
+        which contribute to the keys of sections as they run
+        """
+        scene = self.scene
+        hasher = hashlib.sha256()
+        hasher.update(type(scene).__name__.encode())
+        update_hash(hasher, [
+            scene.random_seed,
+            scene.camera_config,
+            scene.default_wait_time,
+            scene.always_update_mobjects,
+            [manim_config[key] for key in ["sizes", "mobject", "vmobject", "tex", "text", "colors"]],
+        ])
+        self.update_hash_with_source_files(hasher)
+        for cls in type(self.scene).__mro__:
+            if cls.__module__.startswith("manimlib") or cls is object:
+                continue
+            for name, value in vars(cls).items():
+                func = getattr(value, "__func__", value)
+                if name == "construct" or getattr(func, "is_section", False):
+                    continue
+                if hasattr(func, "__code__"):
+                    hasher.update(f"{cls.__name__}.{name}".encode())
+                    update_hash_with_code(hasher, func.__code__)
+        return hasher.hexdigest()
+
+    def update_hash_with_source_files(self, hasher: hashlib._Hash) -> None:
+        """
+        Feeds in the files from get_user_source_files. Those defining the
+        scene and its bases contribute all their code but that of scene
+        classes, whose methods are accounted for one by one, so that editing
+        some later part of a scene leaves checkpoints of earlier sections usable
+        """
+        scene_class = type(self.scene)
+        namespaces = dict()
+        for cls in scene_class.__mro__:
+            for value in vars(cls).values():
+                func = getattr(value, "__func__", value)
+                if hasattr(func, "__code__") and hasattr(func, "__globals__"):
+                    namespaces[os.path.abspath(func.__code__.co_filename)] = func.__globals__
+
+        def is_scene_class(value: Any) -> bool:
+            return isinstance(value, type) and callable(getattr(value, "construct", None))
+
+        for file_path in get_user_source_files(scene_class):
+            hasher.update(file_path.encode())
+            try:
+                source = Path(file_path).read_text()
+                tree = ast.parse(source)
+            except (OSError, ValueError, SyntaxError):
+                continue
+            if file_path not in namespaces:
+                hasher.update(source.encode())
+                continue
+            namespace = namespaces[file_path]
+            tree.body = [
+                node for node in tree.body
+                if not (isinstance(node, ast.ClassDef) and is_scene_class(namespace.get(node.name)))
+            ]
+            # Unlike the source, this is unaffected by comments or by lines
+            # being added or removed within scene classes
+            hasher.update(ast.dump(tree).encode())
+
+    def get_section_key(self, method: Callable, args: tuple, kwargs: dict, caller: FrameType) -> str:
+        """
+        Hash of everything expected to determine the state of the scene after
+        this section, namely the key of the section before it, the code of
+        this one, its arguments, and the code which calls it, up to the call
+        """
+        hasher = hashlib.sha256(self.key.encode())
+        hasher.update(method.__qualname__.encode())
+        update_hash_with_code(hasher, method.__code__)
+        update_hash(hasher, [args, kwargs])
+        try:
+            lines, start = inspect.getsourcelines(caller.f_code)
+            hasher.update("".join(lines[:caller.f_lineno - start + 1]).encode())
+        except (OSError, TypeError):
+            update_hash_with_code(hasher, caller.f_code)
+        return hasher.hexdigest()
+
+    def run_section(self, method: Callable[..., T], args: tuple, kwargs: dict, caller: FrameType) -> T | None:
+        self.key = self.get_section_key(method, args, kwargs, caller)
+        path = Path(self.directory, f"{self.num_sections:03}_{method.__name__}.pkl")
+        self.num_sections += 1
+
+        checkpoint = self.load_checkpoint(path)
+        if checkpoint is not None and self.can_skip_to(checkpoint["num_plays"]):
+            self.restore_checkpoint(checkpoint)
+            return None
+
+        result = method(self.scene, *args, **kwargs)
+        if checkpoint is None:
+            self.save_checkpoint(path)
+        return result
+
+    def can_skip_to(self, num_plays: int) -> bool:
+        """
+        Whether every animation up to num_plays would be skipped anyway
+        """
+        scene = self.scene
+        start = scene.start_at_animation_number
+        end = scene.end_at_animation_number
+        return all((
+            scene.skip_animations,
+            start is None or num_plays <= start,
+            end is None or num_plays <= end,
+        ))
+
+    def get_persistent_ids(self) -> dict[int, str]:
+        # The scene and its own attributes are referred to, rather than
+        # saved, so that restored mobjects and updaters point to the live ones
+        result = {id(self.scene): "scene"}
+        for attr in self.scene_attributes:
+            value = getattr(self.scene, attr, None)
+            if not isinstance(value, (type(None), bool, int, float, str, list, tuple, dict, set, np.ndarray)):
+                result.setdefault(id(value), attr)
+        return result
+
+    def save_checkpoint(self, path: Path) -> None:
+        scene = self.scene
+        persistent_ids = self.get_persistent_ids()
+        stream = io.BytesIO()
+        pickler = pickle.Pickler(stream, pickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = lambda obj: persistent_ids.get(id(obj))
+        try:
+            pickler.dump(dict(
+                key=self.key,
+                time=scene.time,
+                num_plays=scene.num_plays,
+                animation_end_times=scene.animation_end_times,
+                random_state=random.getstate(),
+                np_random_state=np.random.get_state(),
+                frame=scene.frame.serialize(),
+                mobjects=scene.mobjects,
+                attributes={
+                    attr: value
+                    for attr, value in vars(scene).items()
+                    if attr not in self.scene_attributes
+                },
+            ))
+        except Exception as err:
+            log.warning(f"Could not save checkpoint {path.stem} of {scene}: {err}")
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(stream.getvalue())
+        except OSError as err:
+            log.warning(f"Could not save checkpoint {path.stem} of {scene}: {err}")
+
+    def load_checkpoint(self, path: Path) -> dict[str, Any] | None:
+        try:
+            with open(path, "rb") as fp:
+                unpickler = pickle.Unpickler(fp)
+                unpickler.persistent_load = lambda attr: self.scene if attr == "scene" else getattr(self.scene, attr)
+                checkpoint = unpickler.load()
+        except Exception:
+            return None
+        if not isinstance(checkpoint, dict) or checkpoint.get("key") != self.key:
+            return None
+        return checkpoint
+
+    def restore_checkpoint(self, checkpoint: dict[str, Any]) -> None:
+        scene = self.scene
+        scene.time = checkpoint["time"]
+        scene.num_plays = checkpoint["num_plays"]
+        scene.animation_end_times = checkpoint["animation_end_times"]
+        random.setstate(checkpoint["random_state"])
+        np.random.set_state(checkpoint["np_random_state"])
+        scene.frame.deserialize(checkpoint["frame"])
+        for attr, value in checkpoint["attributes"].items():
+            setattr(scene, attr, value)
+        scene.mobjects = checkpoint["mobjects"]
+        scene.assemble_render_groups()
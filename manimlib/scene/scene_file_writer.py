@@ -5,6 +5,8 @@ import platform
 import shutil
 import subprocess as sp
 import sys
+from queue import Queue
+from threading import Thread
 
 import numpy as np
 from pydub import AudioSegment
@@ -41,6 +43,9 @@ class SceneFileWriter(object):
         show_file_location_upon_completion: bool = False,
         quiet: bool = False,
         total_frames: int = 0,
+        # Scene times at which each play or wait call ends, from a saved
+        # timeline, giving the progress display for each partial movie
+        animation_end_times: list[float] = [],
         progress_description_len: int = 40,
         # Name of the binary used for ffmpeg
         ffmpeg_bin: str = "ffmpeg",
@@ -48,6 +53,14 @@ class SceneFileWriter(object):
         pixel_format: str = "yuv420p",
         saturation: float = 1.0,
         gamma: float = 1.0,
+        # If true, frames are read back from the gpu through a ring of
+        # pixel pack buffers, and passed to ffmpeg by a background thread
+        async_frame_writes: bool = False,
+        readback_buffer_count: int = 2,
+        frame_queue_size: int = 8,
+        # If true, the movie for each play or wait call is stored under a hash
+        # of everything determining its frames, and reused on later runs
+        cache_partial_movies: bool = False,
     ):
         self.scene: Scene = scene
         self.write_to_movie = write_to_movie
@@ -61,17 +74,30 @@ class SceneFileWriter(object):
         self.show_file_location_upon_completion = show_file_location_upon_completion
         self.quiet = quiet
         self.total_frames = total_frames
+        self.animation_end_times = animation_end_times
         self.progress_description_len = progress_description_len
         self.ffmpeg_bin = ffmpeg_bin
         self.video_codec = video_codec
         self.pixel_format = pixel_format
         self.saturation = saturation
         self.gamma = gamma
+        self.async_frame_writes = async_frame_writes
+        self.readback_buffer_count = readback_buffer_count
+        self.frame_queue_size = frame_queue_size
+        self.cache_partial_movies = cache_partial_movies
 
         # State during file writing
         self.writing_process: sp.Popen | None = None
         self.progress_display: ProgressDisplay | None = None
         self.ended_with_interrupt: bool = False
+        self.frame_queue: Queue | None = None
+        self.frame_writing_thread: Thread | None = None
+        self.frame_writing_error: Exception | None = None
+        self.num_queued_frames: int = 0
+        self.num_frame_queue_stalls: int = 0
+        self.cached_partial_movie_paths: list[Path] = []
+        self.current_cached_partial_movie_path: Path | None = None
+        self.reusing_cached_partial_movie: bool = False
 
         self.init_output_directories()
         self.init_audio()
@@ -84,6 +110,8 @@ class SceneFileWriter(object):
             self.movie_file_path = self.init_movie_file_path()
         if self.subdivide_output:
             self.partial_movie_directory = self.init_partial_movie_directory()
+        if self.cache_partial_movies and self.write_to_movie:
+            self.partial_movie_cache_directory = self.init_partial_movie_cache_directory()
 
     def init_image_file_path(self) -> Path:
         return self.get_output_file_rootname().with_suffix(".png")
@@ -94,6 +122,9 @@ class SceneFileWriter(object):
     def init_partial_movie_directory(self):
         return guarantee_existence(self.get_output_file_rootname())
 
+    def init_partial_movie_cache_directory(self) -> Path:
+        return guarantee_existence(Path(self.output_directory, "partial_movie_cache"))
+
     def get_output_file_rootname(self) -> Path:
         return Path(
             guarantee_existence(self.output_directory),
@@ -101,18 +132,12 @@ class SceneFileWriter(object):
         )
 
     def get_output_file_name(self) -> str:
-        if self.file_name:
-            return self.file_name
-        # Otherwise, use the name of the scene, potentially
-        # appending animation numbers
-        name = str(self.scene)
-        saan = self.scene.start_at_animation_number
-        eaan = self.scene.end_at_animation_number
-        if saan is not None:
-            name += f"_{saan}"
-        if eaan is not None:
-            name += f"_{eaan}"
-        return name
+        return get_output_file_name(
+            str(self.scene),
+            self.file_name,
+            self.scene.start_at_animation_number,
+            self.scene.end_at_animation_number,
+        )
 
     # Directory getters
     def get_image_file_path(self) -> str:
@@ -125,6 +150,19 @@ class SceneFileWriter(object):
     def get_movie_file_path(self) -> str:
         return self.movie_file_path
 
+    def get_cached_partial_movie_path(self, play_hash: str) -> Path:
+        result = Path(self.partial_movie_cache_directory, play_hash)
+        return result.with_suffix(self.movie_file_extension)
+
+    def get_uncached_partial_movie_path(self) -> Path:
+        # Overwritten by later runs, as these are never reused
+        name = f"{self.get_output_file_name()}_uncached_{len(self.cached_partial_movie_paths):05}"
+        result = Path(guarantee_existence(Path(self.partial_movie_cache_directory, "uncached")), name)
+        return result.with_suffix(self.movie_file_extension)
+
+    def writes_single_movie(self) -> bool:
+        return self.write_to_movie and not (self.subdivide_output or self.cache_partial_movies)
+
     # Sound
     def init_audio(self) -> None:
         self.includes_sound: bool = False
@@ -176,23 +214,66 @@ class SceneFileWriter(object):
 
     # Writers
     def begin(self) -> None:
-        if not self.subdivide_output and self.write_to_movie:
+        if self.writes_single_movie():
             self.open_movie_pipe(self.get_movie_file_path())
 
     def begin_animation(self) -> None:
         if self.subdivide_output and self.write_to_movie:
             self.open_movie_pipe(self.get_next_partial_movie_path())
 
+    def begin_cached_animation(self, play_hash: str) -> bool:
+        """
+        Used in place of begin_animation when caching partial movies. Returns
+        whether a movie for the given hash already exists, in which case
+        the frames for this animation need not be rendered.
+        """
+        path = self.get_cached_partial_movie_path(play_hash)
+        self.cached_partial_movie_paths.append(path)
+        self.current_cached_partial_movie_path = path
+        self.reusing_cached_partial_movie = path.exists()
+        if not self.reusing_cached_partial_movie:
+            self.open_movie_pipe(path)
+        return self.reusing_cached_partial_movie
+
+    def begin_uncached_segment(self) -> None:
+        """
+        When caching partial movies, frames emitted outside of a cacheable
+        play or wait call, such as those of wait_until, go into a movie of
+        their own, which is joined with the others but never reused
+        """
+        path = self.get_uncached_partial_movie_path()
+        self.cached_partial_movie_paths.append(path)
+        self.current_cached_partial_movie_path = path
+        self.reusing_cached_partial_movie = False
+        self.open_movie_pipe(path)
+
     def end_animation(self) -> None:
         if self.subdivide_output and self.write_to_movie:
             self.close_movie_pipe()
 
+    def end_cached_animation(self) -> None:
+        if self.current_cached_partial_movie_path is None:
+            return
+        if not self.reusing_cached_partial_movie:
+            self.close_movie_pipe()
+        self.current_cached_partial_movie_path = None
+        self.reusing_cached_partial_movie = False
+
     def finish(self) -> None:
-        if not self.subdivide_output and self.write_to_movie:
+        if self.writes_single_movie():
             self.close_movie_pipe()
             if self.includes_sound:
                 self.add_sound_to_video()
             self.print_file_ready_message(self.get_movie_file_path())
+        elif self.cache_partial_movies and self.write_to_movie:
+            self.end_cached_animation()
+            # An interrupted animation leaves no complete movie behind
+            paths = [path for path in self.cached_partial_movie_paths if path.exists()]
+            if paths:
+                self.concatenate_movie_files(paths)
+                if self.includes_sound:
+                    self.add_sound_to_video()
+                self.print_file_ready_message(self.get_movie_file_path())
         if self.save_last_frame:
             self.scene.update_frame(force_draw=True)
             self.save_final_image(self.scene.get_image())
@@ -228,10 +309,12 @@ class SceneFileWriter(object):
             command += ['-pix_fmt', self.pixel_format]
         command += [self.temp_file_path]
         self.writing_process = sp.Popen(command, stdin=sp.PIPE)
+        if self.async_frame_writes:
+            self.start_frame_writing_thread()
 
         if not self.quiet:
             self.progress_display = ProgressDisplay(
-                range(self.total_frames),
+                range(self.get_progress_display_total()),
                 leave=False,
                 ascii=True if platform.system() == 'Windows' else None,
                 dynamic_ncols=True,
@@ -267,6 +350,17 @@ class SceneFileWriter(object):
     def has_progress_display(self):
         return self.progress_display is not None
 
+    def get_progress_display_total(self) -> int:
+        """
+        Frames expected in the movie being opened, which, when each play or
+        wait call has a movie of its own, is found from the timeline
+        """
+        index = self.scene.num_plays
+        if self.writes_single_movie() or index >= len(self.animation_end_times):
+            return self.total_frames
+        start_time = self.animation_end_times[index - 1] if index > 0 else 0.0
+        return get_frame_count(self.animation_end_times[index] - start_time, self.scene.camera.fps)
+
     def set_progress_display_description(self, file: str = "", sub_desc: str = "") -> None:
         if self.progress_display is None:
             return
@@ -281,16 +375,79 @@ class SceneFileWriter(object):
             full_desc += " " * (desc_len - len(full_desc))
         self.progress_display.set_description(full_desc)
 
+    def start_frame_writing_thread(self) -> None:
+        self.frame_queue = Queue(maxsize=self.frame_queue_size)
+        self.frame_writing_error = None
+        self.num_queued_frames = 0
+        self.num_frame_queue_stalls = 0
+        self.scene.camera.init_readback_buffers(self.readback_buffer_count)
+        self.frame_writing_thread = Thread(
+            target=self.drain_frame_queue,
+            args=(self.writing_process, self.frame_queue),
+            daemon=True,
+        )
+        self.frame_writing_thread.start()
+
+    def drain_frame_queue(self, writing_process: sp.Popen, frame_queue: Queue) -> None:
+        while (raw_bytes := frame_queue.get()) is not None:
+            if self.frame_writing_error is not None:
+                # Keep draining so that the render loop never blocks
+                # on a pipe which can no longer be written to
+                continue
+            try:
+                writing_process.stdin.write(raw_bytes)
+            except Exception as err:
+                self.frame_writing_error = err
+
+    def queue_frame(self, raw_bytes: bytes) -> None:
+        if self.frame_queue.full():
+            self.num_frame_queue_stalls += 1
+            if self.progress_display is not None:
+                self.progress_display.set_postfix(stalls=self.num_frame_queue_stalls)
+        self.frame_queue.put(raw_bytes)
+        self.num_queued_frames += 1
+
+    def stop_frame_writing_thread(self) -> None:
+        for raw_bytes in self.scene.camera.flush_queued_fbo_data():
+            self.queue_frame(raw_bytes)
+        self.frame_queue.put(None)
+        self.frame_writing_thread.join()
+        self.frame_writing_thread = None
+        self.frame_queue = None
+        if not self.quiet:
+            log.info(
+                f"Frame queue stalled {self.num_frame_queue_stalls} times " +
+                f"across {self.num_queued_frames} frames"
+            )
+        if self.frame_writing_error is not None:
+            raise self.frame_writing_error
+
     def write_frame(self, camera: Camera) -> None:
-        if self.write_to_movie:
-            raw_bytes = camera.get_raw_fbo_data()
-            self.writing_process.stdin.write(raw_bytes)
+        if self.write_to_movie and self.cache_partial_movies and self.current_cached_partial_movie_path is None:
+            self.begin_uncached_segment()
+        if self.write_to_movie and not self.reusing_cached_partial_movie:
+            if self.async_frame_writes:
+                raw_bytes = camera.queue_raw_fbo_data()
+                if raw_bytes is not None:
+                    self.queue_frame(raw_bytes)
+            else:
+                raw_bytes = camera.get_raw_fbo_data()
+                self.writing_process.stdin.write(raw_bytes)
             if self.progress_display is not None:
                 self.progress_display.update()
 
     def close_movie_pipe(self) -> None:
-        self.writing_process.stdin.close()
-        self.writing_process.wait()
+        try:
+            if self.frame_writing_thread is not None:
+                self.stop_frame_writing_thread()
+        finally:
+            # Even if writing frames failed, ffmpeg is let finish rather
+            # than being left running
+            try:
+                self.writing_process.stdin.close()
+            except BrokenPipeError:
+                pass
+            self.writing_process.wait()
         self.writing_process.terminate()
         if self.progress_display is not None:
             self.progress_display.close()
@@ -300,6 +457,30 @@ class SceneFileWriter(object):
         else:
             self.movie_file_path = self.temp_file_path
 
+    def concatenate_movie_files(self, partial_movie_files: list[str | Path]) -> None:
+        """
+        Joins movie files, e.g. for separately rendered ranges of a scene's
+        animations, into this writer's movie file without re-encoding them
+        """
+        movie_file_path = self.get_movie_file_path()
+        list_file_path = Path(movie_file_path).with_suffix(".concat.txt")
+        with open(list_file_path, "w") as fp:
+            for file_path in partial_movie_files:
+                escaped_path = str(Path(file_path).absolute()).replace("'", "'\\''")
+                fp.write(f"file '{escaped_path}'\n")
+        commands = [
+            self.ffmpeg_bin,
+            '-y',  # overwrite output file if it exists
+            '-f', 'concat',
+            '-safe', '0',
+            '-i', str(list_file_path),
+            '-c', 'copy',
+            '-loglevel', 'error',
+            str(movie_file_path),
+        ]
+        sp.call(commands)
+        os.remove(list_file_path)
+
     def add_sound_to_video(self) -> None:
         movie_file_path = self.get_movie_file_path()
         stem, ext = os.path.splitext(movie_file_path)
@@ -383,3 +564,29 @@ class SceneFileWriter(object):
         if self.quiet:
             sys.stdout.close()
             sys.stdout = curr_stdout
+
+
+def get_output_file_name(
+    scene_name: str,
+    file_name: str | None = None,
+    start_at_animation_number: int | None = None,
+    end_at_animation_number: int | None = None,
+) -> str:
+    if file_name:
+        return file_name
+    # Otherwise, use the name of the scene, potentially
+    # appending animation numbers
+    name = scene_name
+    if start_at_animation_number is not None:
+        name += f"_{start_at_animation_number}"
+    if end_at_animation_number is not None:
+        name += f"_{end_at_animation_number}"
+    return name
+
+
+def get_frame_count(duration: float, fps: float) -> int:
+    """
+    Number of frames written for a play or wait call of this duration,
+    allowing for the rounding error in differences of summed scene times
+    """
+    return int(np.ceil(round(fps * duration, 6)))
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import hashlib
+import numbers
+import os
+import random
+import sys
+import types
+from pathlib import Path
+
+import numpy as np
+
+from manimlib.animation.animation import Animation
+from manimlib.mobject.mobject import Mobject
+from manimlib.module_loader import ModuleLoader
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Iterable
+
+    from manimlib.scene.scene import Scene
+
+
+# How far to follow containers, closures and animation attributes
+MAX_HASH_DEPTH = 5
+
+
+def update_hash(hasher: hashlib._Hash, value: Any, depth: int = 0) -> None:
+    """
+    Feeds a description of value into hasher. Mobjects contribute their
+    full state, functions their code, and animations their attributes.
+    Anything else which is not a simple value only contributes its type.
+    """
+    if depth > MAX_HASH_DEPTH:
+        hasher.update(type(value).__name__.encode())
+    elif isinstance(value, Mobject):
+        update_hash_with_mobject(hasher, value, depth)
+    elif isinstance(value, Animation):
+        hasher.update(type(value).__name__.encode())
+        update_hash(hasher, value.__dict__, depth + 1)
+    elif isinstance(value, np.ndarray):
+        hasher.update(f"{value.dtype}{value.shape}".encode())
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    elif value is None or isinstance(value, (str, bytes, numbers.Number)):
+        hasher.update(repr(value).encode())
+    elif isinstance(value, (list, tuple)):
+        hasher.update(f"{type(value).__name__}{len(value)}".encode())
+        for item in value:
+            update_hash(hasher, item, depth + 1)
+    elif isinstance(value, dict):
+        hasher.update(f"dict{len(value)}".encode())
+        for key in sorted(value, key=str):
+            hasher.update(str(key).encode())
+            update_hash(hasher, value[key], depth + 1)
+    elif isinstance(value, types.MethodType):
+        hasher.update(type(value.__self__).__name__.encode())
+        update_hash(hasher, value.__func__, depth + 1)
+    elif isinstance(value, types.FunctionType):
+        hasher.update(value.__qualname__.encode())
+        update_hash_with_code(hasher, value.__code__)
+        for cell in value.__closure__ or []:
+            try:
+                update_hash(hasher, cell.cell_contents, depth + 1)
+            except ValueError:
+                # Empty cell
+                pass
+    else:
+        hasher.update(type(value).__name__.encode())
+
+
+def update_hash_with_code(hasher: hashlib._Hash, code: types.CodeType) -> None:
+    hasher.update(code.co_code)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            update_hash_with_code(hasher, const)
+        else:
+            hasher.update(repr(const).encode())
+
+
+def get_user_source_files(scene_class: type) -> list[str]:
+    """
+    Paths of the files defining scene_class and the classes it inherits from
+    outside of manimlib, along with those of every other loaded module which
+    is neither part of manimlib nor of an installed library, such as helpers
+    imported by a scene file
+    """
+    manimlib_dir = os.path.dirname(os.path.abspath(sys.modules["manimlib"].__file__))
+    file_paths = set()
+    for cls in scene_class.__mro__:
+        if cls.__module__.startswith("manimlib") or cls is object:
+            continue
+        for value in vars(cls).values():
+            code = getattr(getattr(value, "__func__", value), "__code__", None)
+            if code is not None:
+                file_paths.add(os.path.abspath(code.co_filename))
+    for name in list(sys.modules):
+        if not ModuleLoader._is_user_defined_module(name):
+            continue
+        file_path = os.path.abspath(sys.modules[name].__file__)
+        if not file_path.startswith(manimlib_dir + os.sep):
+            file_paths.add(file_path)
+    return sorted(file_paths)
+
+
+def update_hash_with_source_files(hasher: hashlib._Hash, scene_class: type) -> None:
+    """
+    Feeds in the contents of all files from get_user_source_files, so
+    that editing any of them, or any helper they import, changes the hash
+    """
+    for file_path in get_user_source_files(scene_class):
+        hasher.update(file_path.encode())
+        try:
+            hasher.update(Path(file_path).read_bytes())
+        except OSError:
+            pass
+
+
+def update_hash_with_mobject(hasher: hashlib._Hash, mobject: Mobject, depth: int = 0) -> None:
+    for mob in mobject.get_family():
+        hasher.update(type(mob).__name__.encode())
+        # Shader data, rather than mob.data, so that fields which are
+        # lazily computed during rendering, like joint angles, are brought
+        # up to date, regardless of whether previous frames were drawn
+        update_hash(hasher, mob.get_shader_data() if mob.has_points() else mob.data)
+        update_hash(hasher, mob.uniforms)
+        update_hash(hasher, [
+            mob.shader_folder,
+            mob.texture_paths,
+            mob.shader_code_replacements,
+            mob.depth_test,
+            mob.z_index,
+        ])
+        for updater in mob.get_updaters():
+            update_hash(hasher, updater, depth + 1)
+
+
+def get_play_hash(
+    scene: Scene,
+    animations: Iterable[Animation],
+    run_time: float,
+) -> str:
+    """
+    Hash describing everything expected to determine the frames rendered
+    during one play or wait call, namely the state of all mobjects in the
+    scene, the animations, the run time, the state of random number
+    generators, and the camera and encoding configuration.
+
+    Behavior hidden from this, like state read by updaters from outside
+    the mobjects and functions they reference, will not be noticed.
+    """
+    hasher = hashlib.sha256()
+    camera = scene.camera
+    file_writer = scene.file_writer
+    update_hash(hasher, [
+        run_time,
+        camera.get_pixel_shape(),
+        camera.fps,
+        camera.background_rgba,
+        camera.samples,
+        file_writer.video_codec,
+        file_writer.pixel_format,
+        file_writer.saturation,
+        file_writer.gamma,
+        file_writer.movie_file_extension,
+    ])
+    update_hash(hasher, random.getstate())
+    update_hash(hasher, np.random.get_state())
+    update_hash(hasher, scene.mobjects)
+    update_hash(hasher, list(animations))
+    return hasher.hexdigest()[:32]
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import ast
+import inspect
+import textwrap
+
+from manimlib.logger import log
+from manimlib.mobject.svg.tex_mobject import Tex
+from manimlib.mobject.svg.tex_mobject import get_tex_mob_scale_factor
+from manimlib.utils.tex_file_writing import LatexRequestRecorded
+from manimlib.utils.tex_file_writing import prefetch_full_tex_to_svg
+from manimlib.utils.tex_file_writing import recording_latex_requests
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterable
+
+    from manimlib.scene.scene import Scene
+
+
+# Expressions made only of these are evaluated when looking for literal
+# arguments, which rules out calls and anything else with side effects
+LITERAL_NODE_TYPES = (
+    ast.Expression, ast.Constant, ast.Name, ast.Attribute, ast.Load,
+    ast.List, ast.Tuple, ast.Dict, ast.Set,
+    ast.BinOp, ast.Add, ast.Mult, ast.UnaryOp, ast.USub,
+)
+
+
+def evaluate_literal(node: ast.expr, namespace: dict[str, Any]) -> Any:
+    """
+    Value of an expression built from constants and names from
+    namespace, raising ValueError for anything else
+    """
+    expr = ast.Expression(node)
+    if not all(isinstance(n, LITERAL_NODE_TYPES) for n in ast.walk(expr)):
+        raise ValueError("Expression is not a literal")
+    return eval(compile(expr, "<literal>", "eval"), {"__builtins__": {}}, namespace)
+
+
+def get_literal_tex_calls(scene_class: type) -> list[tuple[type, list, dict]]:
+    """
+    Finds calls to Tex, TexText, and their subclasses, within the methods
+    of scene_class and of those classes it inherits from outside of
+    manimlib, for which all arguments can be evaluated up front
+    """
+    result = []
+    for cls in scene_class.__mro__:
+        if cls.__module__.startswith("manimlib") or cls is object:
+            continue
+        for value in vars(cls).values():
+            func = getattr(value, "__func__", value)
+            if inspect.isfunction(func):
+                result.extend(get_literal_tex_calls_in_function(func))
+    return result
+
+
+def get_literal_tex_calls_in_function(function: Callable) -> list[tuple[type, list, dict]]:
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(function)))
+    except (OSError, TypeError, SyntaxError):
+        return []
+    namespace = dict(function.__globals__)
+    result = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        try:
+            func = evaluate_literal(node.func, namespace)
+            if not (isinstance(func, type) and issubclass(func, Tex)):
+                continue
+            args = []
+            for arg in node.args:
+                if isinstance(arg, ast.Starred):
+                    args.extend(evaluate_literal(arg.value, namespace))
+                else:
+                    args.append(evaluate_literal(arg, namespace))
+            kwargs = dict()
+            for keyword in node.keywords:
+                if keyword.arg is None:
+                    kwargs.update(evaluate_literal(keyword.value, namespace))
+                else:
+                    kwargs[keyword.arg] = evaluate_literal(keyword.value, namespace)
+        except Exception:
+            continue
+        result.append((func, args, kwargs))
+    return result
+
+
+def prefetch_tex_mobjects(calls: Iterable[tuple[type, list, dict]]) -> None:
+    """
+    Compiles, in parallel, whatever LaTeX constructing each mobject class
+    with the given args and kwargs would compile, and which is not cached
+    """
+    calls = list(calls)
+    if not calls:
+        return
+    with recording_latex_requests() as requests:
+        # Every Tex is scaled according to the size of a reference tex
+        try:
+            get_tex_mob_scale_factor()
+        except LatexRequestRecorded:
+            pass
+        for mob_class, args, kwargs in calls:
+            try:
+                mob_class(*args, **kwargs)
+            except LatexRequestRecorded:
+                pass
+            except Exception as err:
+                log.debug(f"Could not prefetch {mob_class.__name__}: {err}")
+    prefetch_full_tex_to_svg(requests)
+
+
+def prefetch_scene_tex(scene: Scene) -> None:
+    prefetch_tex_mobjects(get_literal_tex_calls(type(scene)))
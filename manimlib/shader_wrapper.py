@@ -11,7 +11,10 @@ from functools import lru_cache
 
 from manimlib.config import parse_cli
 from manimlib.config import manim_config
+from manimlib.utils.shaders import cache_program_code
+from manimlib.utils.shaders import get_cached_program_code
 from manimlib.utils.shaders import get_shader_code_from_file
+from manimlib.utils.shaders import get_shader_file_sources
 from manimlib.utils.shaders import get_shader_program
 from manimlib.utils.shaders import image_path_to_texture
 from manimlib.utils.shaders import set_program_uniform
@@ -24,6 +27,12 @@ if TYPE_CHECKING:
     from moderngl.vertex_array import VertexArray
     from moderngl.framebuffer import Framebuffer
 
+# Relative error allowed between the points of copies of data drawn with
+# instanced rendering, a few times the precision of float32
+INSTANCE_TOLERANCE = 1e-6
+# Error in radians allowed between their joint angles
+JOINT_ANGLE_TOLERANCE = 1e-4
+
 # Mobjects that should be rendered with
 # the same shader will be organized and
 # clumped together based on keeping track
@@ -54,9 +63,21 @@ class ShaderWrapper(object):
         self.program_uniform_mirror: UniformDict = dict()
         self.bind_to_mobject_uniforms(mobject_uniforms or dict())
 
-        self.init_program_code()
-        for old, new in code_replacements.items():
-            self.replace_code(old, new)
+        # Which mobjects, at which data versions, last had their
+        # data read in, in order, as tracked by Mobject.read_in_shader_data
+        self.read_in_mobjects: list = []
+        self.read_in_versions: list[int] = []
+        self.data_lengths: np.ndarray = np.zeros(0, dtype=int)
+        self.data_offsets: np.ndarray = np.zeros(0, dtype=int)
+
+        # The processed code is cached on disk, across runs
+        code_key = "".join(map(str, [type(self).__name__, shader_folder, code_replacements]))
+        self.program_code = get_cached_program_code(code_key)
+        if self.program_code is None:
+            self.init_program_code()
+            for old, new in code_replacements.items():
+                self.substitute_code(old, new)
+            cache_program_code(code_key, self.program_code, self.get_source_files())
         self.init_program()
         self.init_textures()
         self.init_vertex_objects()
@@ -80,6 +101,15 @@ class ShaderWrapper(object):
             "fragment_shader": get_code("frag"),
         }
 
+    def get_source_files(self) -> list[str]:
+        return [
+            source_file
+            for name in ["vert", "geom", "frag"]
+            for source_file in get_shader_file_sources(
+                os.path.join(self.shader_folder, f"{name}.glsl")
+            )
+        ]
+
     def init_program(self):
         if not self.shader_folder:
             self.program = None
@@ -98,6 +128,8 @@ class ShaderWrapper(object):
 
     def init_vertex_objects(self):
         self.vbo = None
+        self.instance_vbo = None
+        self.n_instances = 0
         self.vaos = []
 
     def add_texture(self, name: str, texture: moderngl.Texture):
@@ -123,12 +155,15 @@ class ShaderWrapper(object):
             self.texture_paths,
         ])))
 
-    def replace_code(self, old: str, new: str) -> None:
+    def substitute_code(self, old: str, new: str) -> None:
         code_map = self.program_code
         for name in code_map:
             if code_map[name] is None:
                 continue
             code_map[name] = re.sub(old, new, code_map[name])
+
+    def replace_code(self, old: str, new: str) -> None:
+        self.substitute_code(old, new)
         self.init_program()
         self.refresh_id()
 
@@ -151,14 +186,20 @@ class ShaderWrapper(object):
     # Adding data
 
     def read_in(self, data_list: Iterable[np.ndarray]):
-        total_len = sum(map(len, data_list))
+        if self.n_instances > 0:
+            # Buffers laid out for instanced rendering can't be reused
+            self.release()
+            self.init_program()
+        self.data_lengths = np.array(list(map(len, data_list)), dtype=int)
+        self.data_offsets = np.cumsum([0, *self.data_lengths[:-1]], dtype=int)
+        total_len = int(self.data_lengths.sum())
         if total_len == 0:
             if self.vbo is not None:
                 self.vbo.clear()
             return
 
         # If possible, read concatenated data into existing list
-        if len(self.vert_data) != total_len:
+        if len(self.vert_data) != total_len or not self.vert_data.flags.writeable:
             self.vert_data = np.concatenate(data_list)
         else:
             np.concatenate(data_list, out=self.vert_data)
@@ -173,6 +214,48 @@ class ShaderWrapper(object):
         else:
             self.vbo.write(self.vert_data)
 
+    def read_in_changes(self, index_to_data: dict[int, np.ndarray]) -> bool:
+        """
+        Replaces some of the arrays passed into the last call to read_in,
+        identified by their index in that list, writing only the corresponding
+        ranges of the vbo. If any of their lengths differ from before, nothing
+        is written, and this returns False, in which case read_in is needed.
+        """
+        if self.vbo is None or self.n_instances > 0:
+            return False
+        if any(len(data) != self.data_lengths[index] for index, data in index_to_data.items()):
+            return False
+
+        # Group adjacent indices, so that each run is one write to the vbo
+        indices = sorted(index_to_data)
+        runs = []
+        for index in indices:
+            if runs and runs[-1][-1] == index - 1:
+                runs[-1].append(index)
+            else:
+                runs.append([index])
+
+        itemsize = self.vert_data.itemsize
+        for run in runs:
+            start = self.data_offsets[run[0]]
+            end = self.data_offsets[run[-1]] + self.data_lengths[run[-1]]
+            if end == start:
+                continue
+            if len(run) == 1:
+                self.vert_data[start:end] = index_to_data[run[0]]
+            else:
+                np.concatenate([index_to_data[i] for i in run], out=self.vert_data[start:end])
+            self.vbo.write(self.vert_data[start:end], offset=int(start * itemsize))
+        return True
+
+    def read_in_instances(self, data_list: list[np.ndarray]) -> bool:
+        """
+        Alternative to read_in for when all arrays in data_list might be
+        copies of one another, to be drawn with instanced rendering. This
+        returns False, without reading in anything, if that is not possible.
+        """
+        return False
+
     def generate_vaos(self):
         # Vertex array object
         self.vaos = [
@@ -204,7 +287,7 @@ class ShaderWrapper(object):
                     set_program_uniform(program, name, value)
 
     def release(self):
-        for obj in (self.vbo, *self.vaos):
+        for obj in (self.vbo, self.instance_vbo, *self.vaos):
             if obj is not None:
                 obj.release()
         self.init_vertex_objects()
@@ -254,22 +337,41 @@ class VShaderWrapper(ShaderWrapper):
             for name in ["vert", "geom", "frag"]
         }
 
-    def init_program(self):
+    def get_source_files(self) -> list[str]:
+        return [
+            source_file
+            for vtype in ["stroke", "fill", "depth"]
+            for name in ["vert", "geom", "frag"]
+            for source_file in get_shader_file_sources(
+                os.path.join("quadratic_bezier", f"{vtype}", f"{name}.glsl")
+            )
+        ]
+
+    def init_program(self, instanced: bool = False):
+        vert_code = {
+            vtype: self.program_code[f"{vtype}_vert"]
+            for vtype in ["stroke", "fill", "depth"]
+        }
+        if instanced:
+            # Adds a per-instance shift to all points
+            for vtype, code in vert_code.items():
+                vert_code[vtype] = code.replace("#version 330", "#version 330\n#define INSTANCED", 1)
+
         self.stroke_program = get_shader_program(
             self.ctx,
-            vertex_shader=self.program_code["stroke_vert"],
+            vertex_shader=vert_code["stroke"],
             geometry_shader=self.program_code["stroke_geom"],
             fragment_shader=self.program_code["stroke_frag"],
         )
         self.fill_program = get_shader_program(
             self.ctx,
-            vertex_shader=self.program_code["fill_vert"],
+            vertex_shader=vert_code["fill"],
             geometry_shader=self.program_code["fill_geom"],
             fragment_shader=self.program_code["fill_frag"],
         )
         self.fill_border_program = get_shader_program(
             self.ctx,
-            vertex_shader=self.program_code["stroke_vert"],
+            vertex_shader=vert_code["stroke"],
             geometry_shader=self.program_code["stroke_geom"],
             fragment_shader=self.program_code["stroke_frag"].replace(
                 "// MODIFY FRAG COLOR",
@@ -278,7 +380,7 @@ class VShaderWrapper(ShaderWrapper):
         )
         self.fill_depth_program = get_shader_program(
             self.ctx,
-            vertex_shader=self.program_code["depth_vert"],
+            vertex_shader=vert_code["depth"],
             geometry_shader=self.program_code["depth_geom"],
             fragment_shader=self.program_code["depth_frag"],
         )
@@ -304,34 +406,119 @@ class VShaderWrapper(ShaderWrapper):
         self.fill_depth_vert_format = '3f 40x 3f 4x'
         self.fill_depth_vert_attributes = ['point', 'base_normal']
 
+        if instanced:
+            # Per-instance data holds only instance_shift, 3 floats
+            for vtype in ["stroke", "fill", "fill_border", "fill_depth"]:
+                setattr(self, f"{vtype}_instance_format", '3f/i')
+                setattr(self, f"{vtype}_instance_attributes", ['instance_shift'])
+
     def init_vertex_objects(self):
         self.vbo = None
+        self.instance_vbo = None
+        self.n_instances = 0
         self.stroke_vao = None
         self.fill_vao = None
         self.fill_border_vao = None
         self.vaos = []
 
+    def read_in_instances(self, data_list: list[np.ndarray]) -> bool:
+        """
+        If all arrays in data_list are the same up to a shift, only the first
+        is read into the vbo, and the shifts are read into a per-instance
+        buffer, so that all are drawn with instanced rendering.
+        """
+        instance_data = self.get_instance_data(data_list)
+        if instance_data is None:
+            return False
+        base_data = data_list[0]
+
+        sizes_match = (
+            self.n_instances == len(instance_data) and
+            self.vbo.size == base_data.nbytes
+        )
+        if not sizes_match:
+            was_instanced = self.n_instances > 0
+            self.release()
+            if not was_instanced:
+                self.init_program(instanced=True)
+            self.vert_data = np.array(base_data)
+            self.vbo = self.ctx.buffer(self.vert_data)
+            self.instance_vbo = self.ctx.buffer(instance_data)
+            self.n_instances = len(instance_data)
+            self.generate_vaos()
+        else:
+            self.vert_data[:] = base_data
+            self.vbo.write(self.vert_data)
+            self.instance_vbo.write(instance_data)
+        self.data_lengths = np.array(list(map(len, data_list)), dtype=int)
+        self.data_offsets = np.zeros(len(data_list), dtype=int)
+        return True
+
+    @staticmethod
+    def get_instance_data(data_list: list[np.ndarray]) -> Optional[np.ndarray]:
+        """
+        Returns an array with the shift taking the first of the arrays in
+        data_list to each of them, or None if they differ in any other way.
+        """
+        if len(data_list) < 2 or len(data_list[0]) == 0:
+            return None
+        if any(len(data) != len(data_list[0]) for data in data_list):
+            return None
+        stack = np.concatenate(data_list, dtype=data_list[0].dtype).reshape(len(data_list), -1)
+        points = stack["point"]
+        shifts = points[:, 0] - points[0, 0]
+        # Allow for floating point error from applying the shifts
+        atol = INSTANCE_TOLERANCE * max(1.0, float(np.abs(points).max()))
+        if np.abs(points - shifts[:, np.newaxis] - points[0]).max() > atol:
+            return None
+
+        # For every third vertex, starting with the second, base_normal holds
+        # the unit normal, and for the others, the first point
+        base_normals = stack["base_normal"]
+        holds_point = (np.arange(stack.shape[1]) % 3 != 1)[:, np.newaxis]
+        if np.abs(base_normals - holds_point * shifts[:, np.newaxis] - base_normals[0]).max() > atol:
+            return None
+        # Joint angles are computed from the shifted points, so carry
+        # their floating point error, magnified for short curves
+        if np.abs(stack["joint_angle"] - stack["joint_angle"][0]).max() > JOINT_ANGLE_TOLERANCE:
+            return None
+        for key in ["stroke_rgba", "stroke_width", "fill_rgba", "fill_border_width"]:
+            if (stack[key] != stack[key][0]).any():
+                return None
+
+        instance_data = np.zeros(len(stack), dtype=[('instance_shift', np.float32, (3,))])
+        instance_data["instance_shift"] = shifts
+        return instance_data
+
     def generate_vaos(self):
+        def get_content(vtype: str):
+            content = [(self.vbo, getattr(self, f"{vtype}_vert_format"), *getattr(self, f"{vtype}_vert_attributes"))]
+            if self.n_instances > 0:
+                content.append((self.instance_vbo, getattr(self, f"{vtype}_instance_format"), *getattr(self, f"{vtype}_instance_attributes")))
+            return content
+
         self.stroke_vao = self.ctx.vertex_array(
             program=self.stroke_program,
-            content=[(self.vbo, self.stroke_vert_format, *self.stroke_vert_attributes)],
+            content=get_content("stroke"),
             mode=self.render_primitive,
         )
         self.fill_vao = self.ctx.vertex_array(
             program=self.fill_program,
-            content=[(self.vbo, self.fill_vert_format, *self.fill_vert_attributes)],
+            content=get_content("fill"),
             mode=self.render_primitive,
         )
         self.fill_border_vao = self.ctx.vertex_array(
             program=self.fill_border_program,
-            content=[(self.vbo, self.fill_border_vert_format, *self.fill_border_vert_attributes)],
+            content=get_content("fill_border"),
             mode=self.render_primitive,
         )
         self.fill_depth_vao = self.ctx.vertex_array(
             program=self.fill_depth_program,
-            content=[(self.vbo, self.fill_depth_vert_format, *self.fill_depth_vert_attributes)],
+            content=get_content("fill_depth"),
             mode=self.render_primitive,
         )
+        for vao in (self.stroke_vao, self.fill_vao, self.fill_border_vao, self.fill_depth_vao):
+            vao.instances = max(self.n_instances, 1)
         self.vaos = [self.stroke_vao, self.fill_vao, self.fill_border_vao, self.fill_depth_vao]
 
     def set_backstroke(self, value: bool = True):
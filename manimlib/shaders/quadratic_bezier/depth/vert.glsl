@@ -2,6 +2,9 @@
 
 in vec3 point;
 in vec3 base_normal;
+#ifdef INSTANCED
+in vec3 instance_shift;
+#endif
 
 out vec3 verts;
 out vec3 v_base_point;
@@ -9,4 +12,8 @@ out vec3 v_base_point;
 void main(){
     verts = point;
     v_base_point = base_normal;
+#ifdef INSTANCED
+    verts += instance_shift;
+    v_base_point += instance_shift;
+#endif
 }
\ No newline at end of file
@@ -3,6 +3,9 @@
 in vec3 point;
 in vec4 fill_rgba;
 in vec3 base_normal;
+#ifdef INSTANCED
+in vec3 instance_shift;
+#endif
 
 out vec3 verts;  // Bezier control point
 out vec4 v_color;
@@ -12,4 +15,9 @@ void main(){
     verts = point;
     v_color = fill_rgba;
     v_base_normal = base_normal;
+#ifdef INSTANCED
+    // Every third vertex carries the unit normal, the rest the base point
+    verts += instance_shift;
+    if(gl_VertexID % 3 != 1) v_base_normal += instance_shift;
+#endif
 }
\ No newline at end of file
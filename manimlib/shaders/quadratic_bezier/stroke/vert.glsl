@@ -9,6 +9,9 @@ in vec4 stroke_rgba;
 in float stroke_width;
 in float joint_angle;
 in vec3 unit_normal;
+#ifdef INSTANCED
+in vec3 instance_shift;
+#endif
 
 // Bezier control point
 out vec3 verts;
@@ -22,6 +25,9 @@ const float STROKE_WIDTH_CONVERSION = 0.01;
 
 void main(){
     verts = point;
+#ifdef INSTANCED
+    verts += instance_shift;
+#endif
     v_color = stroke_rgba;
     v_stroke_width = STROKE_WIDTH_CONVERSION * stroke_width * mix(frame_scale, 1, scale_stroke_with_zoom);
     v_joint_angle = joint_angle;
@@ -91,6 +91,63 @@ def partial_quadratic_bezier_points(
     return [h0, h1, h2]
 
 
+def partial_quadratic_bezier_curves(
+    curves: np.ndarray,
+    a: np.ndarray,
+    b: np.ndarray
+) -> np.ndarray:
+    """
+    Same as partial_quadratic_bezier_points for an array of curves, with
+    shape (n, 3, dim), each taking its own a and b.  All arithmetic is
+    carried out in the data type of the curves
+    """
+    dtype = curves.dtype
+    p0, p1, p2 = curves[:, 0], curves[:, 1], curves[:, 2]
+
+    def scalars(values):
+        return np.asarray(values).astype(dtype)[:, np.newaxis]
+
+    def curve(t):
+        t1 = scalars(1 - t)
+        t0 = scalars(t)
+        return p0 * t1 * t1 + 2 * p1 * t0 * t1 + p2 * t0 * t0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        h0 = np.where((a > 0)[:, np.newaxis], curve(a), p0)
+        h2 = np.where((b < 1)[:, np.newaxis], curve(b), p2)
+        h1_prime = scalars(1 - a) * p1 + scalars(a) * p2
+        end_prop = (b - a) / (1. - a)
+        h1 = scalars(1 - end_prop) * h0 + scalars(end_prop) * h1_prime
+    result = np.stack([h0, h1, h2], axis=1)
+    result[a == 1] = p2[a == 1, np.newaxis]
+    return result
+
+
+def subdivide_quadratic_bezier_path(
+    points: Vect3Array,
+    n_pieces: Sequence[int] | np.ndarray
+) -> Vect3Array:
+    """
+    Given the points of a quadratic bezier path, with anchors at even
+    indices, splits the i'th curve into n_pieces[i] curves spanning
+    equal ranges of its parameter, for all curves at once
+    """
+    n_pieces = np.asarray(n_pieces, dtype=int)
+    curve_indices = np.repeat(np.arange(len(n_pieces)), n_pieces)
+    piece_indices = np.arange(len(curve_indices)) + np.repeat(n_pieces - n_pieces.cumsum(), n_pieces)
+    a = (piece_indices / n_pieces[curve_indices])[:, np.newaxis]
+    b = ((piece_indices + 1) / n_pieces[curve_indices])[:, np.newaxis]
+    p0 = points[0:-1:2][curve_indices]
+    p1 = points[1::2][curve_indices]
+    p2 = points[2::2][curve_indices]
+    # The handle and end of each piece, from the blossom of its curve
+    new_points = np.empty((2 * len(curve_indices) + 1, points.shape[1]))
+    new_points[0] = points[0]
+    new_points[1::2] = (1 - a) * (1 - b) * p0 + ((1 - a) * b + a * (1 - b)) * p1 + a * b * p2
+    new_points[2::2] = (1 - b) * (1 - b) * p0 + 2 * (1 - b) * b * p1 + b * b * p2
+    return new_points
+
+
 # Linear interpolation variants
 
 
@@ -150,6 +207,24 @@ def integer_interpolate(
     return (value, residue)
 
 
+def integer_interpolate_array(
+    start: int,
+    end: int | np.ndarray,
+    alphas: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Same as integer_interpolate for an array of alphas, where end may
+    also be an array of the same length
+    """
+    alphas = np.asarray(alphas, dtype=float)
+    end = np.broadcast_to(end, alphas.shape)
+    values = interpolate(start, end, alphas).astype(int)
+    residues = ((end - start) * alphas) % 1
+    values = np.where(alphas >= 1, end - 1, np.where(alphas <= 0, start, values))
+    residues = np.where(alphas >= 1, 1.0, np.where(alphas <= 0, 0.0, residues))
+    return (values, residues)
+
+
 def mid(start: Scalable, end: Scalable) -> Scalable:
     return (start + end) / 2.0
 
@@ -217,6 +292,54 @@ def approx_smooth_quadratic_bezier_handles(
     return handles
 
 
+def approx_smooth_quadratic_bezier_handles_for_times(
+    points: FloatArray,
+    times: FloatArray
+) -> FloatArray:
+    """
+    Like approx_smooth_quadratic_bezier_handles, but for points sampled at
+    the given, possibly unevenly spaced, times.
+
+    For each three successive points, this fits the parabola passing through
+    them at their times, whose restrictions to the two intervals are exactly
+    quadratic bezier curves, and each handle is the average of the two such
+    candidates for its interval.  With evenly spaced times, this agrees with
+    approx_smooth_quadratic_bezier_handles.
+    """
+    if len(points) == 1:
+        return points[0]
+    elif len(points) == 2:
+        return midpoint(*points)
+    closed = np.isclose(points[0], points[-1]).all()
+    if closed:
+        # Wrap around, so that both candidates exist for every interval
+        points = np.vstack([points[-2], points, points[1]])
+        times = np.hstack([
+            times[0] - (times[-1] - times[-2]),
+            times,
+            times[-1] + (times[1] - times[0]),
+        ])
+    p0, p1, p2 = points[:-2], points[1:-1], points[2:]
+    dt1 = (times[1:-1] - times[:-2])[:, np.newaxis]
+    dt2 = (times[2:] - times[1:-1])[:, np.newaxis]
+    dt12 = dt1 + dt2
+    # Handles for the first and second intervals of each parabola
+    first_handles = p0 + 0.5 * (
+        -p0 * (2 * dt1 + dt2) / dt12
+        + p1 * dt12 / dt2
+        - p2 * dt1**2 / (dt2 * dt12)
+    )
+    second_handles = p1 + 0.5 * (
+        -p0 * dt2**2 / (dt1 * dt12)
+        + p1 * (dt2 - dt1) / dt1
+        + p2 * dt1 / dt12
+    )
+    handles = 0.5 * (first_handles[1:] + second_handles[:-1])
+    if closed:
+        return handles
+    return np.vstack([first_handles[:1], handles, second_handles[-1:]])
+
+
 def smooth_quadratic_path(anchors: Vect3Array) -> Vect3Array:
     """
     Returns a path defining a smooth quadratic bezier spline
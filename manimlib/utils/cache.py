@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import shutil
 from diskcache import Cache
 from contextlib import contextmanager
 from functools import wraps
@@ -11,17 +12,26 @@ from manimlib.utils.simple_functions import hash_string
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from typing import Any, Callable, TypeVar
     T = TypeVar('T')
 
 
 CACHE_SIZE = 1e9  # 1 Gig
 _cache = Cache(get_cache_dir(), size_limit=CACHE_SIZE)
 
+# Subdirectory of the cache directory where SVGMobject saves the geometry
+# it parses, to be reused across runs
+SVG_CACHE_SUBDIR = "svg_mobjects"
+
+
+def get_cache_key(func: Callable, args: tuple, kwargs: dict) -> str:
+    return hash_string(f"{func.__name__}{args}{kwargs}")
+
 
 def cache_on_disk(func: Callable[..., T]) -> Callable[..., T]:
     @wraps(func)
     def wrapper(*args, **kwargs):
-        key = hash_string(f"{func.__name__}{args}{kwargs}")
+        key = get_cache_key(func, args, kwargs)
         value = _cache.get(key)
         if value is None:
             value = func(*args, **kwargs)
@@ -30,5 +40,22 @@ def cache_on_disk(func: Callable[..., T]) -> Callable[..., T]:
     return wrapper
 
 
+def is_cached_on_disk(func: Callable, *args, **kwargs) -> bool:
+    """
+    Whether func, decorated with cache_on_disk, has a value
+    cached for these arguments
+    """
+    return get_cache_key(func, args, kwargs) in _cache
+
+
+def set_cached_value(value: Any, func: Callable, *args, **kwargs) -> None:
+    """
+    Stores value as what func, decorated with cache_on_disk,
+    returns for these arguments
+    """
+    _cache.set(get_cache_key(func, args, kwargs), value)
+
+
 def clear_cache():
     _cache.clear()
+    shutil.rmtree(os.path.join(get_cache_dir(), SVG_CACHE_SUBDIR), ignore_errors=True)
@@ -101,6 +101,28 @@ def color_gradient(
     ]
 
 
+def rgb_gradient(
+    reference_colors: Iterable[ManimColor],
+    length_of_output: int,
+) -> Vect3Array:
+    """
+    Same as color_gradient, but as an array of rgb values, computed
+    without building a Color for each
+    """
+    rgbs = np.array([color_to_rgb(color) for color in reference_colors])
+    if length_of_output == 0:
+        return np.zeros((0, 3))
+    if len(rgbs) == 1:
+        return rgbs.repeat(length_of_output, axis=0)
+    alphas = np.linspace(0, (len(rgbs) - 1), length_of_output)
+    floors = alphas.astype('int')
+    alphas_mod1 = alphas % 1
+    # End edge case
+    alphas_mod1[-1] = 1
+    floors[-1] = len(rgbs) - 2
+    return np.sqrt(interpolate(rgbs[floors]**2, rgbs[floors + 1]**2, alphas_mod1[:, np.newaxis]))
+
+
 def interpolate_color(
     color1: ManimColor,
     color2: ManimColor,
@@ -1,23 +1,41 @@
 from __future__ import annotations
 
+import json
 import os
+from pathlib import Path
 import re
 from functools import lru_cache
+from weakref import WeakKeyDictionary
 import moderngl
 from PIL import Image
 import numpy as np
 
+from manimlib.logger import log
+from manimlib.utils.directories import get_cache_dir
 from manimlib.utils.directories import get_shader_dir
 from manimlib.utils.file_ops import find_file
+from manimlib.utils.simple_functions import hash_string
 
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from typing import Sequence, Optional
+    from typing import Iterable, Sequence, Optional
 
 
-# Global maps to reflect uniform status
-PROGRAM_UNIFORM_MIRRORS: dict[int, dict[str, float | tuple]] = dict()
+# Global maps to reflect uniform status. These are dropped along with
+# their programs, whose ids may otherwise be reused by new programs
+PROGRAM_UNIFORM_MIRRORS: WeakKeyDictionary[moderngl.Program, dict[str, float | tuple]] = WeakKeyDictionary()
+
+# Processed shader code and the sources of linked programs are kept in
+# these subdirectories of the cache directory, to be reused across runs
+SHADER_CODE_CACHE_SUBDIR = os.path.join("shaders", "code")
+SHADER_PROGRAM_CACHE_SUBDIR = os.path.join("shaders", "programs")
+PROCESSED_PROGRAM_CODE: dict[str, dict[str, str | None]] = dict()
+# Only this many of the most recently used programs are prewarmed
+MAX_PREWARMED_PROGRAMS = 32
+# Paths of the files read in by get_shader_code_from_file for each name,
+# including those of any #INSERT lines
+SHADER_FILE_SOURCES: dict[str, list[str]] = dict()
 
 
 @lru_cache()
@@ -30,17 +48,176 @@ def image_path_to_texture(path: str, ctx: moderngl.Context) -> moderngl.Texture:
     )
 
 
-@lru_cache()
 def get_shader_program(
         ctx: moderngl.context.Context,
         vertex_shader: str,
         fragment_shader: Optional[str] = None,
         geometry_shader: Optional[str] = None,
 ) -> moderngl.Program:
-    return ctx.program(
+    # Passed on positionally, so that the cached program is found
+    # whichever way the shaders were passed in here
+    return link_shader_program(ctx, vertex_shader, fragment_shader, geometry_shader)
+
+
+@lru_cache()
+def link_shader_program(
+        ctx: moderngl.context.Context,
+        vertex_shader: str,
+        fragment_shader: Optional[str],
+        geometry_shader: Optional[str],
+) -> moderngl.Program:
+    program = ctx.program(
+        vertex_shader=vertex_shader,
+        fragment_shader=fragment_shader,
+        geometry_shader=geometry_shader,
+    )
+    # moderngl does not expose program binaries, so it's the sources which
+    # are remembered, for prewarm_shader_programs to link in later runs
+    save_to_shader_cache(SHADER_PROGRAM_CACHE_SUBDIR, dict(
         vertex_shader=vertex_shader,
         fragment_shader=fragment_shader,
         geometry_shader=geometry_shader,
+    ))
+    return program
+
+
+def prewarm_shader_programs(ctx: moderngl.context.Context) -> None:
+    """
+    Links the programs most recently used in earlier runs with the present
+    shader files, so that the first frames don't pay for it. Entries from
+    other versions of the shader files, and beyond MAX_PREWARMED_PROGRAMS,
+    are cleared out along the way.
+    """
+    program_codes = load_shader_cache(SHADER_PROGRAM_CACHE_SUBDIR, MAX_PREWARMED_PROGRAMS)
+    for program_code in program_codes:
+        try:
+            get_shader_program(ctx, **program_code)
+        except Exception as err:
+            log.debug(f"Could not prewarm shader program: {err}")
+
+
+@lru_cache()
+def get_shader_dir_fingerprint() -> str:
+    """
+    Changes whenever any file in the shader directory does
+    """
+    shader_dir = Path(get_shader_dir())
+    return hash_string("".join(
+        f"{path.relative_to(shader_dir)}{path.stat().st_mtime_ns}{path.stat().st_size}"
+        for path in sorted(shader_dir.rglob("*.glsl"))
+    ))
+
+
+def get_shader_cache_path(subdir: str, key: str) -> Path:
+    directory = Path(get_cache_dir(), subdir)
+    return Path(directory, hash_string(get_shader_dir_fingerprint() + key) + ".json")
+
+
+def save_to_shader_cache(
+    subdir: str,
+    value: dict,
+    key: Optional[str] = None,
+    overwrite: bool = False
+) -> None:
+    if key is None:
+        key = json.dumps(value, sort_keys=True)
+    path = get_shader_cache_path(subdir, key)
+    if path.exists() and not overwrite:
+        # Marks it as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written to a temporary file first, since other processes,
+        # such as those of a parallel render, may read it at any time
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "w") as fp:
+            json.dump(dict(fingerprint=get_shader_dir_fingerprint(), value=value), fp)
+        os.replace(temp_path, path)
+    except OSError as err:
+        log.debug(f"Could not write to shader cache: {err}")
+
+
+def load_from_shader_cache(subdir: str, key: str) -> Optional[dict]:
+    try:
+        with open(get_shader_cache_path(subdir, key), "r") as fp:
+            return json.load(fp)["value"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def load_shader_cache(subdir: str, max_entries: Optional[int] = None) -> list[dict]:
+    """
+    Values of the entries in subdir, most recently used first, deleting
+    those beyond max_entries or from other versions of the shader files
+    """
+    fingerprint = get_shader_dir_fingerprint()
+    result = []
+    paths = []
+    for path in Path(get_cache_dir(), subdir).glob("*.json"):
+        try:
+            paths.append((path.stat().st_mtime_ns, path))
+        except OSError:
+            continue
+    for index, (mtime, path) in enumerate(sorted(paths, reverse=True)):
+        try:
+            if max_entries is not None and index >= max_entries:
+                path.unlink()
+                continue
+            with open(path, "r") as fp:
+                entry = json.load(fp)
+            if entry["fingerprint"] == fingerprint:
+                result.append(entry["value"])
+            else:
+                path.unlink()
+        except (OSError, ValueError, KeyError):
+            continue
+    return result
+
+
+def get_source_signatures(source_files: Iterable[str]) -> dict[str, list[int]]:
+    result = dict()
+    for source_file in source_files:
+        stat = os.stat(source_file)
+        result[source_file] = [stat.st_mtime_ns, stat.st_size]
+    return result
+
+
+def get_cached_program_code(key: str) -> Optional[dict[str, str | None]]:
+    """
+    Processed code saved by cache_program_code, so long as none of
+    the files it was read from has changed since
+    """
+    if key not in PROCESSED_PROGRAM_CODE:
+        entry = load_from_shader_cache(SHADER_CODE_CACHE_SUBDIR, key)
+        try:
+            if entry is None or get_source_signatures(entry["sources"]) != entry["sources"]:
+                return None
+        except (OSError, KeyError, TypeError):
+            return None
+        PROCESSED_PROGRAM_CODE[key] = entry["code"]
+    return dict(PROCESSED_PROGRAM_CODE[key])
+
+
+def cache_program_code(
+    key: str,
+    program_code: dict[str, str | None],
+    source_files: Iterable[str]
+) -> None:
+    PROCESSED_PROGRAM_CODE[key] = dict(program_code)
+    try:
+        sources = get_source_signatures(source_files)
+    except OSError:
+        return
+    # Overwrites any entry left from before its sources changed
+    save_to_shader_cache(
+        SHADER_CODE_CACHE_SUBDIR,
+        dict(code=program_code, sources=sources),
+        key,
+        overwrite=True,
     )
 
 
@@ -58,10 +235,9 @@ def set_program_uniform(
     Returns True if changed the program, False if it left it as is.
     """
 
-    pid = id(program)
-    if pid not in PROGRAM_UNIFORM_MIRRORS:
-        PROGRAM_UNIFORM_MIRRORS[pid] = dict()
-    uniform_mirror = PROGRAM_UNIFORM_MIRRORS[pid]
+    if program not in PROGRAM_UNIFORM_MIRRORS:
+        PROGRAM_UNIFORM_MIRRORS[program] = dict()
+    uniform_mirror = PROGRAM_UNIFORM_MIRRORS[program]
 
     if type(value) is np.ndarray and value.ndim > 0:
         value = tuple(value.flatten())
@@ -92,6 +268,7 @@ def get_shader_code_from_file(filename: str) -> str | None:
 
     with open(filepath, "r") as f:
         result = f.read()
+    sources = [os.path.abspath(filepath)]
 
     # To share functionality between shaders, some functions are read in
     # from other files an inserted into the relevant strings before
@@ -103,9 +280,21 @@ def get_shader_code_from_file(filename: str) -> str | None:
             os.path.join("inserts", line.replace("#INSERT ", ""))
         )
         result = result.replace(line, inserted_code)
+        sources.extend(get_shader_file_sources(
+            os.path.join("inserts", line.replace("#INSERT ", ""))
+        ))
+    SHADER_FILE_SOURCES[filename] = sources
     return result
 
 
+def get_shader_file_sources(filename: str) -> list[str]:
+    """
+    Paths of all files read in by get_shader_code_from_file(filename)
+    """
+    get_shader_code_from_file(filename)
+    return SHADER_FILE_SOURCES.get(filename, [])
+
+
 def get_colormap_code(rgb_list: Sequence[float]) -> str:
     data = ",".join(
         "vec3({}, {}, {})".format(*rgb)
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from functools import reduce
 import math
-import operator as op
 import platform
 
 from mapbox_earcut import triangulate_float32 as earcut
@@ -420,9 +418,58 @@ def norm_squared(v: VectN | List[float]) -> float:
 
 
 # TODO, fails for polygons drawn over themselves
-def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int]) -> list[int]:
+def find_box_containments(
+    mins: Vect2Array,
+    maxs: Vect2Array,
+    max_n_pairs_to_check: int = 4096,
+) -> tuple[np.ndarray, np.ndarray]:
     """
-    Returns a list of indices giving a triangulation
+    Given the corners of axis-aligned boxes, returns arrays of indices i
+    and j such that box i lies within box j, for distinct i and j
+
+    For many boxes, rather than checking all pairs, each box is listed in
+    every cell it overlaps of a uniform grid, about as fine as there are
+    boxes.  Any box containing another is then listed in the cell holding
+    the lower left corner of that other box.
+    """
+    n_boxes = len(mins)
+    if n_boxes**2 <= max_n_pairs_to_check:
+        inners, outers = np.divmod(np.arange(n_boxes**2), n_boxes)
+    else:
+        lower_left = mins.min(0)
+        span = np.maximum(maxs.max(0) - lower_left, 1e-6)
+        cell_size = max(np.sqrt(span.prod() / n_boxes), *(span / n_boxes))
+        grid_shape = (span // cell_size).astype(int) + 1
+        cell_mins = ((mins - lower_left) // cell_size).astype(int).clip(0, grid_shape - 1)
+        cell_maxs = ((maxs - lower_left) // cell_size).astype(int).clip(0, grid_shape - 1)
+        cell_spans = cell_maxs - cell_mins + 1
+        n_cells = cell_spans.prod(1)
+        listed_boxes = np.repeat(np.arange(n_boxes), n_cells)
+        offsets = np.arange(len(listed_boxes)) + np.repeat(n_cells - n_cells.cumsum(), n_cells)
+        cell_xs = cell_mins[listed_boxes, 0] + offsets % cell_spans[listed_boxes, 0]
+        cell_ys = cell_mins[listed_boxes, 1] + offsets // cell_spans[listed_boxes, 0]
+        listed_cells = cell_xs * grid_shape[1] + cell_ys
+        cell_order = np.argsort(listed_cells, kind="stable")
+        listed_cells = listed_cells[cell_order]
+        listed_boxes = listed_boxes[cell_order]
+
+        query_cells = cell_mins[:, 0] * grid_shape[1] + cell_mins[:, 1]
+        lows = np.searchsorted(listed_cells, query_cells, side="left")
+        highs = np.searchsorted(listed_cells, query_cells, side="right")
+        n_listed = highs - lows
+        inners = np.repeat(np.arange(n_boxes), n_listed)
+        outers = listed_boxes[
+            np.arange(len(inners)) + np.repeat(lows + n_listed - n_listed.cumsum(), n_listed)
+        ]
+    contained = (inners != outers) \
+        & (mins[outers] <= mins[inners]).all(1) \
+        & (maxs[inners] <= maxs[outers]).all(1)
+    return inners[contained], outers[contained]
+
+
+def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int]) -> np.ndarray:
+    """
+    Returns an array of indices giving a triangulation
     of a polygon, potentially with holes
 
     - verts is a numpy array of points
@@ -430,79 +477,83 @@ def earclip_triangulation(verts: Vect3Array | Vect2Array, ring_ends: list[int])
     - ring_ends is a list of indices indicating where
     the ends of new paths are
     """
-
-    rings = [
-        list(range(e0, e1))
-        for e0, e1 in zip([0, *ring_ends], ring_ends)
-    ]
+    ring_ends = np.array(ring_ends, dtype=int)
+    ring_starts = np.array([0, *ring_ends[:-1]], dtype=int)
+    n_rings = len(ring_ends)
     epsilon = 1e-6
+    if n_rings == 0:
+        return np.zeros(0, dtype=int)
 
     def is_in(point, ring_id):
-        return abs(abs(get_winding_number([i - point for i in verts[rings[ring_id]]])) - 1) < epsilon
-
-    def ring_area(ring_id):
-        ring = rings[ring_id]
-        s = 0
-        for i, j in zip(ring[1:], ring):
-            s += cross2d(verts[i], verts[j])
-        return abs(s) / 2
+        vects = verts[ring_starts[ring_id]:ring_ends[ring_id], :2] - point[:2]
+        angles = np.arctan2(vects[:, 1], vects[:, 0])
+        d_angles = (np.diff(angles, append=angles[:1]) + PI) % TAU - PI
+        return abs(abs(d_angles.sum() / TAU) - 1) < epsilon
 
     # Points at the same position may cause problems
-    for i in rings:
-        if len(i) < 2:
-            continue
-        verts[i[0]] += (verts[i[1]] - verts[i[0]]) * epsilon
-        verts[i[-1]] += (verts[i[-2]] - verts[i[-1]]) * epsilon
+    firsts = ring_starts[ring_ends - ring_starts >= 2]
+    lasts = ring_ends[ring_ends - ring_starts >= 2] - 1
+    verts[firsts] += (verts[firsts + 1] - verts[firsts]) * epsilon
+    verts[lasts] += (verts[lasts - 1] - verts[lasts]) * epsilon
+
+    if n_rings == 1:
+        return earcut(verts[:ring_ends[0], :2], ring_ends.astype(np.uint32)).astype(int)
 
     # First, we should know which rings are directly contained in it for each ring
 
-    right = [max(verts[rings[i], 0]) for i in range(len(rings))]
-    left = [min(verts[rings[i], 0]) for i in range(len(rings))]
-    top = [max(verts[rings[i], 1]) for i in range(len(rings))]
-    bottom = [min(verts[rings[i], 1]) for i in range(len(rings))]
-    area = [ring_area(i) for i in range(len(rings))]
+    xys = verts[:, :2]
+    mins = np.minimum.reduceat(xys, ring_starts)
+    maxs = np.maximum.reduceat(xys, ring_starts)
+    crosses = np.append(cross2d(xys[1:], xys[:-1]), 0)
+    crosses[ring_ends - 1] = 0
+    area = abs(np.add.reduceat(crosses, ring_starts)) / 2
 
     # The larger ring must be outside
-    rings_sorted = list(range(len(rings)))
-    rings_sorted.sort(key=lambda x: area[x], reverse=True)
-
-    def is_in_fast(ring_a, ring_b):
-        # Whether a is in b
-        return reduce(op.and_, (
-            left[ring_b] <= left[ring_a] <= right[ring_a] <= right[ring_b],
-            bottom[ring_b] <= bottom[ring_a] <= top[ring_a] <= top[ring_b],
-            is_in(verts[rings[ring_a][0]], ring_b)
-        ))
-
-    chilren = [[] for i in rings]
-    ringenum = ProgressDisplay(
-        enumerate(rings_sorted),
-        total=len(rings),
+    rings_sorted = np.argsort(-area, kind="stable")
+    ranks = np.empty(n_rings, dtype=int)
+    ranks[rings_sorted] = np.arange(n_rings)
+
+    # Candidate parents are larger rings whose bounding boxes contain theirs
+    children, parents = find_box_containments(mins, maxs)
+    candidate = ranks[parents] < ranks[children]
+    children = children[candidate]
+    parents = parents[candidate]
+
+    # The direct parent is the smallest candidate which actually contains
+    # the ring, so candidates are checked from smallest to largest
+    pair_order = np.lexsort((-ranks[parents], children))
+    children = children[pair_order]
+    parents = parents[pair_order]
+
+    chilren = [[] for i in range(n_rings)]
+    found = np.zeros(n_rings, dtype=bool)
+    pairs = ProgressDisplay(
+        zip(children, parents),
+        total=len(children),
         leave=False,
         ascii=True if platform.system() == 'Windows' else None,
         dynamic_ncols=True,
         desc="SVG Triangulation",
         delay=3,
+        disable=len(children) < 1000,
     )
-    for idx, i in ringenum:
-        for j in rings_sorted[:idx][::-1]:
-            if is_in_fast(i, j):
-                chilren[j].append(i)
-                break
+    for i, j in pairs:
+        if not found[i] and is_in(verts[ring_starts[i]], j):
+            chilren[j].append(i)
+            found[i] = True
 
     res = []
 
     # Then, we can use earcut for each part
-    used = [False] * len(rings)
+    used = [False] * n_rings
     for i in rings_sorted:
         if used[i]:
             continue
-        v = rings[i]
-        ring_ends = [len(v)]
-        for j in chilren[i]:
+        parts = [i, *sorted(chilren[i], key=lambda j: ranks[j])]
+        for j in parts[1:]:
             used[j] = True
-            v += rings[j]
-            ring_ends.append(len(v))
-        res += [v[i] for i in earcut(verts[v, :2], ring_ends)]
+        v = np.hstack([np.arange(ring_starts[j], ring_ends[j]) for j in parts])
+        part_ends = np.cumsum(ring_ends[parts] - ring_starts[parts]).astype(np.uint32)
+        res.append(v[earcut(verts[v, :2], part_ends)])
 
-    return res
+    return np.hstack(res).astype(int) if res else np.zeros(0, dtype=int)
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import itertools as it
+import operator as op
+
+import numpy as np
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Iterable
+
+    from manimlib.mobject.mobject import Mobject
+    from manimlib.typing import Vect3
+
+
+class MobjectSpatialIndex(object):
+    """
+    Uniform grid over the (x, y) extents of the bounding boxes of a list of
+    mobjects, answering which of them lie under a point or touch a box.
+
+    Later mobjects in the list are considered to be on top, and results come
+    topmost first, as with a reverse scan through the list.
+
+    Entries are refreshed lazily, before each query. Mobjects are grouped
+    under the mobjects passed to set_mobjects, whose data versions are bumped
+    by note_changed_data whenever anything in their family changes, so only
+    the groups which changed since the last query are looked through again.
+    """
+    def __init__(
+        self,
+        cell_size: float = 0.25,
+        # Mobjects spanning more cells than this are checked on every query
+        max_cells_per_mobject: int = 64,
+    ):
+        self.cell_size = cell_size
+        self.max_cells_per_mobject = max_cells_per_mobject
+        self.set_mobjects([])
+
+    def set_mobjects(self, mobjects: Iterable[Mobject], use_family_members: bool = False) -> None:
+        """
+        Index the given mobjects, or, if use_family_members is True, those
+        of their family members which have points
+        """
+        mobjects = list(mobjects)
+        if getattr(self, "roots", None) is not None \
+                and use_family_members == self.use_family_members \
+                and len(mobjects) == len(self.roots) \
+                and all(map(op.is_, mobjects, self.roots)):
+            # Changes to these are picked up by refresh
+            return
+        self.roots = mobjects
+        self.use_family_members = use_family_members
+        self.needs_rebuild = True
+
+    def get_root_members(self, root: Mobject) -> list[Mobject]:
+        if self.use_family_members:
+            return root.family_members_with_points()
+        return [root]
+
+    def get_mobjects(self) -> list[Mobject]:
+        self.refresh()
+        return list(self.mobjects)
+
+    def rebuild(self) -> None:
+        self.mobjects = []
+        self.root_ranges = []
+        for root in self.roots:
+            start = len(self.mobjects)
+            self.mobjects.extend(self.get_root_members(root))
+            self.root_ranges.append((start, len(self.mobjects)))
+        self.root_versions = [root._data_version for root in self.roots]
+        self.versions = [mob._data_version for mob in self.mobjects]
+
+        n = len(self.mobjects)
+        boxes = np.array([mob.get_bounding_box() for mob in self.mobjects]).reshape((n, 3, 3))
+        self.mins = boxes[:, 0].copy()
+        self.maxs = boxes[:, 2].copy()
+
+        self.grid: dict[tuple[int, int], list[int]] = dict()
+        self.large_indices: set[int] = set()
+        self.cell_ranges: list[tuple[int, int, int, int] | None] = [None] * n
+        cell_ranges = np.floor(np.hstack([self.mins[:, :2], self.maxs[:, :2]]) / self.cell_size)
+        for index, cell_range in enumerate(map(tuple, cell_ranges.astype(int).tolist())):
+            self.add_to_grid(index, cell_range)
+        self.needs_rebuild = False
+
+    def get_cell_range(self, mins: Vect3, maxs: Vect3) -> tuple[int, int, int, int]:
+        x0, y0 = np.floor(np.asarray(mins)[:2] / self.cell_size).astype(int).tolist()
+        x1, y1 = np.floor(np.asarray(maxs)[:2] / self.cell_size).astype(int).tolist()
+        return (x0, y0, x1, y1)
+
+    def get_cells(self, cell_range: tuple[int, int, int, int]) -> Iterable[tuple[int, int]]:
+        x0, y0, x1, y1 = cell_range
+        return it.product(range(x0, x1 + 1), range(y0, y1 + 1))
+
+    def get_num_cells(self, cell_range: tuple[int, int, int, int]) -> int:
+        x0, y0, x1, y1 = cell_range
+        return (x1 - x0 + 1) * (y1 - y0 + 1)
+
+    def add_to_grid(self, index: int, cell_range: tuple[int, int, int, int] | None = None) -> None:
+        if cell_range is None:
+            cell_range = self.get_cell_range(self.mins[index], self.maxs[index])
+        if self.get_num_cells(cell_range) > self.max_cells_per_mobject:
+            self.large_indices.add(index)
+            return
+        self.cell_ranges[index] = cell_range
+        for cell in self.get_cells(cell_range):
+            self.grid.setdefault(cell, []).append(index)
+
+    def remove_from_grid(self, index: int) -> None:
+        cell_range = self.cell_ranges[index]
+        if cell_range is None:
+            self.large_indices.discard(index)
+            return
+        for cell in self.get_cells(cell_range):
+            self.grid[cell].remove(index)
+        self.cell_ranges[index] = None
+
+    def refresh(self) -> None:
+        """
+        Re-bins the mobjects whose data changed since the last query,
+        rebuilding everything if the members of some root have changed
+        """
+        if self.needs_rebuild:
+            self.rebuild()
+            return
+        for i, root in enumerate(self.roots):
+            if root._data_version == self.root_versions[i]:
+                continue
+            start, end = self.root_ranges[i]
+            members = self.get_root_members(root)
+            if len(members) != end - start or not all(map(op.is_, members, self.mobjects[start:end])):
+                self.rebuild()
+                return
+            for index in range(start, end):
+                mob = self.mobjects[index]
+                if mob._data_version == self.versions[index]:
+                    continue
+                bb = mob.get_bounding_box()
+                self.remove_from_grid(index)
+                self.mins[index] = bb[0]
+                self.maxs[index] = bb[2]
+                self.add_to_grid(index)
+                self.versions[index] = mob._data_version
+            self.root_versions[i] = root._data_version
+
+    def get_candidate_indices(self, mins: Vect3, maxs: Vect3) -> np.ndarray:
+        """
+        Indices of all mobjects in cells overlapping the box between
+        mins and maxs, plus those too large to be binned, in order
+        """
+        cell_range = self.get_cell_range(mins, maxs)
+        if self.get_num_cells(cell_range) > len(self.grid):
+            cells = self.grid.keys()
+        else:
+            cells = self.get_cells(cell_range)
+        indices = [
+            index
+            for cell in cells
+            for index in self.grid.get(cell, ())
+        ]
+        indices.extend(self.large_indices)
+        return np.unique(np.array(indices, dtype=int))
+
+    def get_indices_touching_box(self, mins: Vect3, maxs: Vect3, buff: float = 0) -> np.ndarray:
+        """
+        Indices of mobjects whose bounding boxes, expanded by buff,
+        overlap the box between mins and maxs, topmost first
+        """
+        self.refresh()
+        mins = np.asarray(mins)
+        maxs = np.asarray(maxs)
+        candidates = self.get_candidate_indices(mins - buff, maxs + buff)
+        touching = (
+            (self.maxs[candidates] >= mins - buff) & (self.mins[candidates] <= maxs + buff)
+        ).all(1)
+        return candidates[touching][::-1]
+
+    def point_to_mobject(self, point: Vect3, buff: float = 0) -> Mobject | None:
+        """
+        Topmost mobject whose bounding box, expanded by buff, contains point,
+        as Scene.point_to_mobject would find it
+        """
+        indices = self.get_indices_touching_box(point, point, buff)
+        if len(indices) == 0:
+            return None
+        return self.mobjects[indices[0]]
+
+    def get_mobjects_touching(self, mobject: Mobject, buff: float = 1e-2) -> list[Mobject]:
+        """
+        Mobjects which mobject.is_touching, topmost first
+        """
+        bb = mobject.get_bounding_box()
+        return [self.mobjects[index] for index in self.get_indices_touching_box(bb[0], bb[2], buff)]
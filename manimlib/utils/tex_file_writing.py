@@ -4,17 +4,54 @@ import os
 import re
 import yaml
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from functools import lru_cache
 
 from pathlib import Path
 import tempfile
 
 from manimlib.utils.cache import cache_on_disk
+from manimlib.utils.cache import is_cached_on_disk
+from manimlib.utils.cache import set_cached_value
 from manimlib.config import manim_config
 from manimlib.config import get_manim_dir
 from manimlib.logger import log
 from manimlib.utils.simple_functions import hash_string
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Iterable, Iterator
+
+
+# While not None, uncached compilations requested through latex_to_svg
+# are appended here rather than run, see recording_latex_requests
+_latex_requests: list[tuple[str, str, str]] | None = None
+
+# Commands through which one formula could change how later ones on
+# other pages of a batch document come out
+TEX_STATE_COMMANDS = re.compile(r"""\\(?:
+    [gex]?def | let | global | futurelet | catcode | makeatletter
+    | (?:re)?newcommand | providecommand | DeclareRobustCommand
+    | (?:re)?newenvironment | DeclareMathOperator
+    | newcounter | setcounter | addtocounter | stepcounter | refstepcounter
+    | newlength | setlength | addtolength
+)(?![a-zA-Z@])""", re.VERBOSE)
+
+# Put before the pages of a batch document, so that each can start
+# with all counters, such as equation numbers, back at zero
+BATCH_PAGE_SETUP = r"""
+\makeatletter
+\newcommand{\manimresetcounters}{%
+  \begingroup
+  \def\@elt##1{\def\@tempa{##1}\def\@tempb{page}%
+    \ifx\@tempa\@tempb\else\global\csname c@##1\endcsname=0 \fi}%
+  \cl@@ckpt
+  \endgroup}
+\makeatother
+""".strip()
+
 
 def get_tex_template_config(template_name: str) -> dict[str, str]:
     name = template_name.replace(" ", "_").lower()
@@ -78,6 +115,9 @@ def latex_to_svg(
 
     preamble = "\n".join([preamble, additional_preamble])
     full_tex = get_full_tex(latex, preamble)
+    if _latex_requests is not None and not is_cached_on_disk(full_tex_to_svg, full_tex, compiler, message):
+        _latex_requests.append((full_tex, compiler, message))
+        raise LatexRequestRecorded()
     return full_tex_to_svg(full_tex, compiler, message)
 
 
@@ -86,6 +126,114 @@ def full_tex_to_svg(full_tex: str, compiler: str = "latex", message: str = ""):
     if message:
         print(message, end="\r")
 
+    result = compile_tex_to_svg(full_tex, compiler)
+
+    if message:
+        print(" " * len(message), end="\r")
+
+    return result
+
+
+def compile_tex_to_svg(full_tex: str, compiler: str = "latex") -> str:
+    """
+    Runs the compiler and dvisvgm in a fresh working directory, so
+    that any number of these may run at once
+    """
+    with get_working_directory() as temp_dir:
+        dvi_path = run_tex_compiler(full_tex, compiler, temp_dir)
+
+        # Run dvisvgm and capture output directly
+        process = subprocess.run(
+            [
+                "dvisvgm",
+                dvi_path,
+                "-n",  # no fonts
+                "-v", "0",  # quiet
+                "--stdout",  # output to stdout instead of file
+            ],
+            capture_output=True
+        )
+
+        # Return SVG string
+        return process.stdout.decode('utf-8')
+
+
+def compile_tex_batch_to_svgs(
+    contents: list[str],
+    preamble: str = "",
+    compiler: str = "latex"
+) -> list[str]:
+    """
+    Compiles each of contents on its own page of a single document, so
+    that the compiler starts up and reads the preamble only once, and
+    returns the svg for each page.
+
+    Each page starts with all counters reset, and within its own group,
+    but this can't undo global assignments, so contents for which
+    changes_tex_state is True should be compiled on their own.
+    """
+    full_tex = "\n\n".join((
+        "\\documentclass[preview,multi]{standalone}",
+        preamble,
+        BATCH_PAGE_SETUP,
+        "\\begin{document}",
+        *(
+            "\n".join((
+                "\\begin{standalone}\\manimresetcounters",
+                "\\begingroup",
+                content,
+                "\\endgroup",
+                "\\end{standalone}",
+            ))
+            for content in contents
+        ),
+        "\\end{document}"
+    )) + "\n"
+
+    with get_working_directory() as temp_dir:
+        dvi_path = run_tex_compiler(full_tex, compiler, temp_dir)
+        subprocess.run(
+            [
+                "dvisvgm",
+                dvi_path,
+                "-n",  # no fonts
+                "-v", "0",  # quiet
+                "--page=1-",  # all pages
+                f"--output={temp_dir / 'page-%p.svg'}",
+            ],
+            capture_output=True
+        )
+        svg_paths = sorted(
+            temp_dir.glob("page-*.svg"),
+            key=lambda path: int(re.sub(r"\D", "", path.stem))
+        )
+        if len(svg_paths) != len(contents):
+            raise LatexError(f"Expected {len(contents)} pages, found {len(svg_paths)}")
+        return [path.read_text(encoding="utf-8") for path in svg_paths]
+
+
+def changes_tex_state(content: str) -> bool:
+    """
+    Whether content may define macros, or change counters or other
+    state, which would carry over to later pages of a batch document
+    """
+    return TEX_STATE_COMMANDS.search(content) is not None
+
+
+@contextmanager
+def get_working_directory() -> Iterator[Path]:
+    # Use the custom LaTeX cache directory from the config
+    latex_cache = Path(manim_config.directories.latex_cache)
+    latex_cache.mkdir(exist_ok=True) # Create the directory if it does not already exist
+    with tempfile.TemporaryDirectory(dir=latex_cache) as temp_dir:
+        yield Path(temp_dir)
+
+
+def run_tex_compiler(full_tex: str, compiler: str, temp_dir: Path) -> Path:
+    """
+    Compiles full_tex within temp_dir, returning the path of the output
+    dvi (or xdv) file
+    """
     if compiler == "latex":
         dvi_ext = ".dvi"
     elif compiler == "xelatex":
@@ -93,10 +241,6 @@ def full_tex_to_svg(full_tex: str, compiler: str = "latex", message: str = ""):
     else:
         raise NotImplementedError(f"Compiler '{compiler}' is not implemented")
 
-    # Use the custom LaTeX cache directory from the config
-    temp_dir = Path(manim_config.directories.latex_cache)
-    temp_dir.mkdir(exist_ok=True) # Create the directory if it does not already exist
-
     # Define paths for the intermediate TeX and DVI files
     tex_path = temp_dir / "working.tex"
     dvi_path = tex_path.with_suffix(dvi_ext)
@@ -129,26 +273,119 @@ def full_tex_to_svg(full_tex: str, compiler: str = "latex", message: str = ""):
                 error_str = error_match.group()
         raise LatexError(error_str or "LaTeX compilation failed")
 
-    # Run dvisvgm and capture output directly
-    process = subprocess.run(
-        [
-            "dvisvgm",
-            dvi_path,
-            "-n",  # no fonts
-            "-v", "0",  # quiet
-            "--stdout",  # output to stdout instead of file
-        ],
-        capture_output=True
-    )
+    return dvi_path
 
-    # Return SVG string
-    result = process.stdout.decode('utf-8')
 
-    if message:
-        print(" " * len(message), end="\r")
+def split_full_tex(full_tex: str) -> tuple[str, str] | None:
+    """
+    Inverse of get_full_tex, returning the preamble and content, or
+    None if full_tex was not produced by it
+    """
+    head = "\\documentclass[preview]{standalone}\n\n"
+    tail = "\n\n\\end{document}\n"
+    if not (full_tex.startswith(head) and full_tex.endswith(tail)):
+        return None
+    preamble, sep, content = full_tex[len(head):-len(tail)].partition("\n\n\\begin{document}\n\n")
+    if not sep:
+        return None
+    return preamble, content
+
+
+@contextmanager
+def recording_latex_requests() -> Iterator[list[tuple[str, str, str]]]:
+    """
+    Within this context, any call to latex_to_svg which is not already
+    cached on disk raises LatexRequestRecorded, after appending the
+    arguments it would have passed to full_tex_to_svg to the yielded list
+    """
+    global _latex_requests
+    prev_requests = _latex_requests
+    _latex_requests = []
+    try:
+        yield _latex_requests
+    finally:
+        _latex_requests = prev_requests
 
-    return result
+
+def prefetch_full_tex_to_svg(
+    requests: Iterable[tuple[str, str, str]],
+    num_workers: int | None = None,
+    batch: bool | None = None,
+) -> None:
+    """
+    Compiles, in parallel, each set of full_tex_to_svg arguments
+    which is not yet cached, and caches the results just as calling
+    full_tex_to_svg would.  Failed compilations are left uncached,
+    so that the error is raised when that tex is actually used.
+
+    If batch is True (by default, if tex.batch_compile is set in the
+    config), those sharing a preamble and compiler are compiled together
+    as pages of one document, in as many batches as there are workers.
+    Any which might change TeX state for the others are still compiled
+    on their own.
+    """
+    requests = [
+        args for args in dict.fromkeys(requests)
+        if not is_cached_on_disk(full_tex_to_svg, *args)
+    ]
+    if not requests:
+        return
+    num_workers = num_workers or manim_config.tex.num_compile_workers or os.cpu_count()
+    if batch is None:
+        batch = bool(manim_config.tex.batch_compile)
+
+    # Group requests which can share a document
+    groups: dict[tuple[str, str], list[tuple[str, str, str]]] = dict()
+    singles = []
+    for args in requests:
+        full_tex, compiler, _ = args
+        split = split_full_tex(full_tex) if batch else None
+        if split is None or changes_tex_state(split[1]):
+            singles.append(args)
+        else:
+            groups.setdefault((split[0], compiler), []).append(args)
+    for key, group in list(groups.items()):
+        if len(group) == 1:
+            singles.extend(groups.pop(key))
+
+    message = f"Writing {len(requests)} LaTeX expressions..."
+    print(message, end="\r")
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        jobs = [
+            ([args], False, executor.submit(compile_tex_to_svg, args[0], args[1]))
+            for args in singles
+        ]
+        for (preamble, compiler), group in groups.items():
+            n_batches = min(num_workers, len(group))
+            for i in range(n_batches):
+                chunk = group[i * len(group) // n_batches:(i + 1) * len(group) // n_batches]
+                if len(chunk) == 1:
+                    # Nothing to share the document with
+                    jobs.append((chunk, False, executor.submit(compile_tex_to_svg, *chunk[0][:2])))
+                    continue
+                contents = [split_full_tex(full_tex)[1] for full_tex, _, _ in chunk]
+                jobs.append((chunk, True, executor.submit(
+                    compile_tex_batch_to_svgs, contents, preamble, compiler
+                )))
+        for chunk, is_batch, future in jobs:
+            try:
+                results = future.result() if is_batch else [future.result()]
+            except (LatexError, NotImplementedError, OSError) as err:
+                if not is_batch:
+                    log.debug(f"Could not prefetch LaTeX: {err}")
+                    continue
+                # One failing formula spoils the whole document, so fall
+                # back to compiling each on its own
+                prefetch_full_tex_to_svg(chunk, num_workers, batch=False)
+                continue
+            for args, result in zip(chunk, results):
+                set_cached_value(result, full_tex_to_svg, *args)
+    print(" " * len(message), end="\r")
 
 
 class LatexError(Exception):
     pass
+
+
+class LatexRequestRecorded(Exception):
+    pass
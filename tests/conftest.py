@@ -0,0 +1,112 @@
+import subprocess
+import sys
+from concurrent.futures import Executor
+from concurrent.futures import Future
+
+# manimlib parses the command line when first imported, which
+# should not see the arguments passed to pytest
+sys.argv = sys.argv[:1]
+
+import numpy as np
+import pytest
+from diskcache import Cache
+
+from manimlib import extract_scene
+from manimlib.config import manim_config
+from manimlib.mobject.svg import svg_mobject
+from manimlib.mobject.svg import tex_mobject
+from manimlib.utils import cache
+from manimlib.utils import shaders
+from manimlib.utils import tex_file_writing
+
+
+@pytest.fixture(autouse=True)
+def temp_directories(tmp_path, monkeypatch):
+    """
+    Points output and cache directories at a fresh directory for each
+    test, and empties the in-memory caches in front of them
+    """
+    directories = manim_config.directories
+    for key in ["cache", "output", "latex_cache"]:
+        path = tmp_path / key
+        path.mkdir()
+        monkeypatch.setitem(directories, key, str(path))
+    # The canvas for rendering fill is sized by this, and is kept for each
+    # of the many contexts made over a session, so should be no larger than
+    # the test scenes
+    monkeypatch.setitem(manim_config.camera, "resolution", (160, 90))
+    monkeypatch.setattr(cache, "_cache", Cache(str(tmp_path / "cache")))
+    monkeypatch.setattr(svg_mobject, "SVG_HASH_TO_MOB_MAP", dict())
+    monkeypatch.setattr(shaders, "PROCESSED_PROGRAM_CODE", dict())
+    tex_file_writing.latex_to_svg.cache_clear()
+    tex_mobject.get_tex_mob_scale_factor.cache_clear()
+    return tmp_path
+
+
+@pytest.fixture
+def scene_config(tmp_path):
+    """
+    Returns a function giving the config for a small, quiet scene,
+    writing to the test's output directory
+    """
+    def get_scene_config(**file_writer_config):
+        return dict(
+            camera_config=dict(resolution=(160, 90), fps=10),
+            file_writer_config=dict(
+                dict(
+                    output_directory=str(tmp_path / "output"),
+                    write_to_movie=False,
+                    quiet=True,
+                    open_file_upon_completion=False,
+                    show_file_location_upon_completion=False,
+                ),
+                **file_writer_config,
+            ),
+        )
+    return get_scene_config
+
+
+def read_movie_frames(file_path: str, width: int = 160, height: int = 90) -> np.ndarray:
+    """
+    Decodes the movie at file_path into an array of rgb frames
+    """
+    process = subprocess.run(
+        [
+            manim_config.file_writer.ffmpeg_bin,
+            "-v", "error",
+            "-i", str(file_path),
+            "-f", "rawvideo",
+            "-pix_fmt", "rgb24",
+            "-",
+        ],
+        capture_output=True,
+        check=True,
+    )
+    return np.frombuffer(process.stdout, dtype=np.uint8).reshape((-1, height, width, 3))
+
+
+@pytest.fixture
+def movie_frames():
+    return read_movie_frames
+
+
+class SerialExecutor(Executor):
+    """
+    Runs each submitted call straight away, in this process
+    """
+    def __init__(self, max_workers=None, mp_context=None):
+        pass
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+@pytest.fixture
+def serial_processes(monkeypatch):
+    """
+    Has the parallel renders of extract_scene run their workers in this
+    process, one after another
+    """
+    monkeypatch.setattr(extract_scene, "ProcessPoolExecutor", SerialExecutor)
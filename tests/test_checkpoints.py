@@ -0,0 +1,155 @@
+import importlib.util
+import sys
+
+import numpy as np
+import pytest
+
+from manimlib import *
+
+
+SCENE_SOURCE = """\
+from manimlib import *
+
+import checkpoint_helper
+
+SIDE = 1.0
+RUNS = []
+
+
+class SectionScene(Scene):
+    def construct(self):
+        self.first()
+        self.second(UP)
+        self.play(self.square.animate.shift(RIGHT), run_time=0.2)
+
+    @section
+    def first(self):
+        RUNS.append("first")
+        self.square = Square(SIDE).set_fill(BLUE, 0.5)
+        self.add(self.square)
+        self.play(self.square.animate.shift(LEFT), run_time=0.2)
+
+    @section
+    def second(self, direction):
+        RUNS.append("second")
+        self.circle = Circle(radius=checkpoint_helper.RADIUS).shift(direction)
+        self.dots = VGroup(*(Dot(np.random.uniform(-3, 3, 3) * [1, 1, 0]) for _ in range(3)))
+        self.play(FadeIn(self.circle), FadeIn(self.dots), run_time=0.2)
+"""
+
+HELPER_SOURCE = """\
+RADIUS = 0.5
+"""
+
+
+@pytest.fixture
+def scene_files(tmp_path, monkeypatch):
+    """
+    A scene file with sections, and a helper module it imports
+    """
+    scene_path = tmp_path / "section_scene.py"
+    helper_path = tmp_path / "checkpoint_helper.py"
+    scene_path.write_text(SCENE_SOURCE)
+    helper_path.write_text(HELPER_SOURCE)
+    # Both modules are removed again after the test
+    monkeypatch.setitem(sys.modules, "checkpoint_helper", None)
+    monkeypatch.setitem(sys.modules, "section_scene", None)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return scene_path, helper_path
+
+
+def load_module(path: Path, name: str):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_scene(scene_config, scene_files, use_checkpoints=True, **kwargs) -> tuple[list[str], list[np.ndarray]]:
+    """
+    Loads the scene files afresh, as a new run would, and runs the scene,
+    returning the sections which ran and the frames written
+    """
+    scene_path, helper_path = scene_files
+    load_module(helper_path, "checkpoint_helper")
+    module = load_module(scene_path, "section_scene")
+    frames = []
+
+    class FrameRecordingScene(module.SectionScene):
+        def emit_frame(self):
+            if not self.skip_animations:
+                frames.append(np.frombuffer(self.camera.get_raw_fbo_data(), dtype=np.uint8).copy())
+
+    # Named as the scene in the file, so it shares its checkpoints
+    FrameRecordingScene.__name__ = "SectionScene"
+    FrameRecordingScene(**scene_config(), use_checkpoints=use_checkpoints, **kwargs).run()
+    return module.RUNS, frames
+
+
+def edit_file(path: Path, old: str, new: str):
+    assert old in path.read_text()
+    path.write_text(path.read_text().replace(old, new))
+
+
+def test_sections_restored_when_skipped(scene_config, scene_files):
+    runs, frames = run_scene(scene_config, scene_files)
+    assert runs == ["first", "second"]
+    assert len(frames) > 0
+
+    # Starting partway, skipped sections are restored rather than run
+    runs, frames = run_scene(scene_config, scene_files, start_at_animation_number=2)
+    assert runs == []
+    _, ref_frames = run_scene(scene_config, scene_files, use_checkpoints=False, start_at_animation_number=2)
+    assert len(frames) == len(ref_frames) > 0
+    for frame, ref_frame in zip(frames, ref_frames):
+        assert np.array_equal(frame, ref_frame)
+
+    # But not sections which would be played
+    runs, _ = run_scene(scene_config, scene_files, start_at_animation_number=1)
+    assert runs == ["second"]
+    runs, _ = run_scene(scene_config, scene_files)
+    assert runs == ["first", "second"]
+
+
+@pytest.mark.parametrize("file_index,old,new,expected_runs", [
+    # Code after the sections
+    (0, "shift(RIGHT)", "shift(2 * RIGHT)", []),
+    # A later section, or how it is called
+    (0, "radius=checkpoint_helper", "stroke_width=2, radius=checkpoint_helper", ["second"]),
+    (0, "self.second(UP)", "self.second(DOWN)", ["second"]),
+    # An earlier section, module-level code or helpers
+    (0, "self.square.animate.shift(LEFT)", "self.square.animate.shift(2 * LEFT)", ["first", "second"]),
+    (0, "SIDE = 1.0", "SIDE = 1.5", ["first", "second"]),
+    (1, "RADIUS = 0.5", "RADIUS = 0.7", ["first", "second"]),
+])
+def test_checkpoints_invalidated_by_changes(scene_config, scene_files, file_index, old, new, expected_runs):
+    run_scene(scene_config, scene_files)
+    edit_file(scene_files[file_index], old, new)
+    runs, _ = run_scene(scene_config, scene_files, start_at_animation_number=2)
+    assert runs == expected_runs
+
+    # Which are then saved anew
+    runs, _ = run_scene(scene_config, scene_files, start_at_animation_number=2)
+    assert runs == []
+
+
+def test_checkpoints_invalidated_by_scene_config(scene_config, scene_files):
+    run_scene(scene_config, scene_files)
+    runs, _ = run_scene(scene_config, scene_files, start_at_animation_number=2, default_wait_time=2.0)
+    assert runs == ["first", "second"]
+
+
+def test_restored_state_matches_running(scene_config, scene_files, monkeypatch):
+    scenes = []
+    monkeypatch.setattr(Scene, "tear_down", lambda self: scenes.append(self))
+    run_scene(scene_config, scene_files)
+    run_scene(scene_config, scene_files, start_at_animation_number=2)
+    ran, restored = scenes
+    assert restored.time == pytest.approx(ran.time)
+    assert restored.num_plays == ran.num_plays
+    assert np.array_equal(restored.square.get_points(), ran.square.get_points())
+    assert np.array_equal(restored.dots.get_points(), ran.dots.get_points())
+    # Mobjects restored are those in the scene
+    assert restored.square in restored.mobjects
+    assert restored.circle in restored.mobjects
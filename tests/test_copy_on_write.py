@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from manimlib import *
+
+
+@pytest.fixture
+def copy_on_write(monkeypatch):
+    monkeypatch.setattr(Mobject, "copy_on_write_data", True)
+
+
+def test_copies_share_data_until_changed(copy_on_write):
+    circle = Circle().set_fill(BLUE, 0.5)
+    copies = [circle.copy() for _ in range(3)]
+    original_data = circle.data.copy()
+    for mob in copies:
+        assert np.shares_memory(mob.data, circle.data)
+    assert not circle.data.flags.writeable
+
+    copies[0].shift(RIGHT)
+    copies[1].set_fill(RED, 1)
+    copies[2].set_points(copies[2].get_points()[::-1].copy())
+    circle.rotate(PI / 3)
+    for mob in copies:
+        assert not np.shares_memory(mob.data, circle.data)
+        assert mob.data.flags.writeable
+
+    assert np.allclose(copies[0].get_points(), original_data["point"] + RIGHT)
+    assert np.allclose(copies[1].data["fill_rgba"], [*color_to_rgb(RED), 1])
+    assert np.array_equal(copies[2].get_points(), original_data["point"][::-1])
+    assert np.allclose(circle.get_points(), Circle().rotate(PI / 3).get_points())
+
+
+def test_interpolating_a_copy_leaves_its_original(copy_on_write):
+    square = Square()
+    copy = square.copy()
+    copy.interpolate(square, Square().shift(RIGHT).set_color(RED), 0.5)
+    assert np.array_equal(square.get_points(), Square().get_points())
+    assert np.array_equal(square.data, Square().data)
+    assert np.allclose(copy.get_points(), square.get_points() + 0.5 * RIGHT)
+
+
+class CopiesScene(Scene):
+    def construct(self):
+        square = Square().set_fill(RED, 0.5)
+        copies = VGroup(*(square.copy() for _ in range(4))).arrange(RIGHT)
+        self.add(square, copies)
+        self.play(
+            copies[0].animate.set_color(BLUE),
+            Rotate(copies[1], PI / 4),
+            Transform(copies[2], Circle().move_to(copies[2])),
+            square.animate.shift(UP),
+            run_time=0.5,
+        )
+        self.play(Rotating(copies[3], angle=PI / 2), run_time=0.3)
+        self.add(square.copy().shift(DOWN).set_stroke(YELLOW))
+        self.wait(0.2)
+
+
+def render_frames(scene_config, monkeypatch, copy_on_write_data: bool) -> list[np.ndarray]:
+    monkeypatch.setattr(Mobject, "copy_on_write_data", copy_on_write_data)
+    frames = []
+
+    class FrameRecordingScene(CopiesScene):
+        def emit_frame(self):
+            frames.append(np.frombuffer(self.camera.get_raw_fbo_data(), dtype=np.uint8).copy())
+
+    FrameRecordingScene(**scene_config()).run()
+    return frames
+
+
+def test_copy_on_write_renders_match(scene_config, monkeypatch):
+    frames = render_frames(scene_config, monkeypatch, True)
+    ref_frames = render_frames(scene_config, monkeypatch, False)
+    assert len(frames) == len(ref_frames) > 0
+    for frame, ref_frame in zip(frames, ref_frames):
+        assert np.array_equal(frame, ref_frame)
@@ -0,0 +1,177 @@
+import numpy as np
+import pytest
+
+from manimlib import *
+from manimlib.utils.bezier import partial_quadratic_bezier_points
+from manimlib.utils.bezier import subdivide_quadratic_bezier_path
+
+
+def subdivide_by_curve(points: np.ndarray, n_pieces: list[int]) -> np.ndarray:
+    """
+    The scalar implementation which subdivide_quadratic_bezier_path
+    replaced, splitting one curve and one piece at a time
+    """
+    new_points = [points[0]]
+    for tup, n in zip(zip(points[0:-1:2], points[1::2], points[2::2]), n_pieces):
+        alphas = np.linspace(0, 1, n + 1)
+        for a1, a2 in zip(alphas, alphas[1:]):
+            new_points.extend(partial_quadratic_bezier_points(tup, a1, a2)[1:])
+    return np.vstack(new_points)
+
+
+def insert_n_curves_greedily(vmobject: VMobject, n: int, points: np.ndarray) -> np.ndarray:
+    """
+    The scalar implementation which insert_n_curves_to_point_list replaced,
+    handing out insertions one at a time to the largest curve
+    """
+    if len(points) == 1:
+        return np.repeat(points, 2 * n + 1, 0)
+    bezier_tuples = list(vmobject.get_bezier_tuples_from_points(points))
+    atol = vmobject.tolerance_for_point_equality
+    norms = [
+        0 if get_norm(tup[1] - tup[0]) < atol else get_norm(tup[2] - tup[0])
+        for tup in bezier_tuples
+    ]
+    ipc = np.zeros(len(bezier_tuples), dtype=int)
+    for _ in range(n):
+        index = np.argmax(norms)
+        ipc[index] += 1
+        norms[index] *= ipc[index] / (ipc[index] + 1)
+    return subdivide_by_curve(points, ipc + 1)
+
+
+def align_points_by_subpath(vmob1: VMobject, vmob2: VMobject) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The aligned points which align_points gave before subpaths were
+    sorted and curves inserted in a vectorized way
+    """
+    subpaths1 = vmob1.get_subpaths()
+    subpaths2 = vmob2.get_subpaths()
+    for subpaths in [subpaths1, subpaths2]:
+        subpaths.sort(key=lambda sp: -sum(
+            get_norm(p2 - p1)
+            for p1, p2 in zip(sp, sp[1:])
+        ))
+
+    def get_nth_subpath(path_list, n):
+        if n >= len(path_list):
+            return np.vstack([path_list[0][:-1], path_list[0][::-1]])
+        return path_list[n]
+
+    new_subpaths1 = []
+    new_subpaths2 = []
+    for n in range(max(len(subpaths1), len(subpaths2))):
+        sp1 = get_nth_subpath(subpaths1, n)
+        sp2 = get_nth_subpath(subpaths2, n)
+        sp1, sp2 = (
+            insert_n_curves_greedily(vmob1, max(0, (len(sp2) - len(sp1)) // 2), sp1),
+            insert_n_curves_greedily(vmob2, max(0, (len(sp1) - len(sp2)) // 2), sp2),
+        )
+        if n > 0:
+            new_subpaths1.append(new_subpaths1[-1][-1])
+            new_subpaths2.append(new_subpaths2[-1][-1])
+        new_subpaths1.append(sp1)
+        new_subpaths2.append(sp2)
+    return np.vstack(new_subpaths1), np.vstack(new_subpaths2)
+
+
+def get_square_with_hole() -> VMobject:
+    square = Square(4)
+    square.add_subpath(Circle(radius=0.5).get_points()[::-1])
+    square.add_subpath(Triangle().scale(0.3).shift(RIGHT).get_points())
+    return square
+
+
+def get_uneven_path() -> VMobject:
+    path = VMobject()
+    path.set_points_as_corners([LEFT, ORIGIN, ORIGIN, 3 * UP + RIGHT, 3 * RIGHT])
+    path.append_points(Arc(0, 250 * DEG).shift(3 * RIGHT + LEFT).get_points()[1:])
+    return path
+
+
+def test_subdivision_matches_splitting_curve_by_curve():
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-3, 3, (41, 3))
+    n_pieces = rng.integers(1, 6, 20)
+    new_points = subdivide_quadratic_bezier_path(points, n_pieces)
+    assert np.allclose(new_points, subdivide_by_curve(points, n_pieces), atol=1e-12)
+    # Original anchors come through untouched
+    anchor_indices = 2 * np.append(0, n_pieces.cumsum())
+    assert np.array_equal(new_points[anchor_indices], points[0::2])
+    # As do curves split into a single piece
+    assert np.array_equal(subdivide_quadratic_bezier_path(points, np.ones(20)), points)
+
+
+@pytest.mark.parametrize("mob_func", [
+    Square,
+    Circle,
+    lambda: RegularPolygon(7),
+    lambda: Arc(0, 3 * PI / 2),
+])
+@pytest.mark.parametrize("n", [0, 1, 5, 13, 40])
+def test_even_curves_match_greedy_insertion(mob_func, n):
+    vmob = mob_func()
+    points = vmob.get_points()
+    new_points = vmob.insert_n_curves_to_point_list(n, points)
+    assert new_points.shape == (len(points) + 2 * n, 3)
+    assert np.allclose(new_points, insert_n_curves_greedily(vmob, n, points), atol=1e-12)
+
+
+@pytest.mark.parametrize("n", [1, 4, 9, 30])
+def test_uneven_curves_get_insertions_by_quota(n):
+    vmob = get_uneven_path()
+    points = vmob.get_points()
+    new_points = vmob.insert_n_curves_to_point_list(n, points)
+    assert len(new_points) == len(points) + 2 * n
+
+    # Recover how many pieces each curve was split into from where
+    # the original anchors ended up
+    anchor_indices = [0]
+    for anchor in points[2::2]:
+        index = anchor_indices[-1] + 2
+        while not (new_points[index] == anchor).all():
+            index += 2
+        anchor_indices.append(index)
+    assert anchor_indices[-1] == len(new_points) - 1
+    n_pieces = np.diff(anchor_indices) // 2
+    assert np.array_equal(new_points, subdivide_quadratic_bezier_path(points, n_pieces))
+
+    # Within one of each curve's share, with none to the null curve
+    norms = np.linalg.norm(points[2::2] - points[0:-1:2], axis=1)
+    norms[np.linalg.norm(points[1::2] - points[0:-1:2], axis=1) < vmob.tolerance_for_point_equality] = 0
+    quotas = n * norms / norms.sum()
+    assert n_pieces.sum() == len(n_pieces) + n
+    assert (abs(n_pieces - 1 - quotas) < 1).all()
+    assert n_pieces[norms == 0].tolist() == [1] * int((norms == 0).sum())
+
+
+def test_insertion_into_a_single_point():
+    points = np.array([UP])
+    assert np.array_equal(VMobject().insert_n_curves_to_point_list(3, points), np.repeat(points, 7, 0))
+
+
+def test_subpaths_sorted_by_length_match_sorting_by_lambda():
+    vmob = get_square_with_hole()
+    vmob.add_subpath(get_uneven_path().get_points())
+    vmob.add_subpath(Square(0.5).get_points())
+    subpaths = vmob.get_subpaths()
+    subpaths.sort(key=lambda sp: -sum(get_norm(p2 - p1) for p1, p2 in zip(sp, sp[1:])))
+    sorted_subpaths = vmob.get_subpaths_sorted_by_length()
+    assert len(sorted_subpaths) == len(subpaths) == 5
+    for sp, ref_sp in zip(sorted_subpaths, subpaths):
+        assert np.array_equal(sp, ref_sp)
+
+
+@pytest.mark.parametrize("mob_funcs", [
+    (Square, Circle),
+    (Circle, lambda: RegularPolygon(5)),
+    (get_square_with_hole, Circle),
+    (lambda: Arc(0, PI), get_square_with_hole),
+    (lambda: Annulus(1, 2), lambda: Square(3)),
+])
+def test_aligned_points_match_subpath_loop(mob_funcs):
+    vmob1, vmob2 = (func() for func in mob_funcs)
+    ref_points1, ref_points2 = align_points_by_subpath(vmob1.copy(), vmob2.copy())
+    vmob1.align_points(vmob2)
+    assert np.allclose(vmob1.get_points(), ref_points1, atol=1e-12)
+    assert np.allclose(vmob2.get_points(), ref_points2, atol=1e-12)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from manimlib import *
+
+
+class MovingSquareScene(Scene):
+    def construct(self):
+        square = Square().set_fill(RED, 0.5)
+        self.play(ShowCreation(square), run_time=0.5)
+        self.play(square.animate.shift(2 * RIGHT).set_color(BLUE), run_time=0.7)
+        self.wait(0.3)
+
+
+def render_movie_frames(scene_config, movie_frames, **file_writer_config):
+    scene = MovingSquareScene(**scene_config(write_to_movie=True, **file_writer_config))
+    scene.run()
+    return movie_frames(scene.file_writer.get_movie_file_path())
+
+
+@pytest.mark.parametrize("readback_buffer_count,frame_queue_size", [(1, 1), (2, 8), (3, 2)])
+# With partial movies cached, the pipe is opened and closed for each play call
+@pytest.mark.parametrize("cache_partial_movies", [False, True])
+def test_async_frame_writes_match_sync(scene_config, movie_frames, readback_buffer_count, frame_queue_size, cache_partial_movies):
+    ref_frames = render_movie_frames(scene_config, movie_frames, cache_partial_movies=cache_partial_movies)
+    frames = render_movie_frames(
+        scene_config, movie_frames,
+        cache_partial_movies=cache_partial_movies,
+        async_frame_writes=True,
+        readback_buffer_count=readback_buffer_count,
+        frame_queue_size=frame_queue_size,
+    )
+    assert len(frames) == len(ref_frames) == 15
+    assert np.array_equal(frames, ref_frames)
+
+
+def test_queued_fbo_data_comes_back_in_order():
+    camera = Camera(resolution=(64, 36))
+    camera.init_readback_buffers(3)
+    square = Square()
+    expected = []
+    received = []
+    for color in [RED, GREEN, BLUE, YELLOW, PINK]:
+        square.set_fill(color, 1)
+        camera.capture(square)
+        expected.append(camera.get_raw_fbo_data())
+        result = camera.queue_raw_fbo_data()
+        if result is not None:
+            received.append(result)
+    # Until the ring is full, nothing comes back
+    assert len(received) == 2
+    received.extend(camera.flush_queued_fbo_data())
+    assert received == expected
+    assert camera.flush_queued_fbo_data() == []
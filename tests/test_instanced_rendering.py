@@ -0,0 +1,60 @@
+import numpy as np
+
+from manimlib import *
+from manimlib.shader_wrapper import VShaderWrapper
+
+
+class ReplicasScene(Scene):
+    def construct(self):
+        grid = Square(side_length=1).get_grid(3, 4, buff=0)
+        self.play(ShowCreation(grid), run_time=0.5)
+        self.play(grid.animate.set_fill(RED, 0.5).shift(LEFT), run_time=0.5)
+
+        dots = Dot().replicate(20).arrange(RIGHT)
+        self.play(FadeIn(dots), run_time=0.5)
+        self.play(dots.animate.set_color(BLUE).shift(UP), run_time=0.5)
+        self.remove(grid)
+        self.wait(0.5)
+
+
+def render_frames(scene_config, monkeypatch, instance_replicas: bool):
+    monkeypatch.setattr(Mobject, "instance_replicas", instance_replicas)
+    frames = []
+    n_instanced_frames = 0
+
+    class FrameRecordingScene(ReplicasScene):
+        def emit_frame(self):
+            nonlocal n_instanced_frames
+            frames.append(np.frombuffer(self.camera.get_raw_fbo_data(), dtype=np.uint8).copy())
+            n_instanced_frames += any(
+                shader_wrapper.n_instances > 0
+                for group in self.render_groups
+                for shader_wrapper in group.shader_wrappers
+            )
+
+    FrameRecordingScene(**scene_config()).run()
+    return frames, n_instanced_frames
+
+
+def test_instanced_frames_match_non_instanced(scene_config, monkeypatch):
+    frames, n_instanced_frames = render_frames(scene_config, monkeypatch, True)
+    ref_frames, n_ref_instanced_frames = render_frames(scene_config, monkeypatch, False)
+
+    assert n_instanced_frames > 0
+    assert n_ref_instanced_frames == 0
+    assert len(frames) == len(ref_frames)
+    for frame, ref_frame in zip(frames, ref_frames):
+        assert np.array_equal(frame, ref_frame)
+
+
+def test_instance_data_requires_rigid_shift():
+    dots = Dot().replicate(3).arrange(RIGHT, buff=1)
+    data_list = [dot.get_shader_data() for dot in dots]
+    instance_data = VShaderWrapper.get_instance_data(data_list)
+    assert np.allclose(instance_data["instance_shift"][:, 0], [0, 1.16, 2.32], atol=1e-6)
+
+    dots[1].set_color(RED)
+    assert VShaderWrapper.get_instance_data([dot.get_shader_data() for dot in dots]) is None
+
+    dots[1].set_color(WHITE).scale(1.1)
+    assert VShaderWrapper.get_instance_data([dot.get_shader_data() for dot in dots]) is None
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from manimlib import *
+
+
+def get_polygons(n: int, seed: int) -> VGroup:
+    rng = np.random.default_rng(seed)
+    return VGroup(*(
+        RegularPolygon(int(rng.integers(3, 8)), radius=rng.uniform(0.2, 0.5))
+        .move_to(rng.uniform(-3, 3, 3) * [1, 1, 0])
+        .set_fill(rgb_to_color(rng.uniform(0.3, 1, 3)), rng.uniform(0.2, 1))
+        .set_stroke(width=rng.uniform(0, 4))
+        for _ in range(n)
+    ))
+
+
+def get_transforms() -> dict:
+    def nested_family():
+        group = VGroup(get_polygons(4, 0), VGroup(Line(), Arc(), get_polygons(3, 2)))
+        target = VGroup(get_polygons(3, 1), VGroup(Circle(), get_polygons(5, 3)))
+        return Transform(group, target)
+
+    def moved_to_target():
+        polygons = get_polygons(6, 0)
+        polygons.generate_target()
+        polygons.target.arrange_in_grid().set_color(TEAL)
+        return MoveToTarget(polygons)
+
+    return dict(
+        plain=lambda: Transform(get_polygons(8, 0), get_polygons(8, 1)),
+        unaligned=lambda: Transform(get_polygons(5, 0), get_polygons(9, 1)),
+        lagged=lambda: Transform(get_polygons(8, 0), get_polygons(8, 1), lag_ratio=0.2),
+        path_arc=lambda: Transform(get_polygons(8, 0), get_polygons(8, 1), path_arc=PI / 2),
+        lagged_path_arc=lambda: Transform(get_polygons(8, 0), get_polygons(8, 1), path_arc=PI / 3, lag_ratio=0.1),
+        replacement=lambda: ReplacementTransform(get_polygons(8, 0), Circle().replicate(8).arrange(RIGHT)),
+        nested_family=nested_family,
+        moved_to_target=moved_to_target,
+    )
+
+
+def get_family_data(anim: Transform, alphas: Iterable[float]) -> tuple[list[list[np.ndarray]], int]:
+    """
+    Returns the data of the family at each alpha, and the number
+    of batches it was interpolated in
+    """
+    anim.begin()
+    n_batches = len(anim.interpolation_batches)
+    result = []
+    for alpha in alphas:
+        anim.interpolate(alpha)
+        result.append([sm.data.copy() for sm in anim.mobject.get_family()])
+    anim.finish()
+    return result, n_batches
+
+
+@pytest.mark.parametrize("name", get_transforms().keys())
+# Scenes pass numpy floats, which unlike python floats aren't rounded to
+# the float32 of the data when multiplying it
+@pytest.mark.parametrize("alphas", [np.linspace(0, 1, 11), np.linspace(0, 1, 11).tolist()])
+def test_batched_interpolation_matches_per_submobject(name, alphas, monkeypatch):
+    data, n_batches = get_family_data(get_transforms()[name](), alphas)
+    assert n_batches > 0
+
+    def no_batches(self):
+        self.interpolation_batches = []
+
+    monkeypatch.setattr(Transform, "init_interpolation_batches", no_batches)
+    ref_data, _ = get_family_data(get_transforms()[name](), alphas)
+
+    assert len(data) == len(ref_data)
+    for family_data, ref_family_data in zip(data, ref_data):
+        assert len(family_data) == len(ref_family_data)
+        for sm_data, ref_sm_data in zip(family_data, ref_family_data):
+            assert np.array_equal(sm_data, ref_sm_data)
+
+
+def test_batches_used_and_released():
+    anim = Transform(get_polygons(8, 0), get_polygons(8, 1))
+    anim.begin()
+    assert len(anim.interpolation_batches) > 0
+    batch = anim.interpolation_batches[0]
+    assert all(np.shares_memory(sm.data, batch.current) for sm in batch.mobjects)
+    anim.interpolate(0.5)
+    anim.finish()
+    assert not any(np.shares_memory(sm.data, batch.current) for sm in batch.mobjects)
+
+    # Changing one submobject afterwards leaves the others be
+    points = [sm.get_points().copy() for sm in batch.mobjects]
+    batch.mobjects[0].shift(UP)
+    for sm, sm_points in zip(batch.mobjects[1:], points[1:]):
+        assert np.array_equal(sm.get_points(), sm_points)
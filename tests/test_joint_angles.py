@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from manimlib import *
+
+
+def get_subpath_end_indices_by_anchor(points: np.ndarray) -> np.ndarray:
+    """
+    The scalar implementation which get_subpath_end_indices_from_points
+    replaced
+    """
+    atol = 1e-4
+    a0, h, a1 = points[0:-1:2], points[1::2], points[2::2]
+    is_end = (a0 == h).all(1) & (abs(h - a1) > atol).any(1)
+    end_indices = (2 * n for n, end in enumerate(is_end) if end)
+    return np.array([*end_indices, len(points) - 1])
+
+
+def get_joint_angles_by_subpath(vmobject: VMobject) -> np.ndarray:
+    """
+    The scalar implementation which get_joint_angles replaced, looping
+    over subpaths to join up closed ones and mark the ends of open ones
+    """
+    points = vmobject.get_points() @ rotation_between_vectors(OUT, vmobject.get_unit_normal())
+    a0, h, a1 = points[0:-1:2], points[1::2], points[2::2]
+    v_in = np.zeros(points.shape)
+    v_out = np.zeros(points.shape)
+    v_in[1::2] = h - a0
+    v_in[2::2] = a1 - h
+    v_out[0:-1:2] = h - a0
+    v_out[1::2] = a1 - h
+
+    ends = get_subpath_end_indices_by_anchor(points)
+    starts = [0, *(e + 2 for e in ends[:-1])]
+    for start, end in zip(starts, ends):
+        if start == end:
+            continue
+        if (points[start] == points[end]).all():
+            v_in[start] = v_out[end - 1]
+            v_out[end] = v_in[start + 1]
+        else:
+            v_in[start] = v_out[start]
+            v_out[end] = v_in[end]
+
+    angle_diffs = np.arctan2(v_out[:, 1], v_out[:, 0]) - np.arctan2(v_in[:, 1], v_in[:, 0])
+    angle_diffs[angle_diffs < -PI] += TAU
+    angle_diffs[angle_diffs > PI] -= TAU
+    return angle_diffs
+
+
+def get_test_vmobjects() -> list[VMobject]:
+    rng = np.random.default_rng(0)
+    square_with_hole = Square()
+    square_with_hole.add_subpath(Circle(radius=0.3).get_points()[::-1])
+    # Open paths, one of which has a null curve
+    open_paths = VMobject()
+    open_paths.set_points_as_corners([LEFT, ORIGIN, ORIGIN, UP + RIGHT])
+    open_paths.add_subpath(Arc(0, 270 * DEG).get_points())
+    noisy_path = VMobject().set_points(rng.uniform(-2, 2, (21, 3)) * [1, 1, 0])
+    return [
+        Square(),
+        Circle().rotate(40 * DEG, axis=RIGHT + UP),
+        Arc(30 * DEG, 200 * DEG),
+        square_with_hole,
+        open_paths,
+        noisy_path,
+        Polygon(*rng.uniform(-2, 2, (9, 3)) * [1, 1, 0]),
+        VMobject(),
+    ]
+
+
+@pytest.mark.parametrize("index", range(len(get_test_vmobjects())))
+def test_joint_angles_match_subpath_loop(index):
+    vmobject = get_test_vmobjects()[index]
+    points = vmobject.get_points()
+    if len(points) > 0:
+        assert np.array_equal(
+            vmobject.get_subpath_end_indices_from_points(points),
+            get_subpath_end_indices_by_anchor(points),
+        )
+    angles = vmobject.get_joint_angles(refresh=True)
+    if len(points) >= 3:
+        assert np.allclose(angles, get_joint_angles_by_subpath(vmobject), atol=1e-6)
+
+
+def test_batched_joint_angles_match_subpath_loop():
+    vmobjects = get_test_vmobjects()
+    expected = [
+        get_joint_angles_by_subpath(vmob) if vmob.get_num_points() >= 3 else None
+        for vmob in vmobjects
+    ]
+    for vmob in vmobjects:
+        vmob.data["joint_angle"] = 0
+    VMobject.update_joint_angles(vmobjects, refresh=True)
+    for vmob, angles in zip(vmobjects, expected):
+        if angles is not None:
+            assert np.allclose(vmob.data["joint_angle"][:, 0], angles, atol=1e-6)
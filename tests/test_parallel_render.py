@@ -0,0 +1,132 @@
+import pytest
+from addict import Dict
+
+from manimlib import *
+from manimlib.extract_scene import ParallelMultiSceneRender
+from manimlib.extract_scene import ParallelSceneRender
+from manimlib.extract_scene import get_scenes_to_render
+from manimlib.extract_scene import partition_animations
+from manimlib.extract_scene import prerun_scene
+from manimlib.module_loader import ModuleLoader
+from manimlib.scene.scene_file_writer import get_frame_count
+
+
+SCENE_MODULE = """
+from manimlib import *
+
+
+class SquareScene(Scene):
+    def construct(self):
+        square = Square().set_color(RED)
+        self.play(ShowCreation(square), run_time=0.5)
+        self.play(square.animate.shift(RIGHT), run_time=0.5)
+        self.wait(0.3)
+
+
+class CircleScene(Scene):
+    def construct(self):
+        circle = Circle().set_color(BLUE)
+        self.play(FadeIn(circle), run_time=0.4)
+        self.wait(0.2)
+        self.play(circle.animate.scale(0.5), run_time=0.6)
+"""
+
+
+@pytest.fixture
+def scene_module(tmp_path, monkeypatch):
+    file_path = tmp_path / "parallel_scenes.py"
+    file_path.write_text(SCENE_MODULE)
+    monkeypatch.setitem(manim_config.file_writer, "write_to_movie", True)
+    return str(file_path), ModuleLoader.get_module(str(file_path))
+
+
+def render_serially(scene_class, config, movie_frames):
+    scene = scene_class(**config)
+    scene.run()
+    movie_path = scene.file_writer.get_movie_file_path()
+    frames = movie_frames(movie_path)
+    os.remove(movie_path)
+    return frames
+
+
+def test_partition_animations():
+    assert partition_animations([10, 10, 10, 10], 2) == [(0, 2), (2, 4)]
+    assert partition_animations([30, 1, 1, 1], 2) == [(0, 1), (1, 4)]
+    assert partition_animations([5, 5], 4) == [(0, 1), (1, 2)]
+
+
+@pytest.mark.parametrize("scene_name", ["SquareScene", "CircleScene"])
+def test_frame_counts_match_movie(scene_config, scene_module, movie_frames, scene_name):
+    file_name, module = scene_module
+    scene_class = getattr(module, scene_name)
+    config = Dict(scene_config(write_to_movie=True))
+    pre_scene = prerun_scene(scene_class, config)
+    end_times = [0, *pre_scene.animation_end_times]
+    frame_counts = [get_frame_count(t2 - t1, 10) for t1, t2 in zip(end_times[:-1], end_times[1:])]
+    assert sum(frame_counts) == len(render_serially(scene_class, config, movie_frames))
+
+
+@pytest.mark.parametrize("scene_name", ["SquareScene", "CircleScene"])
+def test_parallel_render_matches_serial_render(scene_config, scene_module, serial_processes, movie_frames, scene_name):
+    file_name, module = scene_module
+    scene_class = getattr(module, scene_name)
+    config = Dict(scene_config(write_to_movie=True))
+    frames = render_serially(scene_class, config, movie_frames)
+
+    ParallelSceneRender(scene_class, config, Dict(file_name=file_name, parallel=2)).run()
+    movie_path = os.path.join(config.file_writer_config.output_directory, scene_name + ".mp4")
+    parallel_frames = movie_frames(movie_path)
+    assert len(parallel_frames) == len(frames)
+    assert np.abs(parallel_frames.astype(float) - frames).mean() < 1
+
+
+def get_run_config(file_name: str, parallel: int = 1, parallel_scenes: int = 1) -> Dict:
+    return Dict(
+        file_name=file_name,
+        parallel=parallel,
+        parallel_scenes=parallel_scenes,
+        write_all=True,
+        show_in_window=False,
+        prerun=False,
+    )
+
+
+@pytest.mark.parametrize("parallel,parallel_scenes,render_types", [
+    # None standing for the scene class itself
+    (1, 1, [None, None]),
+    (3, 1, [ParallelSceneRender, ParallelSceneRender]),
+    (1, 2, [ParallelMultiSceneRender]),
+    (3, 2, [ParallelMultiSceneRender]),
+])
+def test_parallel_flags_choose_renders(scene_config, scene_module, parallel, parallel_scenes, render_types):
+    file_name, module = scene_module
+    scene_classes = [module.SquareScene, module.CircleScene]
+    run_config = get_run_config(file_name, parallel, parallel_scenes)
+    renders = get_scenes_to_render(scene_classes, Dict(scene_config(write_to_movie=True)), run_config)
+    assert len(renders) == len(render_types)
+    for render, render_type, scene_class in zip(renders, render_types, scene_classes):
+        assert isinstance(render, render_type or scene_class)
+
+
+@pytest.mark.parametrize("parallel", [1, 2])
+def test_parallel_scenes_match_serial_render(scene_config, scene_module, serial_processes, movie_frames, parallel, capsys):
+    file_name, module = scene_module
+    scene_classes = [module.SquareScene, module.CircleScene]
+    config = Dict(scene_config(write_to_movie=True))
+    serial_frames = {
+        scene_class.__name__: render_serially(scene_class, config, movie_frames)
+        for scene_class in scene_classes
+    }
+
+    # With parallel above 1, each scene's process splits it further
+    run_config = get_run_config(file_name, parallel=parallel, parallel_scenes=2)
+    ParallelMultiSceneRender(scene_classes, config, run_config).run()
+
+    summary = capsys.readouterr().out
+    for name, frames in serial_frames.items():
+        movie_path = os.path.join(config.file_writer_config.output_directory, name + ".mp4")
+        parallel_frames = movie_frames(movie_path)
+        assert len(parallel_frames) == len(frames)
+        assert np.abs(parallel_frames.astype(float) - frames).mean() < 1
+        summary_line = next(line for line in summary.splitlines() if line.startswith(name))
+        assert summary_line.split()[2] == str(len(frames))
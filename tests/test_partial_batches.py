@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from manimlib import *
+
+
+def get_shapes(n: int, seed: int) -> VGroup:
+    rng = np.random.default_rng(seed)
+    shapes = VGroup(*(
+        (RegularPolygon(int(rng.integers(3, 8))) if rng.random() < 0.5 else Circle())
+        .scale(rng.uniform(0.2, 0.5))
+        .move_to(rng.uniform(-3, 3, 3) * [1, 1, 0])
+        .set_fill(rgb_to_color(rng.uniform(0.3, 1, 3)), rng.uniform(0.2, 1))
+        .set_stroke(rgb_to_color(rng.uniform(0.3, 1, 3)), rng.uniform(0, 4))
+        for _ in range(n)
+    ))
+    shapes.add(VGroup(Arc(0, PI), Line(), VGroup(Square(0.5), Annulus(0.2, 0.4))))
+    return shapes
+
+
+def get_animations() -> dict:
+    return dict(
+        show_creation=lambda: ShowCreation(get_shapes(8, 0)),
+        lagged_creation=lambda: ShowCreation(get_shapes(8, 0), lag_ratio=0.3),
+        uncreate=lambda: Uncreate(get_shapes(8, 1), lag_ratio=0.1),
+        paused_creation=lambda: ShowCreation(get_shapes(8, 0), lag_ratio=0.2, rate_func=there_and_back_with_pause),
+        passing_flash=lambda: ShowPassingFlash(get_shapes(8, 2), time_width=0.3),
+        draw_border_then_fill=lambda: DrawBorderThenFill(get_shapes(8, 3)),
+        write=lambda: Write(get_shapes(8, 4)),
+        lagged_write=lambda: Write(get_shapes(12, 5), lag_ratio=0.5),
+    )
+
+
+def get_family_data(anim: Animation, alphas: Iterable[float]) -> tuple[list[list[np.ndarray]], int]:
+    """
+    Returns the data of the family at each alpha, and the number
+    of batches it was interpolated in
+    """
+    anim.begin()
+    n_batches = len(anim.partial_batches)
+    result = []
+    for alpha in alphas:
+        anim.interpolate(alpha)
+        result.append([sm.data.copy() for sm in anim.mobject.get_family()])
+    anim.finish()
+    result.append([sm.data.copy() for sm in anim.mobject.get_family()])
+    return result, n_batches
+
+
+@pytest.mark.parametrize("name", get_animations().keys())
+# Scenes pass numpy floats, but python floats may be passed as well
+@pytest.mark.parametrize("alphas", [np.linspace(0, 1, 13), np.linspace(0, 1, 13).tolist()])
+def test_batched_partials_match_per_submobject(name, alphas, monkeypatch):
+    data, n_batches = get_family_data(get_animations()[name](), alphas)
+    assert n_batches > 0
+
+    def no_batches(self):
+        self.partial_batches = []
+
+    monkeypatch.setattr(ShowPartial, "init_partial_batches", no_batches)
+    monkeypatch.setattr(DrawBorderThenFill, "init_partial_batches", no_batches)
+    ref_data, _ = get_family_data(get_animations()[name](), alphas)
+
+    assert len(data) == len(ref_data)
+    for family_data, ref_family_data in zip(data, ref_data):
+        assert len(family_data) == len(ref_family_data)
+        for sm_data, ref_sm_data in zip(family_data, ref_family_data):
+            assert np.array_equal(sm_data, ref_sm_data)
+
+
+def test_sub_alphas_match_get_sub_alpha():
+    anim = ShowCreation(get_shapes(5, 0), lag_ratio=0.25, rate_func=there_and_back)
+    for alpha in np.linspace(0, 1, 9):
+        assert np.array_equal(
+            anim.get_sub_alphas(alpha, 7),
+            [anim.get_sub_alpha(alpha, i, 7) for i in range(7)],
+        )
+
+
+def test_only_changed_submobjects_rewritten():
+    anim = ShowCreation(get_shapes(8, 0), lag_ratio=1)
+    anim.begin()
+    anim.interpolate(0.5)
+    shapes = [sm for sm in anim.mobject.get_family() if sm.has_points()]
+    versions = [sm._data_version for sm in shapes]
+    anim.interpolate(0.5)
+    assert [sm._data_version for sm in shapes] == versions
+
+    # Unless something else changed them in between
+    points = shapes[0].get_points().copy()
+    shapes[0].shift(UP)
+    anim.interpolate(0.5)
+    assert np.array_equal(shapes[0].get_points(), points)
+    anim.finish()
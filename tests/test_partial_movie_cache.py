@@ -0,0 +1,57 @@
+from pathlib import Path
+
+from manimlib import *
+
+
+class MovingDotScene(Scene):
+    dot_color = RED
+
+    def construct(self):
+        dot = Dot().set_color(self.dot_color)
+        dot.add_updater(lambda m, dt: m.shift(dt * RIGHT))
+        self.add(dot)
+        self.wait(0.5)
+        self.wait_until(lambda: dot.get_x() > 1.0)
+        self.play(FadeOut(dot), run_time=0.5)
+
+
+def get_cached_movies(scene: Scene) -> list[Path]:
+    return sorted(Path(scene.file_writer.partial_movie_cache_directory).glob("*.mp4"))
+
+
+def test_wait_until_with_cached_partial_movies(scene_config, movie_frames):
+    scene = MovingDotScene(**scene_config(write_to_movie=True, cache_partial_movies=True))
+    scene.run()
+    cached_frames = movie_frames(scene.file_writer.get_movie_file_path())
+    # Only the wait and play calls are cached, and not wait_until
+    assert len(get_cached_movies(scene)) == 2
+
+    scene = MovingDotScene(**scene_config(write_to_movie=True))
+    scene.run()
+    frames = movie_frames(scene.file_writer.get_movie_file_path())
+
+    assert len(cached_frames) == len(frames)
+
+
+def test_partial_movies_are_reused(scene_config):
+    scene = MovingDotScene(**scene_config(write_to_movie=True, cache_partial_movies=True))
+    scene.run()
+    mtimes = [path.stat().st_mtime_ns for path in get_cached_movies(scene)]
+
+    scene = MovingDotScene(**scene_config(write_to_movie=True, cache_partial_movies=True))
+    scene.run()
+    assert [path.stat().st_mtime_ns for path in get_cached_movies(scene)] == mtimes
+
+
+def test_partial_movies_are_invalidated_by_changes(scene_config):
+    scene = MovingDotScene(**scene_config(write_to_movie=True, cache_partial_movies=True))
+    scene.run()
+    old_movies = get_cached_movies(scene)
+
+    class BlueDotScene(MovingDotScene):
+        dot_color = BLUE
+
+    scene = BlueDotScene(**scene_config(write_to_movie=True, cache_partial_movies=True))
+    scene.run()
+    new_movies = set(get_cached_movies(scene)) - set(old_movies)
+    assert len(new_movies) == 2
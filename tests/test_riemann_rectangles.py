@@ -0,0 +1,133 @@
+import math
+
+import numpy as np
+import pytest
+
+from manimlib import *
+
+
+def get_riemann_rectangles_one_by_one(
+    axes: CoordinateSystem,
+    graph: ParametricCurve,
+    x_range=None,
+    dx=None,
+    input_sample_type="left",
+    colors=(BLUE, GREEN),
+    negative_color=RED,
+) -> VGroup:
+    """
+    The scalar implementation which get_riemann_rectangles replaced, building
+    and positioning each rectangle in turn
+    """
+    if x_range is None:
+        x_range = axes.x_range[:2]
+    if dx is None:
+        dx = axes.x_range[2]
+    x_range = list(x_range)
+    if len(x_range) < 3:
+        x_range = [*x_range, dx]
+
+    rects = []
+    x_range[1] = x_range[1] + dx
+    xs = np.arange(*x_range)
+    for x0, x1 in zip(xs, xs[1:]):
+        sample = dict(left=x0, right=x1, center=0.5 * x0 + 0.5 * x1)[input_sample_type]
+        height_vect = axes.i2gp(sample, graph) - axes.c2p(sample, 0)
+        rect = Rectangle(
+            width=axes.x_axis.n2p(x1)[0] - axes.x_axis.n2p(x0)[0],
+            height=get_norm(height_vect),
+        )
+        rect.positive = height_vect[1] > 0
+        rect.move_to(axes.c2p(x0, 0), DL if rect.positive else UL)
+        rects.append(rect)
+    result = VGroup(*rects)
+    result.set_submobject_colors_by_gradient(*colors)
+    result.set_style(stroke_width=1, stroke_color=BLACK, fill_opacity=1, stroke_behind=True)
+    for rect in result:
+        if not rect.positive:
+            rect.set_fill(negative_color)
+    return result
+
+
+def get_cases() -> dict:
+    return dict(
+        positive=lambda: (Axes((-4, 4), (-2, 2)), lambda x: 0.1 * x**2 + 0.5, dict()),
+        signed=lambda: (Axes((-4, 4), (-2, 2)), np.sin, dict(dx=0.25)),
+        center=lambda: (Axes((-3, 5), (-1, 8), width=10, height=5), lambda x: np.exp(0.3 * x), dict(input_sample_type="center", dx=0.5)),
+        right=lambda: (NumberPlane((-4, 4), (-3, 3)), np.cos, dict(input_sample_type="right", x_range=(-2, 3), dx=0.2)),
+        # Functions which can't take arrays
+        scalar_only=lambda: (Axes((-4, 4), (-2, 2)), lambda x: math.sin(x) if x > 0 else -0.5, dict(dx=0.5)),
+        colors=lambda: (Axes((-4, 4), (-2, 2)), np.cos, dict(dx=0.1, colors=(YELLOW, TEAL, PINK), negative_color=GREY)),
+    )
+
+
+@pytest.mark.parametrize("name", get_cases().keys())
+def test_rectangles_match_building_one_by_one(name):
+    axes, func, kwargs = get_cases()[name]()
+    graph = axes.get_graph(func)
+    rects = axes.get_riemann_rectangles(graph, **kwargs)
+    ref_rects = get_riemann_rectangles_one_by_one(axes, graph, **kwargs)
+    assert len(rects) == len(ref_rects) > 5
+    for rect, ref_rect in zip(rects, ref_rects):
+        assert rect.positive == ref_rect.positive
+        assert np.allclose(rect.get_points(), ref_rect.get_points(), atol=1e-6)
+        for key in ["fill_rgba", "stroke_rgba", "stroke_width"]:
+            assert np.allclose(rect.data[key], ref_rect.data[key], atol=1e-6)
+
+
+@pytest.mark.parametrize("name", get_cases().keys())
+def test_riemann_rectangles_match_vgroup(name):
+    axes, func, kwargs = get_cases()[name]()
+    graph = axes.get_graph(func)
+    rects = axes.get_riemann_rectangles(graph, **kwargs)
+    mob = RiemannRectangles(axes, graph, **kwargs)
+    assert mob.get_num_rectangles() == len(rects)
+    assert len(mob.get_subpaths()) == len(rects)
+    for subpath, rect in zip(mob.get_subpaths(), rects):
+        assert np.allclose(subpath, rect.get_points(), atol=1e-6)
+    n_ppr = mob.n_points_per_rectangle
+    fill_rgbas = mob.data["fill_rgba"]
+    for n, rect in enumerate(rects):
+        assert np.allclose(fill_rgbas[n * n_ppr:(n + 1) * n_ppr], rect.data["fill_rgba"][0], atol=1e-6)
+
+
+def test_update_heights_follows_graph():
+    axes = Axes((-4, 4), (-2, 2))
+    tracker = ValueTracker(1)
+    graph = axes.get_graph(lambda x: tracker.get_value() * np.sin(x))
+    mob = RiemannRectangles(axes, graph, dx=0.25)
+    rgbas = mob.data["fill_rgba"].copy()
+
+    # Scaled heights keep their colors
+    tracker.set_value(0.5)
+    mob.update_heights()
+    ref_mob = RiemannRectangles(axes, graph, dx=0.25)
+    assert np.allclose(mob.get_points(), ref_mob.get_points())
+    assert np.array_equal(mob.data["fill_rgba"], rgbas)
+
+    # While those changing sign are recolored
+    tracker.set_value(-1)
+    mob.update_heights()
+    ref_mob = RiemannRectangles(axes, graph, dx=0.25)
+    assert np.allclose(mob.get_points(), ref_mob.get_points())
+    assert np.allclose(mob.data["fill_rgba"], ref_mob.data["fill_rgba"])
+    assert not np.allclose(mob.data["fill_rgba"], rgbas)
+
+
+def test_transform_repeats_rectangles_in_order():
+    axes = Axes((-4, 4), (-2, 2))
+    graph = axes.get_graph(lambda x: 0.1 * x**2 + 0.5)
+    mob1 = RiemannRectangles(axes, graph, dx=1)
+    mob2 = RiemannRectangles(axes, graph, dx=0.25)
+    mob1.align_points(mob2)
+    assert mob1.get_num_rectangles() == mob2.get_num_rectangles() == 32
+    assert mob1.get_num_points() == mob2.get_num_points()
+    # Each coarse rectangle stands in for the four fine ones it covers
+    rect_points1, rect_points2 = (
+        np.vstack([mob.get_points(), mob.get_points()[-1:]]).reshape((32, mob.n_points_per_rectangle, 3))
+        for mob in (mob1, mob2)
+    )
+    for n in range(32):
+        # The lower left corner of each
+        assert rect_points1[n, 4, 0] == pytest.approx(axes.c2p(n // 4 - 4, 0)[0])
+        assert rect_points2[n, 4, 0] == pytest.approx(axes.c2p(n / 4 - 4, 0)[0])
@@ -0,0 +1,118 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from manimlib import *
+from manimlib.shader_wrapper import ShaderWrapper
+from manimlib.utils import shaders
+from manimlib.utils.directories import get_shader_dir
+from manimlib.utils.shaders import SHADER_PROGRAM_CACHE_SUBDIR
+from manimlib.utils.shaders import get_cached_program_code
+from manimlib.utils.shaders import get_shader_program
+from manimlib.utils.shaders import link_shader_program
+from manimlib.utils.shaders import load_shader_cache
+from manimlib.utils.shaders import prewarm_shader_programs
+
+
+def clear_shader_file_caches():
+    shaders.get_shader_code_from_file.cache_clear()
+    shaders.get_shader_dir_fingerprint.cache_clear()
+
+
+@pytest.fixture
+def shader_dir(tmp_path, monkeypatch):
+    """
+    A copy of the shader directory, which tests can edit
+    """
+    path = tmp_path / "shaders"
+    shutil.copytree(get_shader_dir(), path)
+    monkeypatch.setattr(shaders, "get_shader_dir", lambda: str(path))
+    monkeypatch.setattr(shaders, "SHADER_FILE_SOURCES", dict())
+    clear_shader_file_caches()
+    yield path
+    clear_shader_file_caches()
+
+
+def edit_shader_file(path):
+    stat = os.stat(path)
+    path.write_text(path.read_text() + "\n// Edited\n")
+    # Even if the file system doesn't register the change in time
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+def get_true_dot_wrapper() -> ShaderWrapper:
+    return ShaderWrapper(
+        Camera(resolution=(16, 9)).ctx,
+        vert_data=np.zeros(0, dtype=[("point", np.float32, (3,))]),
+        shader_folder="true_dot",
+    )
+
+
+def forget_processed_code(monkeypatch):
+    """
+    As if in a new run, only the cache on disk remains
+    """
+    monkeypatch.setattr(shaders, "PROCESSED_PROGRAM_CODE", dict())
+
+
+def test_program_code_reused_across_runs(shader_dir, monkeypatch):
+    program_code = get_true_dot_wrapper().program_code
+    forget_processed_code(monkeypatch)
+
+    def fail():
+        raise AssertionError("Shader files were read again")
+
+    monkeypatch.setattr(ShaderWrapper, "init_program_code", lambda self: fail())
+    assert get_true_dot_wrapper().program_code == program_code
+
+
+@pytest.mark.parametrize("file_name", ["true_dot/geom.glsl", "inserts/emit_gl_Position.glsl"])
+def test_program_code_invalidated_by_source_edits(shader_dir, monkeypatch, file_name):
+    key = "ShaderWrappertrue_dot{}"
+    get_true_dot_wrapper()
+    forget_processed_code(monkeypatch)
+    assert get_cached_program_code(key) is not None
+
+    # Whether the edit is to the file itself, or one inserted into it
+    forget_processed_code(monkeypatch)
+    edit_shader_file(shader_dir / file_name)
+    assert get_cached_program_code(key) is None
+
+    clear_shader_file_caches()
+    assert "// Edited" in get_true_dot_wrapper().program_code["geometry_shader"]
+    forget_processed_code(monkeypatch)
+    assert "// Edited" in get_cached_program_code(key)["geometry_shader"]
+
+
+def test_prewarmed_programs(shader_dir, monkeypatch):
+    get_true_dot_wrapper()
+    assert len(load_shader_cache(SHADER_PROGRAM_CACHE_SUBDIR)) == 1
+
+    # The next context links the program before it's needed
+    ctx = Camera(resolution=(16, 9)).ctx
+    prewarm_shader_programs(ctx)
+    n_hits = link_shader_program.cache_info().hits
+    program_code = get_true_dot_wrapper().program_code
+    get_shader_program(ctx, **program_code)
+    assert link_shader_program.cache_info().hits == n_hits + 1
+
+    # But not once any shader file has changed
+    edit_shader_file(shader_dir / "simple_vert.glsl")
+    clear_shader_file_caches()
+    assert load_shader_cache(SHADER_PROGRAM_CACHE_SUBDIR) == []
+    assert list(Path(get_cache_dir(), SHADER_PROGRAM_CACHE_SUBDIR).glob("*.json")) == []
+
+
+def test_prewarmed_programs_limited_to_most_recent(shader_dir):
+    ctx = Camera(resolution=(16, 9)).ctx
+    for n in range(5):
+        get_shader_program(ctx, vertex_shader=f"#version 330\n// {n}\nvoid main() {{ gl_Position = vec4(0.0); }}")
+    # Used in the order they were linked
+    for path in Path(get_cache_dir(), SHADER_PROGRAM_CACHE_SUBDIR).glob("*.json"):
+        n = int(path.read_text().split("// ")[1][0])
+        os.utime(path, ns=(n * 10**9, n * 10**9))
+    values = load_shader_cache(SHADER_PROGRAM_CACHE_SUBDIR, max_entries=3)
+    assert [value["vertex_shader"].split("\n")[1] for value in values] == ["// 4", "// 3", "// 2"]
+    assert len(load_shader_cache(SHADER_PROGRAM_CACHE_SUBDIR)) == 3
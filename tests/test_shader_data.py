@@ -0,0 +1,106 @@
+import numpy as np
+
+from manimlib import *
+from manimlib.shader_wrapper import ShaderWrapper
+from manimlib.utils.shaders import PROGRAM_UNIFORM_MIRRORS
+from manimlib.utils.shaders import set_program_uniform
+
+
+def render_changing_family(camera: Camera) -> list[bytes]:
+    """
+    Renders a family of mobjects while changing a few of its members at
+    a time, in ways which keep or change the length of their data, or
+    which family members there are
+    """
+    squares = Square(side_length=0.5).get_grid(3, 4, buff=0.1)
+    squares.set_fill(RED, 0.5)
+    dots = DotCloud(np.random.default_rng(0).uniform(-3, 3, (30, 3)))
+    group = Group(squares, dots)
+
+    frames = []
+    for n in range(12):
+        squares[n % len(squares)].shift(0.1 * UP).set_fill(BLUE, 0.8)
+        dots.set_color(interpolate_color(RED, GREEN, n / 12))
+        if n == 4:
+            squares[2].insert_n_curves(5)
+        if n == 7:
+            squares.remove(squares[5])
+        if n == 9:
+            squares.add(Circle(radius=0.3).set_fill(YELLOW, 1))
+        camera.capture(group)
+        frames.append(camera.get_raw_fbo_data())
+    return frames
+
+
+def test_incremental_vertex_updates_match_full_upload(monkeypatch):
+    n_incremental_updates = 0
+    read_in_changes = ShaderWrapper.read_in_changes
+
+    def counting_read_in_changes(self, index_to_data):
+        nonlocal n_incremental_updates
+        result = read_in_changes(self, index_to_data)
+        n_incremental_updates += result
+        return result
+
+    monkeypatch.setattr(ShaderWrapper, "read_in_changes", counting_read_in_changes)
+    frames = render_changing_family(Camera(resolution=(160, 90)))
+    assert n_incremental_updates > 0
+
+    monkeypatch.setattr(ShaderWrapper, "read_in_changes", lambda self, index_to_data: False)
+    ref_frames = render_changing_family(Camera(resolution=(160, 90)))
+
+    assert len(frames) == len(ref_frames)
+    for frame, ref_frame in zip(frames, ref_frames):
+        assert frame == ref_frame
+
+
+def test_read_in_changes_rewrites_ranges():
+    shader_wrapper = ShaderWrapper(
+        Camera(resolution=(16, 9)).ctx,
+        vert_data=np.zeros(0, dtype=[("point", np.float32, (3,))]),
+        shader_folder="true_dot",
+    )
+    data_list = [
+        np.zeros(n, dtype=shader_wrapper.vert_data.dtype)
+        for n in [3, 0, 2, 4]
+    ]
+    shader_wrapper.read_in(data_list)
+
+    for index, value in [(0, 1), (2, 2), (3, 3)]:
+        data_list[index] = np.full(len(data_list[index]), value, dtype=shader_wrapper.vert_data.dtype)
+    assert shader_wrapper.read_in_changes({0: data_list[0], 2: data_list[2], 3: data_list[3]})
+
+    expected = np.concatenate(data_list)
+    assert np.array_equal(shader_wrapper.vert_data, expected)
+    assert shader_wrapper.vbo.read() == expected.tobytes()
+
+    # Data of a new length can't be fit in place
+    longer = np.zeros(5, dtype=shader_wrapper.vert_data.dtype)
+    assert not shader_wrapper.read_in_changes({3: longer})
+    assert np.array_equal(shader_wrapper.vert_data, expected)
+
+
+def test_uniform_mirrors_dropped_with_programs():
+    ctx = Camera(resolution=(16, 9)).ctx
+    program = ctx.program(
+        vertex_shader='''
+            #version 330
+            uniform float scale;
+            in vec2 point;
+            void main() { gl_Position = vec4(scale * point, 0.0, 1.0); }
+        ''',
+        fragment_shader='''
+            #version 330
+            out vec4 color;
+            void main() { color = vec4(1.0); }
+        ''',
+    )
+    assert set_program_uniform(program, "scale", 2.0)
+    assert not set_program_uniform(program, "scale", 2.0)
+    assert program in PROGRAM_UNIFORM_MIRRORS
+
+    # Otherwise, a new program given the same id would be taken to have
+    # the uniforms of this one already set
+    n_mirrors = len(PROGRAM_UNIFORM_MIRRORS)
+    del program
+    assert len(PROGRAM_UNIFORM_MIRRORS) == n_mirrors - 1
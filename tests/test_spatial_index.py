@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from manimlib import *
+from manimlib.utils.spatial_index import MobjectSpatialIndex
+
+
+def point_to_mobject_by_scan(search_set: list[Mobject], point: np.ndarray, buff: float = 0) -> Mobject | None:
+    """
+    As Scene.point_to_mobject finds it, checking every mobject from the top
+    """
+    for mobject in reversed(search_set):
+        if mobject.is_point_touching(point, buff=buff):
+            return mobject
+    return None
+
+
+def get_touching_by_scan(search_set: list[Mobject], mobject: Mobject) -> list[Mobject]:
+    """
+    As InteractiveScene gathered a selection before it used an index
+    """
+    return [mob for mob in reversed(search_set) if mobject.is_touching(mob)]
+
+
+def get_search_set(mobjects: list[Mobject], use_family_members: bool) -> list[Mobject]:
+    if not use_family_members:
+        return mobjects
+    return [sm for mob in mobjects for sm in mob.family_members_with_points()]
+
+
+def get_mobjects(seed: int) -> list[Mobject]:
+    rng = np.random.default_rng(seed)
+    groups = [
+        VGroup(*(
+            Square(rng.uniform(0.05, 0.6)).move_to(rng.uniform(-6, 6, 3) * [1, 1, 0.2])
+            for _ in range(60)
+        ))
+        for _ in range(4)
+    ]
+    return [
+        FullScreenRectangle(),
+        *groups,
+        Circle(radius=2).shift(3 * LEFT),
+        Line(4 * LEFT, 4 * RIGHT + 2 * UP),
+        VGroup(),
+        Dot(),
+    ]
+
+
+def get_query_points(seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    points = rng.uniform(-8, 8, (300, 3)) * [1, 1, 0]
+    # Points on a cell boundary
+    return np.vstack([points, [[0.25, 0.5, 0], [-1, -1, 0], [0, 0, 0]]])
+
+
+def assert_index_matches_scan(index: MobjectSpatialIndex, mobjects: list[Mobject], use_family_members: bool):
+    search_set = get_search_set(mobjects, use_family_members)
+    assert index.get_mobjects() == search_set
+    for buff in [0, SMALL_BUFF]:
+        for point in get_query_points(1):
+            assert index.point_to_mobject(point, buff=buff) is point_to_mobject_by_scan(search_set, point, buff)
+    rng = np.random.default_rng(2)
+    for _ in range(30):
+        corners = rng.uniform(-8, 8, (2, 3)) * [1, 1, 0]
+        rect = Rectangle().set_points_as_corners([
+            corners[0], [corners[1][0], corners[0][1], 0], corners[1],
+        ])
+        assert index.get_mobjects_touching(rect) == get_touching_by_scan(search_set, rect)
+
+
+@pytest.mark.parametrize("use_family_members", [False, True])
+def test_index_matches_scan(use_family_members):
+    mobjects = get_mobjects(0)
+    index = MobjectSpatialIndex()
+    index.set_mobjects(mobjects, use_family_members=use_family_members)
+    assert_index_matches_scan(index, mobjects, use_family_members)
+
+
+@pytest.mark.parametrize("use_family_members", [False, True])
+def test_index_follows_changes(use_family_members):
+    mobjects = get_mobjects(0)
+    index = MobjectSpatialIndex()
+    index.set_mobjects(mobjects, use_family_members=use_family_members)
+    index.get_mobjects()
+
+    # Moving some members, or whole groups
+    for sm in mobjects[1][::7]:
+        sm.shift(2 * RIGHT + UP)
+    mobjects[2].shift(3 * DOWN)
+    mobjects[3][5].scale(4)
+    assert_index_matches_scan(index, mobjects, use_family_members)
+
+    # Adding and removing members
+    mobjects[4].add(Square(2).shift(2 * RIGHT))
+    mobjects[1].remove(*mobjects[1][:10])
+    mobjects[-2].add(Triangle())
+    assert_index_matches_scan(index, mobjects, use_family_members)
+
+    # Or the mobjects themselves
+    mobjects = [mobjects[-1], *mobjects[2:5], Square(3)]
+    index.set_mobjects(mobjects, use_family_members=use_family_members)
+    assert_index_matches_scan(index, mobjects, use_family_members)
+
+
+def test_large_mobjects_checked_on_every_query():
+    index = MobjectSpatialIndex(cell_size=0.5, max_cells_per_mobject=4)
+    mobjects = get_mobjects(1)
+    index.set_mobjects(mobjects)
+    assert_index_matches_scan(index, mobjects, False)
+    assert len(index.large_indices) > 0
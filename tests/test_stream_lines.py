@@ -0,0 +1,155 @@
+import numpy as np
+import pytest
+from scipy.integrate import solve_ivp
+
+from manimlib import *
+from manimlib.mobject.vector_field import ode_solution_points
+from manimlib.mobject.vector_field import runge_kutta_step
+
+
+def pendulum_func(coords: np.ndarray) -> np.ndarray:
+    # Works on single states, as solve_ivp passes, and on arrays of them
+    coords = np.asarray(coords)
+    x, y = coords[..., 0], coords[..., 1]
+    return np.stack([y, -np.sin(x) - 0.2 * y], axis=-1)
+
+
+def get_stream_lines(**kwargs) -> StreamLines:
+    # Seeds have noise added from the global random state
+    np.random.seed(0)
+    plane = NumberPlane((-4, 4), (-3, 3))
+    return StreamLines(pendulum_func, plane, density=0.5, **kwargs)
+
+
+def get_start_coords(stream_lines: StreamLines) -> np.ndarray:
+    np.random.seed(0)
+    return stream_lines.get_sample_coords()
+
+
+def integrate_by_seed(stream_lines: StreamLines) -> list[np.ndarray]:
+    """
+    The points of each line as found by stepping its seed on its own,
+    with the same steps and stopping conditions as draw_lines
+    """
+    sl = stream_lines
+    cs = sl.coordinate_system
+    n_steps = min(len(np.arange(0, sl.solution_time, sl.dt)) - 1, sl.max_time_steps)
+    result = []
+    for coords in get_start_coords(sl):
+        points = [cs.c2p(*coords)]
+        arc_len = 0
+        for step in range(n_steps):
+            coords = runge_kutta_step(sl.func, coords[np.newaxis], sl.dt)[0]
+            point = cs.c2p(*coords)
+            if not np.isfinite(point).all():
+                break
+            arc_len += get_norm(point - points[-1])
+            points.append(point)
+            if get_norm(point) > sl.cutoff_norm or arc_len > sl.arc_len:
+                break
+        if len(points) > 1:
+            result.append(np.array(points))
+    return result
+
+
+@pytest.mark.parametrize("kwargs", [
+    dict(),
+    dict(arc_len=1.5, cutoff_norm=4),
+    dict(max_time_steps=7, dt=0.1),
+])
+def test_batched_lines_match_lines_stepped_one_by_one(kwargs):
+    stream_lines = get_stream_lines(color_by_magnitude=False, **kwargs)
+    ref_anchors = integrate_by_seed(stream_lines)
+    assert len(stream_lines) == len(ref_anchors) > 10
+    for line, anchors in zip(stream_lines, ref_anchors):
+        assert np.allclose(line.get_anchors(), anchors, atol=1e-5)
+        assert line.virtual_time == pytest.approx((len(anchors) - 1) * stream_lines.dt)
+        # Handles found together match those of each line on its own
+        ref_line = VMobject().set_points_smoothly(anchors)
+        assert np.allclose(line.get_points(), ref_line.get_points(), atol=1e-3)
+
+
+def test_lines_as_accurate_as_solve_ivp_without_cutoffs():
+    # Before lines were integrated in a batch, each was solved with solve_ivp,
+    # and arc_len, cutoff_norm and max_time_steps were ignored
+    stream_lines = get_stream_lines(
+        color_by_magnitude=False,
+        arc_len=np.inf,
+        cutoff_norm=np.inf,
+        max_time_steps=10**6,
+    )
+    cs = stream_lines.coordinate_system
+    start_coords = get_start_coords(stream_lines)
+    times = np.arange(0, stream_lines.solution_time, stream_lines.dt)
+    assert len(stream_lines) == len(start_coords)
+    for line, coords in zip(stream_lines, start_coords):
+        exact_coords = solve_ivp(
+            lambda t, state: pendulum_func(state),
+            t_span=(0, stream_lines.solution_time),
+            y0=coords,
+            t_eval=times,
+            rtol=1e-11,
+            atol=1e-12,
+        ).y.T
+        exact_points = cs.c2p(*exact_coords.T)
+        old_points = cs.c2p(*ode_solution_points(pendulum_func, coords, stream_lines.solution_time, stream_lines.dt).T)
+        error = np.abs(line.get_anchors() - exact_points).max()
+        assert error < 1e-5
+        assert error <= np.abs(old_points - exact_points).max() + 1e-6
+
+
+def test_lines_stop_at_cutoffs():
+    stream_lines = get_stream_lines(arc_len=1.5, cutoff_norm=4, color_by_magnitude=False)
+    n_stopped = 0
+    for line in stream_lines:
+        anchors = line.get_anchors()
+        arc_lens = np.cumsum(np.linalg.norm(np.diff(anchors, axis=0), axis=1))
+        # Seeds themselves may start beyond cutoff_norm
+        assert (np.linalg.norm(anchors[1:-1], axis=1) <= 4 + 1e-5).all()
+        assert (arc_lens[:-1] <= 1.5 + 1e-5).all()
+        n_stopped += len(anchors) < 60
+    assert n_stopped == len(stream_lines)
+
+
+def color_by_magnitude_per_point(stream_lines: StreamLines) -> list[np.ndarray]:
+    """
+    The stroke rgbas which StreamLines.init_style gave each line when it
+    evaluated the field one point at a time
+    """
+    values_to_rgbs = get_vectorized_rgb_gradient_function(
+        *stream_lines.magnitude_range, stream_lines.color_map,
+    )
+    cs = stream_lines.coordinate_system
+    result = []
+    for line in stream_lines:
+        norms = [
+            get_norm(stream_lines.func(cs.p2c(point)))
+            for point in line.get_points()
+        ]
+        rgbas = np.zeros((len(norms), 4))
+        rgbas[:, :3] = values_to_rgbs(norms)
+        rgbas[:, 3] = stream_lines.stroke_opacity
+        result.append(rgbas)
+    return result
+
+
+def test_stream_line_colors_match_per_point_evaluation():
+    stream_lines = get_stream_lines(stroke_opacity=0.7, magnitude_range=(0, 3))
+    ref_rgbas = color_by_magnitude_per_point(stream_lines)
+    assert len(stream_lines) == len(ref_rgbas) > 10
+    for line, rgbas in zip(stream_lines, ref_rgbas):
+        assert np.allclose(line.data["stroke_rgba"], rgbas, atol=1e-6)
+
+
+def test_vector_field_colors_match_per_point_evaluation():
+    plane = NumberPlane((-4, 4), (-3, 3))
+    field = VectorField(
+        pendulum_func, plane,
+        magnitude_range=(0, 3),
+        norm_to_opacity_func=lambda norms: np.clip(norms / 2, 0.2, 1),
+    )
+    # As before, evaluating the color map on each point rather than each vector
+    norms = np.repeat(np.linalg.norm(pendulum_func(field.sample_coords), axis=1), 8)[:-1]
+    rgbas = field.color_map(inverse_interpolate(0, 3, norms))
+    assert np.allclose(field.data["stroke_rgba"][:, :3], rgbas[:, :3], atol=1e-7)
+    assert np.allclose(field.get_stroke_opacities(), np.clip(norms / 2, 0.2, 1), atol=1e-7)
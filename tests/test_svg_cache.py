@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+
+from manimlib import *
+from manimlib.mobject.svg import svg_mobject
+from manimlib.mobject.svg.svg_mobject import VMobjectFromSVGPath
+from manimlib.utils.cache import SVG_CACHE_SUBDIR
+from manimlib.utils.cache import clear_cache
+
+
+SVG_STRING = """\
+<svg xmlns="http://www.w3.org/2000/svg" width="40" height="20" viewBox="0 0 40 20">
+<path d="M 2 2 L 18 2 L 18 18 Z M 6 6 L 14 6 L 10 14 Z" fill="#ff8800"/>
+<path d="M 22 10 C 22 2 38 2 38 10 Q 30 20 22 10" fill="#0088ff" stroke="#ffffff" stroke-width="1"/>
+<path d="M 25 15 A 3 3 0 1 0 31 15" fill="none" stroke="#00ff00"/>
+</svg>
+"""
+
+SHAPES_SVG_STRING = """\
+<svg xmlns="http://www.w3.org/2000/svg" width="20" height="20" viewBox="0 0 20 20">
+<circle cx="10" cy="10" r="5" fill="#ff0000"/>
+<path d="M 2 2 L 18 2 L 18 18 Z"/>
+</svg>
+"""
+
+
+def get_svg_cache_files() -> list[Path]:
+    return list(Path(get_cache_dir(), SVG_CACHE_SUBDIR).glob("*.npz"))
+
+
+def new_run(monkeypatch):
+    """
+    As if in a new run, only the cache on disk remains
+    """
+    monkeypatch.setattr(svg_mobject, "SVG_HASH_TO_MOB_MAP", dict())
+
+
+@pytest.fixture
+def parse_count(monkeypatch):
+    """
+    Counts the svgs parsed by SVGMobjects
+    """
+    counts = [0]
+    parse = SVGMobject.mobjects_from_svg_string
+
+    def counted_parse(self, svg_string):
+        counts[0] += 1
+        return parse(self, svg_string)
+
+    monkeypatch.setattr(SVGMobject, "mobjects_from_svg_string", counted_parse)
+    return counts
+
+
+def assert_same_svg_mobjects(mob1: SVGMobject, mob2: SVGMobject):
+    family1 = mob1.get_family()
+    family2 = mob2.get_family()
+    assert len(family1) == len(family2)
+    for sm1, sm2 in zip(family1, family2):
+        assert type(sm1) is type(sm2)
+        assert np.array_equal(sm1.data, sm2.data)
+        assert sm1.uniforms.keys() == sm2.uniforms.keys()
+        for key in sm1.uniforms:
+            assert np.array_equal(sm1.uniforms[key], sm2.uniforms[key])
+        if sm1.has_points():
+            assert np.array_equal(sm1.get_subpath_end_indices(), sm2.get_subpath_end_indices())
+            assert sm1.path_obj.d() == sm2.path_obj.d()
+
+
+def test_cached_svg_matches_parsed(monkeypatch, parse_count):
+    mob = SVGMobject(svg_string=SVG_STRING)
+    assert parse_count[0] == 1
+    assert len(get_svg_cache_files()) == 1
+
+    new_run(monkeypatch)
+    cached_mob = SVGMobject(svg_string=SVG_STRING)
+    assert parse_count[0] == 1
+    assert all(type(sm) is VMobjectFromSVGPath for sm in cached_mob.submobjects)
+    assert_same_svg_mobjects(cached_mob, mob)
+
+
+@pytest.mark.parametrize("changes", [
+    dict(svg_string=SVG_STRING.replace("38 10", "37 10")),
+    dict(path_string_config=dict(long_lines=True)),
+    dict(svg_default=dict(
+        color=None, opacity=None,
+        fill_color=RED, fill_opacity=None,
+        stroke_width=2, stroke_color=None, stroke_opacity=None,
+    )),
+])
+def test_cache_invalidated_by_changes_to_parsing(monkeypatch, parse_count, changes):
+    SVGMobject(svg_string=SVG_STRING)
+    new_run(monkeypatch)
+    changed_mob = SVGMobject(**dict(dict(svg_string=SVG_STRING), **changes))
+    assert parse_count[0] == 2
+    assert len(get_svg_cache_files()) == 2
+
+    new_run(monkeypatch)
+    assert_same_svg_mobjects(SVGMobject(**dict(dict(svg_string=SVG_STRING), **changes)), changed_mob)
+    assert parse_count[0] == 2
+
+
+def test_cache_invalidated_by_version(monkeypatch, parse_count):
+    SVGMobject(svg_string=SVG_STRING)
+    new_run(monkeypatch)
+    monkeypatch.setattr(svg_mobject, "SVG_CACHE_VERSION", svg_mobject.SVG_CACHE_VERSION + 1)
+    SVGMobject(svg_string=SVG_STRING)
+    assert parse_count[0] == 2
+
+
+def test_unreadable_entries_parsed_again(monkeypatch, parse_count):
+    mob = SVGMobject(svg_string=SVG_STRING)
+    cache_file, = get_svg_cache_files()
+    cache_file.write_bytes(cache_file.read_bytes()[:100])
+
+    new_run(monkeypatch)
+    assert_same_svg_mobjects(SVGMobject(svg_string=SVG_STRING), mob)
+    assert parse_count[0] == 2
+
+
+def test_svgs_with_other_shapes_not_cached(monkeypatch, parse_count):
+    SVGMobject(svg_string=SHAPES_SVG_STRING)
+    assert get_svg_cache_files() == []
+    new_run(monkeypatch)
+    SVGMobject(svg_string=SHAPES_SVG_STRING)
+    assert parse_count[0] == 2
+
+
+def test_clear_cache_removes_svg_cache(parse_count):
+    SVGMobject(svg_string=SVG_STRING)
+    assert len(get_svg_cache_files()) == 1
+    clear_cache()
+    assert get_svg_cache_files() == []
@@ -0,0 +1,210 @@
+import subprocess
+
+import pytest
+
+from manimlib import *
+from manimlib.scene import scene as scene_module
+from manimlib.utils import tex_file_writing
+
+
+FAKE_SVG = """
+<svg xmlns="http://www.w3.org/2000/svg" width="10pt" height="10pt" viewBox="0 0 10 10">
+<path d="M0 0L10 0L10 10Z"/>
+</svg>
+"""
+
+
+@pytest.fixture
+def compiled_tex(monkeypatch):
+    """
+    Stands in for the LaTeX compiler, returning the list of
+    documents compiled so far
+    """
+    documents = []
+
+    def compile_tex_to_svg(full_tex, compiler="latex"):
+        documents.append(full_tex)
+        return FAKE_SVG
+
+    monkeypatch.setattr(tex_file_writing, "compile_tex_to_svg", compile_tex_to_svg)
+    return documents
+
+
+class TexScene(Scene):
+    def construct(self):
+        self.add(Tex("x^2"), TexText("Hello"))
+
+
+def test_prefetch_is_off_by_default(scene_config, compiled_tex, monkeypatch):
+    prefetched_scenes = []
+    monkeypatch.setattr(scene_module, "prefetch_scene_tex", prefetched_scenes.append)
+    TexScene(**scene_config()).run()
+    assert prefetched_scenes == []
+    assert len(compiled_tex) == 3
+
+
+def test_prefetch_compiles_literal_tex_up_front(scene_config, compiled_tex, monkeypatch):
+    monkeypatch.setitem(manim_config.tex, "prefetch", True)
+
+    class CheckedTexScene(TexScene):
+        def setup(self):
+            self.n_prefetched = len(compiled_tex)
+
+    scene = CheckedTexScene(**scene_config())
+    scene.run()
+    # The reference Tex used for scaling, and both from construct
+    assert scene.n_prefetched == 3
+    assert len(compiled_tex) == 3
+
+
+def test_prefetch_failure_does_not_stop_scene(scene_config, compiled_tex, monkeypatch):
+    monkeypatch.setitem(manim_config.tex, "prefetch", True)
+
+    def failing_prefetch(scene):
+        raise RuntimeError("Prefetch failed")
+
+    monkeypatch.setattr(scene_module, "prefetch_scene_tex", failing_prefetch)
+    TexScene(**scene_config()).run()
+    assert len(compiled_tex) == 3
+
+
+def test_tex_cache_invalidation(compiled_tex):
+    Tex("x^2")
+    n_compiled = len(compiled_tex)
+
+    # Cached in memory, and then on disk
+    Tex("x^2")
+    tex_file_writing.latex_to_svg.cache_clear()
+    Tex("x^2")
+    assert len(compiled_tex) == n_compiled
+
+    # Different content, preamble or template all compile anew
+    Tex("x^3")
+    Tex("x^2", additional_preamble=r"\usepackage{bm}")
+    Tex("x^2", template="basic")
+    assert len(compiled_tex) == n_compiled + 3
+
+
+@pytest.fixture
+def compiled_batches(monkeypatch):
+    """
+    Stands in for the LaTeX compiler when compiling batches, returning the
+    list of (preamble, contents) compiled so far.  Each page comes out as
+    its content, and documents with a content of "\\fail" fail
+    """
+    batches = []
+
+    def compile_tex_batch_to_svgs(contents, preamble="", compiler="latex"):
+        batches.append((preamble, list(contents)))
+        if "\\fail" in contents:
+            raise tex_file_writing.LatexError("Failed")
+        return list(contents)
+
+    monkeypatch.setattr(tex_file_writing, "compile_tex_batch_to_svgs", compile_tex_batch_to_svgs)
+    return batches
+
+
+def get_requests(contents: list[str], preamble: str = "") -> list[tuple[str, str, str]]:
+    return [
+        (tex_file_writing.get_full_tex(content, preamble), "latex", "")
+        for content in contents
+    ]
+
+
+def get_cached_svg(args: tuple[str, str, str]) -> str | None:
+    if not tex_file_writing.is_cached_on_disk(tex_file_writing.full_tex_to_svg, *args):
+        return None
+    return tex_file_writing.full_tex_to_svg(*args)
+
+
+def test_split_full_tex_inverts_get_full_tex():
+    preamble = "\\usepackage{amsmath}\n\n\\usepackage{bm}"
+    content = "x^2\n\n\\begin{document}"
+    full_tex = tex_file_writing.get_full_tex(content, preamble)
+    assert tex_file_writing.split_full_tex(full_tex) == (preamble, content)
+    assert tex_file_writing.split_full_tex(full_tex.replace("preview", "border=1pt")) is None
+
+
+def test_batches_cached_as_single_compilations(compiled_tex, compiled_batches):
+    contents = [f"x^{n}" for n in range(7)]
+    requests = get_requests(contents, "A") + get_requests(["y", "z"], "B")
+    tex_file_writing.prefetch_full_tex_to_svg(requests, num_workers=2, batch=True)
+
+    # Split among workers, but never across preambles, with pages
+    # left on their own compiled as usual
+    assert sorted((preamble, len(batch)) for preamble, batch in compiled_batches) == [
+        ("A", 3), ("A", 4),
+    ]
+    assert len(compiled_tex) == 2
+    for args, svg in zip(requests, contents + 2 * [FAKE_SVG]):
+        assert get_cached_svg(args) == svg
+
+    # Once cached, nothing is compiled again
+    tex_file_writing.prefetch_full_tex_to_svg(requests, num_workers=2, batch=True)
+    assert len(compiled_batches) == 2
+    assert len(compiled_tex) == 2
+
+
+def test_batches_leave_out_formulas_changing_state(compiled_tex, compiled_batches):
+    contents = ["x", "\\def\\y{2}\\y", "\\setcounter{equation}{3}z", "w", "\\newcommand{\\v}{v}\\v"]
+    tex_file_writing.prefetch_full_tex_to_svg(get_requests(contents), num_workers=1, batch=True)
+    assert compiled_batches == [("", ["x", "w"])]
+    assert len(compiled_tex) == 3
+
+
+def test_failed_batches_compiled_one_by_one(compiled_tex, compiled_batches, monkeypatch):
+    def compile_tex_to_svg(full_tex, compiler="latex"):
+        compiled_tex.append(full_tex)
+        if "\\fail" in full_tex:
+            raise tex_file_writing.LatexError("Failed")
+        return FAKE_SVG
+
+    monkeypatch.setattr(tex_file_writing, "compile_tex_to_svg", compile_tex_to_svg)
+    requests = get_requests(["x", "\\fail", "y"])
+    tex_file_writing.prefetch_full_tex_to_svg(requests, num_workers=1, batch=True)
+    assert len(compiled_batches) == 1
+    assert len(compiled_tex) == 3
+    # Only the broken formula is left to raise when used
+    assert get_cached_svg(requests[0]) == FAKE_SVG
+    assert get_cached_svg(requests[1]) is None
+    assert get_cached_svg(requests[2]) == FAKE_SVG
+
+
+def fake_batch_compiler(documents: list[str], max_pages: int | None = None):
+    """
+    Stands in for subprocess.run with latex and dvisvgm, where each page of
+    a batch document comes out as its content, recording each document
+    """
+    def run(command, **kwargs):
+        if command[0] == "latex":
+            tex_path = Path(command[-1])
+            documents.append(tex_path.read_text())
+            tex_path.with_suffix(".dvi").write_text(documents[-1])
+        elif command[0] == "dvisvgm":
+            pages = Path(command[1]).read_text().split("\\begin{standalone}")[1:max_pages]
+            output = command[-1][len("--output="):]
+            for n, page in enumerate(pages, start=1):
+                content = page.split("\\begingroup\n")[1].split("\n\\endgroup")[0]
+                Path(output.replace("%p", str(n))).write_text(content)
+        return subprocess.CompletedProcess(command, 0, "", "")
+    return run
+
+
+def test_batch_documents_give_a_page_per_formula(monkeypatch):
+    documents = []
+    monkeypatch.setattr(tex_file_writing.subprocess, "run", fake_batch_compiler(documents))
+    # Enough pages that sorting them by name would put page 10 before 2
+    contents = [f"x_{{{n}}}" for n in range(12)]
+    assert tex_file_writing.compile_tex_batch_to_svgs(contents, "\\usepackage{bm}") == contents
+
+    document, = documents
+    assert document.startswith("\\documentclass[preview,multi]{standalone}\n\n\\usepackage{bm}")
+    assert tex_file_writing.BATCH_PAGE_SETUP in document
+    # Each page resets counters
+    assert document.count("\\begin{standalone}\\manimresetcounters\n") == len(contents)
+
+
+def test_batch_documents_missing_pages_fail(monkeypatch):
+    monkeypatch.setattr(tex_file_writing.subprocess, "run", fake_batch_compiler([], max_pages=-1))
+    with pytest.raises(tex_file_writing.LatexError):
+        tex_file_writing.compile_tex_batch_to_svgs(["x", "y", "z"])
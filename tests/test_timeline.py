@@ -0,0 +1,110 @@
+import importlib.util
+
+import pytest
+from addict import Dict
+
+from manimlib import *
+from manimlib import extract_scene
+from manimlib.extract_scene import ParallelSceneRender
+from manimlib.extract_scene import get_timeline
+from manimlib.extract_scene import get_timeline_key
+
+
+class TimedScene(Scene):
+    def construct(self):
+        self.wait(0.5)
+        self.play(FadeIn(Square()), run_time=1.0)
+        self.wait(0.3)
+
+
+@pytest.fixture
+def prerun_scenes(monkeypatch):
+    """
+    Records each scene class prerun to find a timeline
+    """
+    scene_classes = []
+    prerun_scene = extract_scene.prerun_scene
+
+    def recording_prerun_scene(scene_class, scene_config):
+        scene_classes.append(scene_class)
+        return prerun_scene(scene_class, scene_config)
+
+    monkeypatch.setattr(extract_scene, "prerun_scene", recording_prerun_scene)
+    return scene_classes
+
+
+def test_timeline_is_saved_and_reused(scene_config, prerun_scenes):
+    timeline = get_timeline(TimedScene, scene_config())
+    assert timeline["skip_time"] == 0
+    assert timeline["time"] == pytest.approx(1.8)
+    assert timeline["animation_end_times"] == pytest.approx([0.5, 1.5, 1.8])
+
+    assert get_timeline(TimedScene, scene_config()) == timeline
+    assert prerun_scenes == [TimedScene]
+
+
+def test_timeline_is_invalidated_by_changes(scene_config, prerun_scenes, tmp_path, monkeypatch):
+    get_timeline(TimedScene, scene_config())
+
+    # Anything in the scene config changing the timing
+    get_timeline(TimedScene, dict(scene_config(), default_wait_time=2.0))
+    # The frame rate, which wait_until steps by
+    monkeypatch.setitem(manim_config.camera, "fps", 15)
+    get_timeline(TimedScene, scene_config())
+    assert len(prerun_scenes) == 3
+
+    # Editing the scene's source, or that of any helper module
+    scene_path = tmp_path / "timed_scene.py"
+    scene_path.write_text(
+        "from manimlib import *\n\n\n"
+        "class EditedScene(Scene):\n"
+        "    def construct(self):\n"
+        "        self.wait(0.5)\n"
+    )
+    spec = importlib.util.spec_from_file_location("timed_scene", scene_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    key = get_timeline_key(module.EditedScene, scene_config())
+    get_timeline(module.EditedScene, scene_config())
+    get_timeline(module.EditedScene, scene_config())
+    assert len(prerun_scenes) == 4
+
+    scene_path.write_text(scene_path.read_text().replace("0.5", "0.7"))
+    assert get_timeline_key(module.EditedScene, scene_config()) != key
+    get_timeline(module.EditedScene, scene_config())
+    assert len(prerun_scenes) == 5
+
+
+def test_timeline_gives_progress_display_totals(scene_config, monkeypatch):
+    config = scene_config(write_to_movie=True, cache_partial_movies=True, quiet=False)
+    config["file_writer_config"]["animation_end_times"] = get_timeline(TimedScene, config)["animation_end_times"]
+
+    totals = []
+    get_progress_display_total = SceneFileWriter.get_progress_display_total
+
+    def recording_get_progress_display_total(self):
+        totals.append(get_progress_display_total(self))
+        return totals[-1]
+
+    monkeypatch.setattr(SceneFileWriter, "get_progress_display_total", recording_get_progress_display_total)
+    TimedScene(**config).run()
+    # One partial movie for each play or wait call, at 10 fps
+    assert totals == [5, 10, 3]
+
+
+def test_parallel_render_uses_saved_timeline(scene_config, prerun_scenes, serial_processes, monkeypatch):
+    ranges = []
+    monkeypatch.setattr(
+        extract_scene, "render_scene_range",
+        lambda file_name, scene_name, config, start, end, output_directory: ranges.append((start, end)),
+    )
+    monkeypatch.setattr(SceneFileWriter, "concatenate_movie_files", lambda self, paths: None)
+    monkeypatch.setitem(manim_config.file_writer, "quiet", True)
+    run_config = Dict(file_name=__file__, parallel=2)
+
+    config = scene_config(write_to_movie=True)
+    get_timeline(TimedScene, config)
+    ParallelSceneRender(TimedScene, config, run_config).run()
+    assert prerun_scenes == [TimedScene]
+    # The play call holds most of the frames
+    assert sorted(ranges) == [(0, 2), (2, 3)]
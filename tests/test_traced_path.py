@@ -0,0 +1,102 @@
+import numpy as np
+import pytest
+
+from manimlib import *
+
+
+class FullRebuildTracedPath(TracedPath):
+    """
+    TracedPath as it was before keeping its points in a ring buffer,
+    rebuilding the whole path with set_points_smoothly every frame
+    """
+    def __init__(self, *args, initial_points=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.point_list = list(initial_points)
+
+    def update_path(self, dt):
+        if dt == 0:
+            return self
+        point = self.traced_point_func().copy()
+        self.point_list.append(point)
+
+        if self.time_traced < np.inf:
+            n_relevant_points = int(self.time_traced / dt + 0.5)
+            n_tps = len(self.point_list)
+            if n_tps < n_relevant_points:
+                points = self.point_list + [point] * (n_relevant_points - n_tps)
+            else:
+                points = self.point_list[n_tps - n_relevant_points:]
+        else:
+            points = self.point_list
+
+        if points:
+            self.set_points_smoothly(points)
+        self.set_stroke(**self.stroke_config)
+        self.time += dt
+        return self
+
+
+def circle(t):
+    return np.array([np.cos(t), np.sin(t), 0])
+
+
+def stop_and_go(t):
+    return np.array([np.floor(t) + min(1, 3 * (t % 1)), 0.5 * np.floor(t), 0])
+
+
+def lattice_walk(t):
+    steps = np.round(np.random.default_rng(1).normal(size=(200, 2)))
+    points = 0.05 * np.cumsum(steps, axis=0)
+    x, y = points[min(int(round(30 * t)), 199)]
+    return np.array([x, y, 0.5])
+
+
+def assert_paths_match(path, ref_path):
+    for key in ["point", "stroke_rgba", "stroke_width"]:
+        assert np.array_equal(path.data[key], ref_path.data[key])
+
+
+@pytest.mark.parametrize("func", [circle, lambda t: circle(2 * PI * t), lambda t: 0.2 * t * RIGHT, stop_and_go, lattice_walk])
+@pytest.mark.parametrize("time_traced", [np.inf, 1.0])
+def test_traced_path_matches_full_rebuild(func, time_traced, monkeypatch):
+    time = 0.0
+    path = TracedPath(lambda: func(time), time_traced=time_traced)
+    ref_path = FullRebuildTracedPath(lambda: func(time), time_traced=time_traced)
+
+    n_end_updates = 0
+    update_path_ends = TracedPath.update_path_ends
+
+    def counting_update_path_ends(self, *args):
+        nonlocal n_end_updates
+        result = update_path_ends(self, *args)
+        n_end_updates += result
+        return result
+
+    monkeypatch.setattr(TracedPath, "update_path_ends", counting_update_path_ends)
+
+    for frame in range(150):
+        time += 1 / 30
+        path.update_path(1 / 30)
+        ref_path.update_path(1 / 30)
+        assert_paths_match(path, ref_path)
+    assert n_end_updates > 0
+
+
+def test_tracing_tail_matches_full_rebuild():
+    dot = Dot()
+    tail = TracingTail(dot, time_traced=1.0)
+    # The list of points used to be filled with the initial center, which is
+    # a view of the dot's bounding box, and so moves with it
+    n_initial_points = int(tail.time_traced / tail.time_per_anchor)
+    ref_tail = FullRebuildTracedPath(
+        dot.get_center,
+        time_traced=1.0,
+        stroke_width=(0, 3),
+        stroke_opacity=(0, 1),
+        initial_points=n_initial_points * [dot.get_center()],
+    )
+    for frame in range(60):
+        dot.move_to(circle(frame / 10) + frame / 30 * RIGHT)
+        tail.update_path(1 / 30)
+        ref_tail.update_path(1 / 30)
+        assert_paths_match(tail, ref_tail)
@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from manimlib import *
+
+
+@pytest.fixture
+def cache_stats():
+    VMobject.reset_triangulation_cache_stats()
+    yield VMobject.get_triangulation_cache_stats
+    VMobject.reset_triangulation_cache_stats()
+
+
+def get_inner_triangle_areas(vmobject: VMobject, triangulation: np.ndarray) -> np.ndarray:
+    tri_indices = triangulation[len(vmobject.get_outer_vert_indices()):]
+    tris = vmobject.get_points()[tri_indices].reshape((-1, 3, 3))
+    return cross2d(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0]) / 2
+
+
+def get_polygon_area(polygon: Polygon) -> float:
+    x, y = polygon.get_vertices()[:, :2].T
+    return 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+def assert_tiles_polygon(polygon: Polygon):
+    areas = get_inner_triangle_areas(polygon, polygon.get_triangulation())
+    assert (areas >= -1e-6).all() or (areas <= 1e-6).all()
+    assert np.abs(areas).sum() == pytest.approx(get_polygon_area(polygon), rel=1e-5)
+
+
+def get_fresh_triangulation(vmobject: VMobject) -> np.ndarray:
+    return VMobject().set_points(vmobject.get_points()).get_triangulation()
+
+
+def test_triangulation_reused_after_affine_maps(cache_stats):
+    # A star, whose straight edges only have a concavity up to rounding error
+    angles = np.linspace(0, TAU, 14, endpoint=False)
+    radii = np.tile([1.0, 0.4], 7)
+    star = Polygon(*(radius * rotate_vector(RIGHT, angle) for radius, angle in zip(radii, angles)))
+    star.add_subpath(Circle(radius=0.2).get_points())
+    triangulation = star.get_triangulation().copy()
+    area = np.abs(get_inner_triangle_areas(star, triangulation)).sum()
+    assert cache_stats() == dict(hits=0, misses=1)
+
+    star.shift(RIGHT).rotate(30 * DEG).scale(1.5).stretch(0.5, 0)
+    assert np.array_equal(star.get_triangulation(), triangulation)
+    assert cache_stats() == dict(hits=1, misses=1)
+    assert np.abs(get_inner_triangle_areas(star, triangulation)).sum() == pytest.approx(1.125 * area, rel=1e-5)
+
+
+def test_triangulation_invalidated_by_topology(cache_stats):
+    square = Square()
+    square.get_triangulation()
+
+    # A handle moved across the curve makes it concave
+    points = square.get_points().copy()
+    points[1] += 0.6 * (square.get_center() - points[1])
+    square.set_points(points)
+    assert np.array_equal(square.get_triangulation(), get_fresh_triangulation(square))
+    assert cache_stats()["misses"] == 3
+
+    # A new subpath
+    square.add_subpath(Circle(radius=0.2).get_points())
+    assert np.array_equal(square.get_triangulation(), get_fresh_triangulation(square))
+    assert cache_stats()["misses"] == 5
+    assert cache_stats()["hits"] == 0
+
+
+def test_triangulation_invalidated_by_flipped_triangles(cache_stats):
+    # A diamond is split along one diagonal or the other
+    vertices = [DOWN, RIGHT, UP, LEFT]
+    diamond = Polygon(*vertices)
+    assert_tiles_polygon(diamond)
+    tri_indices = diamond.get_triangulation()[len(diamond.get_outer_vert_indices()):]
+    triangles = [set(tri // 2 % 4) for tri in tri_indices.reshape((-1, 3))]
+    diagonal = set.intersection(*(tri for tri in triangles if len(tri) == 3))
+    off_diagonal = min(set(range(4)) - diagonal)
+    on_diagonal = min(diagonal)
+
+    # Moving a vertex not on that diagonal past it leaves the diagonal
+    # outside of the shape, so the triangulation must be found again
+    moved_vertices = list(vertices)
+    moved_vertices[off_diagonal] = -0.5 * vertices[off_diagonal]
+    VMobject.reset_triangulation_cache_stats()
+    diamond.set_points_as_corners([*moved_vertices, moved_vertices[0]])
+    assert_tiles_polygon(diamond)
+    assert cache_stats() == dict(hits=0, misses=1)
+
+    # While moving one on it keeps the diagonal inside
+    moved_vertices = list(vertices)
+    moved_vertices[on_diagonal] = -0.5 * vertices[on_diagonal]
+    diamond = Polygon(*vertices)
+    diamond.get_triangulation()
+    VMobject.reset_triangulation_cache_stats()
+    diamond.set_points_as_corners([*moved_vertices, moved_vertices[0]])
+    assert_tiles_polygon(diamond)
+    assert cache_stats() == dict(hits=1, misses=0)